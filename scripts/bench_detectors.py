@@ -0,0 +1,365 @@
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from utils.capture_replay import open_replay_stream
+from utils.frames import FrameBundle
+from utils.button_detect import detect_button
+from utils.roi import crop_relative
+from utils.template_bank import preload_templates
+from config.roi_config import BUTTON_ROI_CFG, CARD_COUNT_CFG
+from config.wizmatic_config import TEMPLATE_BUNDLE_DIR
+from config.initiative_config import INITIATIVE_CFG
+from config.participants_config import PARTICIPANTS_CFG
+from state.initiative import extract_initiative
+from state.card_count import extract_player_hand_state
+from state import participants as part
+from ocr_tess import engine as tess
+from ocr_easy.batching import BATCH_STATS
+
+ASPECT_BUCKETS = ("4:3", "16:9", "43:18")
+DETECTORS = (
+    "detect_button",
+    "extract_initiative",
+    "extract_participants",
+    "_pip_counts",
+    "_ocr_health",
+    "_batch_easyocr_names",
+    "extract_player_hand_state",
+)
+
+# A bench case is one timed call: (label, fn). A detector expands to one or more
+# cases per frame (e.g. one per button or per participant slot).
+BenchCase = Tuple[str, Callable[[], object]]
+
+
+def _load_corpus(
+    sources: List[str],
+    *,
+    width: int,
+    height: int,
+    max_frames: int,
+    stride: int,
+) -> Dict[str, List[np.ndarray]]:
+    corpus: Dict[str, List[np.ndarray]] = {bucket: [] for bucket in ASPECT_BUCKETS}
+    for source in sources:
+        for i, (_, frame) in enumerate(open_replay_stream(Path(source))):
+            if i % stride:
+                continue
+            norm = FrameBundle(np.ascontiguousarray(frame)).normalized(width, height, allow_upscale=True)
+            h, w = norm.shape[:2]
+            if h == 0 or w == 0:
+                continue
+            bucket = part._aspect_bucket(w / h)
+            if max_frames <= 0 or len(corpus[bucket]) < max_frames:
+                corpus[bucket].append(norm)
+    return corpus
+
+
+def _button_rois(bucket: str) -> Dict[str, Tuple[float, float, float, float]]:
+    profile = BUTTON_ROI_CFG.profiles.get(bucket) or BUTTON_ROI_CFG.profiles.get("16:9")
+    if profile is None:
+        return {}
+    rois = {
+        "pass": profile.pass_rel_roi,
+        "flee": profile.flee_rel_roi,
+        "crownsShop": profile.crowns_shop_rel_roi,
+        "upgradeNow": profile.upgrade_now_rel_roi,
+        "friends": profile.friends_rel_roi,
+        "social": profile.social_rel_roi,
+        "spellBook": profile.spell_book_rel_roi,
+    }
+    if profile.concede_rel_roi is not None:
+        rois["concede"] = profile.concede_rel_roi
+    return rois
+
+
+def _slot_boxes(bucket: str) -> List[Tuple[str, int, Tuple[float, float, float, float]]]:
+    profile = PARTICIPANTS_CFG.profiles.get(bucket)
+    if profile is None:
+        return []
+    boxes = []
+    for i in range(profile.slots):
+        boxes.append(("enemy", i, part._shift_roi(profile.enemy_first_box, profile.enemy_spacing_x * i)))
+        dx = profile.ally_spacing_x * i
+        boxes.append(("ally", i, part._shift_roi(profile.ally_first_box, -dx if profile.ally_anchor == "right" else dx)))
+    return boxes
+
+
+def _slot_crop(frame: np.ndarray, box, kind: str, side: str) -> np.ndarray:
+    rel = getattr(PARTICIPANTS_CFG.layout, f"{kind}_roi_{side}")
+    return crop_relative(frame, part._sub_roi(box, rel))
+
+
+def _cases_for(detector: str, frame: np.ndarray, bucket: str) -> List[BenchCase]:
+    cfg = PARTICIPANTS_CFG
+    if detector == "detect_button":
+        base_dir = Path(BUTTON_ROI_CFG.templates_base_dir)
+        return [
+            (
+                f"detect_button.{name}",
+                lambda name=name, roi=roi: detect_button(
+                    frame, name, templates_base_dir=base_dir, rel_roi=roi, threshold=BUTTON_ROI_CFG.threshold
+                ),
+            )
+            for name, roi in _button_rois(bucket).items()
+        ]
+    if detector == "extract_initiative":
+        return [(detector, lambda: extract_initiative(frame, INITIATIVE_CFG, timestamp=0.0))]
+    if detector == "extract_participants":
+        return [(detector, lambda: part.extract_participants(frame, cfg, timestamp=0.0, debug_print_health_ocr=False))]
+    if detector == "_pip_counts":
+        return [
+            (
+                detector,
+                lambda crop=_slot_crop(frame, box, "pips", side), side=side, i=i: part._pip_counts(
+                    crop, cfg.pip, bucket, side=side, slot_name=part._pip_slot_name(side, i)
+                ),
+            )
+            for side, i, box in _slot_boxes(bucket)
+        ]
+    if detector == "_ocr_health":
+        return [
+            (detector, lambda crop=_slot_crop(frame, box, "health", side): part._ocr_health(crop, cfg.ocr))
+            for side, _, box in _slot_boxes(bucket)
+        ]
+    if detector == "_batch_easyocr_names":
+        def _run_batch() -> object:
+            items = [
+                part._NameWorkItem(
+                    key=(side, i),
+                    crop=_slot_crop(frame, box, "name", side),
+                    tag=f"{side}_{i}_name",
+                    dump_id=None,
+                    start_time=time.perf_counter(),
+                )
+                for side, i, box in _slot_boxes(bucket)
+            ]
+            return part._batch_easyocr_names(items, cfg.ocr, debug_dump=False, debug_dump_limit=0)
+        return [(detector, _run_batch)]
+    if detector == "extract_player_hand_state":
+        return [(detector, lambda: extract_player_hand_state(frame, CARD_COUNT_CFG, aspect_key=bucket, timestamp=0.0))]
+    raise ValueError(f"Unknown detector: {detector}")
+
+
+def _detector_available(detector: str) -> Optional[str]:
+    """Returns a reason string when the detector cannot run in this environment."""
+    if detector == "_batch_easyocr_names":
+        if importlib.util.find_spec("easyocr") is None:
+            return "easyocr not installed"
+    if detector == "_ocr_health" and PARTICIPANTS_CFG.ocr.backend != "easyocr" and not tess.available():
+        return "tesseract unavailable"
+    return None
+
+
+def _stats(samples_ms: List[float], errors: int) -> Dict[str, float]:
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    if arr.size == 0:
+        return {"count": 0, "errors": errors}
+    p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+    total_s = float(arr.sum()) / 1000.0
+    return {
+        "count": int(arr.size),
+        "errors": errors,
+        "mean_ms": float(arr.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(arr.max()),
+        "calls_per_s": (arr.size / total_s) if total_s > 0 else float("inf"),
+    }
+
+
+def run_bench(
+    corpus: Dict[str, List[np.ndarray]],
+    detectors: List[str],
+    *,
+    repeat: int,
+    warmup: int,
+    ocr_cache: bool = False,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for bucket, frames in corpus.items():
+        if not frames:
+            continue
+        bucket_results: Dict[str, Dict[str, float]] = {}
+        for detector in detectors:
+            samples: Dict[str, List[float]] = {}
+            errors: Dict[str, int] = {}
+            # Warm-up calls pay one-off costs (template loads, OCR engine init) off the clock.
+            for frame in frames[: max(0, warmup)]:
+                for _, fn in _cases_for(detector, frame, bucket):
+                    try:
+                        fn()
+                    except Exception:
+                        pass
+            for frame in frames:
+                for _ in range(max(1, repeat)):
+                    for label, fn in _cases_for(detector, frame, bucket):
+                        if not ocr_cache:
+                            # Time the OCR itself, not a lookup of the previous repeat's result.
+                            part.clear_ocr_result_cache()
+                            part.clear_wordlist_corrections()
+                        t0 = time.perf_counter()
+                        try:
+                            fn()
+                        except Exception:
+                            errors[label] = errors.get(label, 0) + 1
+                            continue
+                        samples.setdefault(label, []).append((time.perf_counter() - t0) * 1000.0)
+            for label in sorted(set(samples) | set(errors)):
+                bucket_results[label] = _stats(samples.get(label, []), errors.get(label, 0))
+        results[bucket] = bucket_results
+    return results
+
+
+def _print_results(results: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    for bucket, rows in results.items():
+        print(f"[bench] aspect {bucket}")
+        width = max((len(label) for label in rows), default=8)
+        for label, s in rows.items():
+            if not s.get("count"):
+                print(f"  {label:<{width}}  no samples ({s.get('errors', 0)} errors)")
+                continue
+            err = f"  errors={s['errors']}" if s.get("errors") else ""
+            print(
+                f"  {label:<{width}}  n={s['count']:<5d} mean={s['mean_ms']:8.2f}ms p50={s['p50_ms']:8.2f}ms "
+                f"p95={s['p95_ms']:8.2f}ms p99={s['p99_ms']:8.2f}ms {s['calls_per_s']:9.1f}/s{err}"
+            )
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    *,
+    tolerance: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """Regression = p50 or p95 slower than baseline by more than tolerance (and min_delta_ms)."""
+    regressions = []
+    for bucket, rows in results.items():
+        base_rows = baseline.get(bucket, {})
+        for label, s in rows.items():
+            base = base_rows.get(label)
+            if not base or not base.get("count") or not s.get("count"):
+                continue
+            for key in ("p50_ms", "p95_ms"):
+                cur, ref = s[key], base[key]
+                if cur > ref * (1.0 + tolerance) and (cur - ref) >= min_delta_ms:
+                    regressions.append(
+                        f"{bucket} {label} {key[:-3]}: {ref:.2f}ms -> {cur:.2f}ms (+{(cur / ref - 1.0) * 100.0 if ref > 0 else float('inf'):.0f}%)"
+                    )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark wizmatic detectors over recorded sessions.")
+    parser.add_argument("sources", nargs="+", help="Session archives, image directories or videos to replay.")
+    parser.add_argument("--width", type=int, default=1280, help="Normalize width (matches the live pipeline).")
+    parser.add_argument("--height", type=int, default=720, help="Normalize height (matches the live pipeline).")
+    parser.add_argument("--max-frames", type=int, default=50, help="Frames kept per aspect bucket (0 = all).")
+    parser.add_argument("--stride", type=int, default=1, help="Keep every Nth frame of each source.")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per frame.")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed frames per detector before measuring.")
+    parser.add_argument(
+        "--detectors",
+        type=str,
+        default=",".join(DETECTORS),
+        help=f"Comma-separated subset of: {', '.join(DETECTORS)}",
+    )
+    parser.add_argument(
+        "--ocr-cache",
+        action="store_true",
+        help="Keep the OCR result cache across calls (default clears it before every timed call).",
+    )
+    parser.add_argument("--json", type=str, default=None, help="Write results to this JSON file.")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a saved baseline JSON.")
+    parser.add_argument("--save-baseline", type=str, default=None, help="Save these results as a baseline JSON.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative slowdown vs baseline.")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="Ignore slowdowns smaller than this.")
+    args = parser.parse_args()
+
+    detectors = [d.strip() for d in args.detectors.split(",") if d.strip()]
+    unknown = [d for d in detectors if d not in DETECTORS]
+    if unknown:
+        parser.error(f"unknown detectors: {', '.join(unknown)}")
+    runnable = []
+    for detector in detectors:
+        reason = _detector_available(detector)
+        if reason:
+            print(f"[bench] skipping {detector}: {reason}")
+        else:
+            runnable.append(detector)
+
+    corpus = _load_corpus(
+        args.sources,
+        width=args.width,
+        height=args.height,
+        max_frames=args.max_frames,
+        stride=max(1, args.stride),
+    )
+    counts = ", ".join(f"{bucket}={len(frames)}" for bucket, frames in corpus.items())
+    print(f"[bench] corpus frames: {counts}")
+    if not any(corpus.values()):
+        print("[bench] no frames loaded")
+        sys.exit(2)
+
+    preload_templates(bundle_dir=TEMPLATE_BUNDLE_DIR)
+    results = run_bench(corpus, runnable, repeat=args.repeat, warmup=args.warmup, ocr_cache=args.ocr_cache)
+    _print_results(results)
+    if args.ocr_cache:
+        for kind, s in part.ocr_result_cache_stats().items():
+            print(f"[bench] ocr cache {kind}: hits={s['hits']} misses={s['misses']} hit_rate={s['hit_rate'] * 100.0:.0f}%")
+        wl = part.wordlist_correction_stats()
+        print(f"[bench] wordlist corrections: hits={wl['hits']} misses={wl['misses']} hit_rate={wl['hit_rate'] * 100.0:.0f}%")
+    if PARTICIPANTS_CFG.ocr.backend == "easyocr":
+        b = BATCH_STATS.stats()
+        print(
+            f"[bench] easyocr batches: calls={b['calls']} images={b['images']} "
+            f"occupancy={b['batch_occupancy']:.1f} pixel_fill={b['pixel_fill'] * 100.0:.0f}%"
+        )
+
+    payload = {
+        "generated_at": time.time(),
+        "sources": [str(s) for s in args.sources],
+        "normalize": [args.width, args.height],
+        "ocr_cache": args.ocr_cache,
+        "easyocr_batches": BATCH_STATS.stats() if PARTICIPANTS_CFG.ocr.backend == "easyocr" else None,
+        "results": results,
+    }
+    for out in (args.json, args.save_baseline):
+        if out:
+            path = Path(out)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            print(f"[bench] wrote {path}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")).get("results", {})
+        regressions = compare_to_baseline(
+            results,
+            baseline,
+            tolerance=args.tolerance,
+            min_delta_ms=args.min_delta_ms,
+        )
+        if regressions:
+            print(f"[bench] {len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"[bench] no regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
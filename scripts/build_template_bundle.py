@@ -0,0 +1,46 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from config.wizmatic_config import TEMPLATE_BUNDLE_DIR
+from utils.template_bank import decode_templates, scan_tree
+from utils.template_bundle import stale_reason, write_bundle
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Pack every template PNG into one memory-mappable bundle.")
+    ap.add_argument("--assets", type=Path, default=SRC / "assets", help="template root to pack")
+    ap.add_argument("--out", type=Path, default=ROOT / (TEMPLATE_BUNDLE_DIR or "cache"), help="bundle directory")
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--force", action="store_true", help="rebuild even if the bundle is current")
+    ap.add_argument("--check", action="store_true", help="only report whether the bundle is current (exit 1 if stale)")
+    args = ap.parse_args()
+
+    layout = scan_tree(args.assets)
+    reason = stale_reason(args.assets, layout, args.out)
+    if args.check:
+        print(f"[templates] bundle {'current' if reason is None else 'stale: ' + reason}")
+        sys.exit(0 if reason is None else 1)
+    if reason is None and not args.force:
+        print(f"[templates] bundle in {args.out} is current")
+        return
+
+    t0 = time.perf_counter()
+    paths = [p for _, pngs, _ in layout for p in pngs]
+    loaded = decode_templates(paths, parallel=args.workers > 1, workers=args.workers)
+    blob = write_bundle(args.assets, layout, loaded, args.out)
+    count = sum(1 for t in loaded.values() if t is not None)
+    print(
+        f"[templates] packed {count} templates ({blob.stat().st_size / 1024:.0f} KiB) "
+        f"into {blob} in {(time.perf_counter() - t0) * 1000.0:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
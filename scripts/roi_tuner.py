@@ -2,7 +2,7 @@ import argparse
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import cv2
 import tkinter as tk
@@ -13,7 +13,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from utils.capture_wiz import Wizard101Capture
+from utils.capture_backend import open_capture
 from utils.capture_thread import FrameSource
 from utils.roi import crop_relative, draw_status_list
 
@@ -40,12 +40,18 @@ class ROITunerApp:
         zoom_percent: int,
         fps: int,
         hz: int,
+        replay: Optional[str] = None,
     ) -> None:
         self.width = max(1, int(width))
         self.height = max(1, int(height))
         self.closed = False
 
-        self.cap = Wizard101Capture(fps=max(1, int(fps)))
+        self.cap = open_capture(
+            "replay" if replay else "live",
+            fps=max(1, int(fps)),
+            replay_path=replay,
+            replay_loop=True,
+        )
         self.frames = FrameSource(self.cap, hz=max(1, int(hz)))
         self.frames.start()
 
@@ -305,6 +311,7 @@ def main() -> None:
     parser.add_argument("--zoom", type=int, default=300, help="Initial ROI preview zoom percent.")
     parser.add_argument("--fps", type=int, default=60, help="Capture FPS for Wizard101Capture.")
     parser.add_argument("--hz", type=int, default=60, help="Background frame poll rate.")
+    parser.add_argument("--replay", type=str, default=None, help="Tune against a recorded session instead of the live window.")
     args = parser.parse_args()
 
     ROITunerApp(
@@ -317,6 +324,7 @@ def main() -> None:
         zoom_percent=args.zoom,
         fps=args.fps,
         hz=args.hz,
+        replay=args.replay,
     )
 
 
@@ -26,7 +26,23 @@ from config.roi_config import (
     PIP_SLOT_START_PX_BY_ASPECT_ALLY,
     PIP_SLOT_START_PX_BY_ASPECT_ENEMY,
 )
-from config.wizmatic_config import OCR_BACKEND, COMBAT_MODE
+from config.wizmatic_config import (
+    OCR_BACKEND,
+    OCR_EASYOCR_RECOGNIZE_ONLY,
+    OCR_RESULT_CACHE,
+    OCR_RESULT_CACHE_SIZE,
+    OCR_HEALTH_MONTAGE,
+    OCR_HEALTH_PARALLEL,
+    OCR_ATTEMPT_WORKERS,
+    OCR_GLYPH_FAST_PATH,
+    OCR_ADAPTIVE_VARIANTS,
+    OCR_ASYNC,
+    OCR_ASYNC_WORKERS,
+    OCR_WORDLIST_CACHE,
+    OCR_WORDLIST_CACHE_SIZE,
+    OCR_WORDLIST_CACHE_PERSIST,
+    COMBAT_MODE,
+)
 from state.participants import (
     ParticipantsConfig,
     PipDetectConfig,
@@ -93,6 +109,21 @@ OCR_CFG = OCRConfig(
     wordlist_prefix_min_ratio=0.6,
     wordlist_prefix_min_chars=4,
     backend=OCR_BACKEND,
+    easyocr_recognize_only_text=OCR_EASYOCR_RECOGNIZE_ONLY,
+    easyocr_recognize_only_names=OCR_EASYOCR_RECOGNIZE_ONLY,
+    easyocr_recognize_only_health=OCR_EASYOCR_RECOGNIZE_ONLY,
+    result_cache=OCR_RESULT_CACHE,
+    result_cache_size=OCR_RESULT_CACHE_SIZE,
+    health_montage=OCR_HEALTH_MONTAGE,
+    health_parallel=OCR_HEALTH_PARALLEL,
+    attempt_workers=OCR_ATTEMPT_WORKERS,
+    glyph_fast_path=OCR_GLYPH_FAST_PATH,
+    adaptive_variants=OCR_ADAPTIVE_VARIANTS,
+    async_jobs=OCR_ASYNC,
+    async_workers=OCR_ASYNC_WORKERS,
+    wordlist_cache=OCR_WORDLIST_CACHE,
+    wordlist_cache_size=OCR_WORDLIST_CACHE_SIZE,
+    wordlist_cache_path="cache/wordlist_corrections.json" if OCR_WORDLIST_CACHE_PERSIST else None,
 )
 
 
@@ -2,6 +2,56 @@
 TARGET_HZ = 15 #FPS
 DT = 1.0 / TARGET_HZ
 OCR_BACKEND = "tesseract"  # "tesseract" or "easyocr"
+OCR_EASYOCR_RECOGNIZE_ONLY = True  # EasyOCR skips text detection on the tight name/health crops (big win on CPU)
+OCR_RESULT_CACHE = True  # reuse OCR reads of pixel-identical health/name/HUD crops
+OCR_RESULT_CACHE_SIZE = 4096
+OCR_HEALTH_MONTAGE = True  # Tesseract reads all slots' health crops in one pass; unreadable slots fall back per slot
+OCR_HEALTH_PARALLEL = True  # Tesseract health variants run concurrently; first complete cur/max wins
+OCR_ATTEMPT_WORKERS = 4
+OCR_GLYPH_FAST_PATH = True  # learned glyph recognizer for health/HUD digits; falls back to OCR when unsure
+OCR_ADAPTIVE_VARIANTS = True  # try the preprocessing variant that usually succeeds first (stats in cache/ocr_variant_stats.json)
+OCR_ASYNC = True  # name/health/HUD OCR on background workers; values update a few frames later instead of stalling analysis
+OCR_ASYNC_WORKERS = 2
+OCR_WORDLIST_CACHE = True  # memoize name corrections by normalized OCR text and wordlist
+OCR_WORDLIST_CACHE_SIZE = 2048
+OCR_WORDLIST_CACHE_PERSIST = True  # keep corrections between sessions in cache/wordlist_corrections.json
+TEMPLATE_PRELOAD = True  # decode every template under src/assets at startup (no first-frame spike)
+TEMPLATE_PRELOAD_WORKERS = 4  # 0/1 loads sequentially
+TEMPLATE_BUNDLE_DIR = "cache"  # packed, memory-mapped template bundle (rebuilt when a PNG changes); None decodes PNGs every start
+
+# Capture Source
+CAPTURE_SOURCE = "live"  # "live" (game window) or "replay" (recorded session)
+REPLAY_PATH = None  # session archive dir, image dir, or video file
+REPLAY_REALTIME = True  # False replays as fast as frames are consumed
+REPLAY_LOOP = False
+
+# Session Recording
+RECORD_SESSION = False
+RECORD_DIR = "recordings"  # each run writes to RECORD_DIR/<timestamp>
+RECORD_EVERY_N = 1  # keep every Nth captured frame
+RECORD_COMPRESSED = False  # True: .npz chunks (smaller), False: raw .npy chunks (mmap-able, fastest)
+RECORD_CHUNK_FRAMES = 120
+RECORD_QUEUE_SIZE = 240  # frames buffered for the writer thread before drops
+
+# Frame Change Gate
+ANALYSIS_SKIP_UNCHANGED = True  # reuse the previous analysis while the frame is static
+FRAME_CHANGE_GRID = (16, 9)  # tiles (cols, rows) over the quarter-res gray frame
+FRAME_CHANGE_THRESHOLD = 1.5  # per-tile mean abs gray difference that counts as a change
+FRAME_CHANGE_PEAK_THRESHOLD = 48.0  # any single pixel differing this much also marks its tile
+ANALYSIS_REGION_CACHE = True  # detectors reuse cached results while their ROI tiles are unchanged
+ANALYSIS_UNCHANGED_REFRESH_S = 1.0  # still re-analyse a static frame this often (keeps timers moving)
+
+# Latency Tracing
+LATENCY_TRACE = False  # rolling capture -> normalize -> analysis -> display latency histograms
+LATENCY_WINDOW = 600  # samples kept per stage
+LATENCY_PRINT_INTERVAL_S = 5.0  # 0 disables the periodic console summary
+
+# Stage Profiling
+PROFILE_STAGES = False  # per-detector timers inside analyze_game_state (press "p" to dump)
+PROFILE_SAMPLE_EVERY = 1  # time every Nth analysed frame
+PROFILE_WINDOW = 512  # samples kept per stage for p50/p95/p99
+PROFILE_PRINT_INTERVAL_S = 0.0  # >0 prints the stage table periodically
+PROFILE_DUMP_PATH = "debug/profile.json"
 
 # Combat Mode
 COMBAT_MODE = "pve"  # "pve" or "pvp"
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from typing import Optional, Any, List, Tuple
 from pathlib import Path
+import bisect
 import threading
 
+import cv2
 import numpy as np
 
+from ocr_easy.batching import BATCH_STATS, bucket_shapes, pad_to
+
 _READER = None
 _READER_LOCK = threading.Lock()
 _INIT_ERROR: Optional[Exception] = None
+# Background rows between crops stacked for a recognition-only read.
+_STACK_GAP = 8
+
+_Box = List[Tuple[float, float]]
 
 
 def _build_reader(cfg: Any):
@@ -43,10 +51,73 @@ def _get_reader(cfg: Any):
     return _READER
 
 
-def read_text(img: np.ndarray, cfg: Any, *, allowlist: Optional[str] = None) -> Optional[str]:
+def _recognize(reader: Any, imgs: List[np.ndarray], allowlist: Optional[str]) -> List[List[Tuple[_Box, str, float]]]:
+    """
+    Recognition only: the crops are stacked into one grey image and each is handed
+    to the recognizer as a whole-crop box, so the CRAFT text detector never runs.
+    Returns (box in crop coordinates, text, confidence) lists, one per crop.
+    """
+    greys = [cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img for img in imgs]
+    width = max(g.shape[1] for g in greys)
+    height = sum(g.shape[0] for g in greys) + _STACK_GAP * (len(greys) - 1)
+    stack = np.full((height, width), 255, dtype=np.uint8)
+    boxes: List[List[int]] = []
+    starts: List[int] = []
+    y = 0
+    for g in greys:
+        h, w = g.shape[:2]
+        stack[y:y + h, :w] = g
+        boxes.append([0, w, y, y + h])
+        starts.append(y)
+        y += h + _STACK_GAP
+    results = reader.recognize(
+        stack,
+        horizontal_list=boxes,
+        free_list=[],
+        detail=1,
+        allowlist=allowlist,
+        batch_size=len(boxes),
+        paragraph=False,
+    )
+    BATCH_STATS.record(len(greys), sum(g.shape[0] * g.shape[1] for g in greys), stack.size)
+    per_crop: List[List[Tuple[_Box, str, float]]] = [[] for _ in greys]
+    for item in results:
+        if not item or len(item) < 3:
+            continue
+        bbox, text, conf = item[0], item[1], item[2]
+        top = min(pt[1] for pt in bbox)
+        i = max(0, bisect.bisect_right(starts, top) - 1)
+        y0 = starts[i]
+        try:
+            conf_val = float(conf)
+        except Exception:
+            conf_val = 0.0
+        per_crop[i].append(([(pt[0], pt[1] - y0) for pt in bbox], str(text), conf_val))
+    return per_crop
+
+
+def _join_recognized(results: List[Tuple[_Box, str, float]]) -> Optional[str]:
+    ordered = sorted(results, key=lambda item: min((pt[0] for pt in item[0]), default=0.0))
+    text = " ".join(t.strip() for _, t, _ in ordered if t and t.strip())
+    return text or None
+
+
+def _can_recognize(reader: Any, imgs: List[np.ndarray]) -> bool:
+    return hasattr(reader, "recognize") and all(img.dtype == np.uint8 for img in imgs)
+
+
+def read_text(
+    img: np.ndarray,
+    cfg: Any,
+    *,
+    allowlist: Optional[str] = None,
+    recognize_only: bool = False,
+) -> Optional[str]:
     reader = _get_reader(cfg)
     if allowlist == "":
         allowlist = None
+    if recognize_only and img.size > 0 and _can_recognize(reader, [img]):
+        return _join_recognized(_recognize(reader, [img], allowlist)[0])
     results = reader.readtext(img, detail=0, allowlist=allowlist)
     if not results:
         return None
@@ -54,36 +125,59 @@ def read_text(img: np.ndarray, cfg: Any, *, allowlist: Optional[str] = None) ->
     return text or None
 
 
+def _join_batched(item: Any) -> Optional[str]:
+    if not item:
+        return None
+    if isinstance(item, str):
+        text = item.strip()
+    else:
+        text = " ".join(str(r).strip() for r in item if r and str(r).strip())
+    return text or None
+
+
 def read_text_batch(
     imgs: List[np.ndarray],
     cfg: Any,
     *,
     allowlist: Optional[str] = None,
+    recognize_only: bool = False,
 ) -> List[Optional[str]]:
+    """
+    Read every image, batching by shape: crops are grouped into buckets with bounded
+    padding (see ocr_easy.batching.bucket_shapes), padded up to their bucket's canvas
+    and read with one readtext_batched call per bucket. Singleton buckets are read unpadded.
+    With recognize_only, every crop goes through one recognition-only call instead.
+    """
     reader = _get_reader(cfg)
     if allowlist == "":
         allowlist = None
+    texts: List[Optional[str]] = [None] * len(imgs)
     if not imgs:
-        return []
-    if hasattr(reader, "readtext_batched"):
-        shapes = [img.shape for img in imgs if isinstance(img, np.ndarray) and img.size > 0]
-        if len(shapes) == len(imgs) and len(set(shapes)) == 1:
-            results = reader.readtext_batched(imgs, detail=0, allowlist=allowlist)
-        else:
-            results = None
-    texts: List[Optional[str]] = []
-    if results is not None:
-        for item in results:
-            if not item:
-                texts.append(None)
-                continue
-            if isinstance(item, str):
-                text = item.strip()
-            else:
-                text = " ".join(str(r).strip() for r in item if r and str(r).strip())
-            texts.append(text or None)
         return texts
-    return [read_text(img, cfg, allowlist=allowlist) for img in imgs]
+    valid = [i for i, img in enumerate(imgs) if isinstance(img, np.ndarray) and img.size > 0]
+    if recognize_only and valid and _can_recognize(reader, [imgs[i] for i in valid]):
+        for i, results in zip(valid, _recognize(reader, [imgs[i] for i in valid], allowlist)):
+            texts[i] = _join_recognized(results)
+        return texts
+    batched = hasattr(reader, "readtext_batched")
+    buckets = bucket_shapes(
+        imgs,
+        quantum=cfg.easyocr_batch_quantum,
+        max_pad=cfg.easyocr_batch_max_pad,
+    )
+    for bucket_h, bucket_w, indices in buckets:
+        real_px = sum(imgs[i].shape[0] * imgs[i].shape[1] for i in indices)
+        if len(indices) == 1 or not batched:
+            for i in indices:
+                texts[i] = read_text(imgs[i], cfg, allowlist=allowlist)
+                BATCH_STATS.record(1, imgs[i].shape[0] * imgs[i].shape[1], imgs[i].shape[0] * imgs[i].shape[1])
+            continue
+        padded = [pad_to(imgs[i], bucket_h, bucket_w) for i in indices]
+        results = reader.readtext_batched(padded, detail=0, allowlist=allowlist)
+        BATCH_STATS.record(len(indices), real_px, len(indices) * bucket_h * bucket_w)
+        for i, item in zip(indices, results):
+            texts[i] = _join_batched(item)
+    return texts
 
 
 def warmup(cfg: Any) -> None:
@@ -95,10 +189,13 @@ def read_text_with_boxes(
     cfg: Any,
     *,
     allowlist: Optional[str] = None,
+    recognize_only: bool = False,
 ) -> List[Tuple[List[Tuple[float, float]], str, float]]:
     reader = _get_reader(cfg)
     if allowlist == "":
         allowlist = None
+    if recognize_only and img.size > 0 and _can_recognize(reader, [img]):
+        return [item for item in _recognize(reader, [img], allowlist)[0] if item[1]]
     results = reader.readtext(img, detail=1, allowlist=allowlist)
     cleaned: List[Tuple[List[Tuple[float, float]], str, float]] = []
     for item in results:
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+import threading
+
+import cv2
+import numpy as np
+
+
+def _round_up(value: int, quantum: int) -> int:
+    return -(-int(value) // quantum) * quantum
+
+
+def bucket_shapes(
+    imgs: List[np.ndarray],
+    *,
+    quantum: int = 8,
+    max_pad: float = 1.25,
+) -> List[Tuple[int, int, List[int]]]:
+    """
+    Group images into (canvas_h, canvas_w, indices) buckets for batched reads.
+    Canvas sides are multiples of quantum. Largest crops go first; a crop joins the
+    first bucket with the same channel count whose (possibly grown) canvas stays
+    within max_pad^2 of the area of every crop in it, so padding is bounded per crop
+    rather than set by the largest crop of the whole call. Empty images are left out.
+    """
+    quantum = max(1, int(quantum))
+    limit = max(1.0, float(max_pad)) ** 2
+    order = sorted(
+        (i for i, img in enumerate(imgs) if isinstance(img, np.ndarray) and img.size > 0),
+        key=lambda i: imgs[i].shape[0] * imgs[i].shape[1],
+        reverse=True,
+    )
+    # [canvas_h, canvas_w, channels, smallest member area, indices]
+    buckets: List[list] = []
+    for i in order:
+        img = imgs[i]
+        h, w = img.shape[:2]
+        channels = img.shape[2] if img.ndim == 3 else 1
+        need_h, need_w = _round_up(h, quantum), _round_up(w, quantum)
+        for bucket in buckets:
+            if bucket[2] != channels:
+                continue
+            canvas_h, canvas_w = max(bucket[0], need_h), max(bucket[1], need_w)
+            smallest = min(bucket[3], h * w)
+            if canvas_h * canvas_w <= limit * smallest:
+                bucket[0], bucket[1], bucket[3] = canvas_h, canvas_w, smallest
+                bucket[4].append(i)
+                break
+        else:
+            buckets.append([need_h, need_w, channels, h * w, [i]])
+    return [(b[0], b[1], sorted(b[4])) for b in buckets]
+
+
+def pad_to(img: np.ndarray, h: int, w: int, value: int = 255) -> np.ndarray:
+    """Centre img on an h x w canvas filled with value (white background for OCR preps)."""
+    pad_h = max(0, h - img.shape[0])
+    pad_w = max(0, w - img.shape[1])
+    if pad_h == 0 and pad_w == 0:
+        return img
+    top = pad_h // 2
+    left = pad_w // 2
+    fill = value if img.ndim == 2 else tuple([value] * img.shape[2])
+    return cv2.copyMakeBorder(img, top, pad_h - top, left, pad_w - left, cv2.BORDER_CONSTANT, value=fill)
+
+
+class BatchStats:
+    """Counters for batched OCR calls: how full the batches are and how much of them is padding."""
+
+    def __init__(self):
+        self.calls = 0
+        self.batched_calls = 0
+        self.images = 0
+        self.batched_images = 0
+        self.real_px = 0
+        self.padded_px = 0
+        self._lock = threading.Lock()
+
+    def record(self, images: int, real_px: int, padded_px: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.images += images
+            if images > 1:
+                self.batched_calls += 1
+                self.batched_images += images
+            self.real_px += real_px
+            self.padded_px += padded_px
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "images": self.images,
+                "images_per_call": (self.images / self.calls) if self.calls else 0.0,
+                "batched_calls": self.batched_calls,
+                "batch_occupancy": (self.batched_images / self.batched_calls) if self.batched_calls else 0.0,
+                "pixel_fill": (self.real_px / self.padded_px) if self.padded_px else 1.0,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.batched_calls = 0
+            self.images = 0
+            self.batched_images = 0
+            self.real_px = 0
+            self.padded_px = 0
+
+
+BATCH_STATS = BatchStats()
@@ -0,0 +1 @@
+"""Connected-component glyph recognizer for fixed-font numeric fields."""
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import threading
+
+import cv2
+import numpy as np
+
+# Every glyph bitmap is resized to this before comparison.
+GLYPH_W = 10
+GLYPH_H = 14
+# Geometry features (height and vertical centre relative to the text line, aspect)
+# are weighted so a comma never matches a digit just because the bitmaps align.
+_GEOMETRY_WEIGHT = 3.0
+_FEATURE_DIM = GLYPH_W * GLYPH_H + 3
+_MODEL_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Glyph:
+    x: int
+    y: int
+    w: int
+    h: int
+    bitmap: np.ndarray  # uint8 crop of the text mask, text = 255
+
+
+def segment_glyphs(mask: np.ndarray, *, min_area_frac: float = 0.015) -> List[Glyph]:
+    """
+    Split a binary text mask (text = 255) into glyphs, left to right.
+    Components that overlap horizontally (a glyph broken into stacked pieces)
+    are merged; specks smaller than min_area_frac * line_height^2 are dropped.
+    """
+    if mask is None or mask.size == 0:
+        return []
+    num, labels, stats, _ = cv2.connectedComponentsWithStats((mask > 0).astype(np.uint8), connectivity=8)
+    if num <= 1:
+        return []
+    boxes = [tuple(int(v) for v in stats[i, :5]) for i in range(1, num)]
+    line_h = max(b[3] for b in boxes)
+    min_area = max(2, int(line_h * line_h * min_area_frac))
+    boxes = sorted((b for b in boxes if b[4] >= min_area), key=lambda b: b[0])
+    merged: List[List[int]] = []
+    for x, y, w, h, _ in boxes:
+        if merged:
+            mx, my, mw, mh = merged[-1]
+            overlap = min(mx + mw, x + w) - max(mx, x)
+            if overlap > 0.5 * min(mw, w):
+                nx1, ny1 = min(mx, x), min(my, y)
+                nx2, ny2 = max(mx + mw, x + w), max(my + mh, y + h)
+                merged[-1] = [nx1, ny1, nx2 - nx1, ny2 - ny1]
+                continue
+        merged.append([x, y, w, h])
+    binary = np.where(mask > 0, 255, 0).astype(np.uint8)
+    narrow = [w for _, _, w, h in merged if w < 0.9 * line_h]
+    typical_w = float(np.median(narrow)) if narrow else 0.6 * line_h
+    glyphs: List[Glyph] = []
+    for x, y, w, h in merged:
+        for sx, sw in _split_touching(binary[y:y + h, x:x + w], typical_w):
+            glyphs.append(_tight_glyph(binary, x + sx, y, sw, h))
+    return glyphs
+
+
+def _split_touching(bitmap: np.ndarray, typical_w: float) -> List[Tuple[int, int]]:
+    """Column ranges of glyphs fused into one component, cut at ink-projection minima."""
+    w = bitmap.shape[1]
+    parts = int(round(w / typical_w)) if typical_w > 0 else 1
+    if parts <= 1 or w < 1.5 * typical_w:
+        return [(0, w)]
+    ink = (bitmap > 0).sum(axis=0)
+    step = w / parts
+    radius = max(1, int(step * 0.3))
+    cuts = [0]
+    for k in range(1, parts):
+        center = int(round(k * step))
+        lo = max(cuts[-1] + 1, center - radius)
+        hi = min(w - 1, center + radius)
+        if lo >= hi:
+            continue
+        cuts.append(lo + int(np.argmin(ink[lo:hi + 1])))
+    cuts.append(w)
+    return [(a, b - a) for a, b in zip(cuts, cuts[1:]) if b > a]
+
+
+def _tight_glyph(binary: np.ndarray, x: int, y: int, w: int, h: int) -> Glyph:
+    # Re-fit the box vertically after a split so each piece's geometry is its own.
+    crop = binary[y:y + h, x:x + w]
+    rows = np.flatnonzero(crop.any(axis=1))
+    if rows.size:
+        y, h = y + int(rows[0]), int(rows[-1] - rows[0] + 1)
+    return Glyph(x, y, w, h, binary[y:y + h, x:x + w])
+
+
+def glyph_features(glyphs: List[Glyph]) -> np.ndarray:
+    """(N, D) float32 feature rows: normalized bitmap plus weighted line geometry."""
+    if not glyphs:
+        return np.zeros((0, _FEATURE_DIM), dtype=np.float32)
+    top = min(g.y for g in glyphs)
+    bottom = max(g.y + g.h for g in glyphs)
+    line_h = float(max(1, bottom - top))
+    rows = np.empty((len(glyphs), _FEATURE_DIM), dtype=np.float32)
+    for i, g in enumerate(glyphs):
+        norm = cv2.resize(g.bitmap, (GLYPH_W, GLYPH_H), interpolation=cv2.INTER_AREA)
+        rows[i, : GLYPH_W * GLYPH_H] = norm.reshape(-1).astype(np.float32) / 255.0
+        rows[i, -3] = _GEOMETRY_WEIGHT * (g.h / line_h)
+        rows[i, -2] = _GEOMETRY_WEIGHT * ((g.y + g.h * 0.5 - top) / line_h)
+        rows[i, -1] = _GEOMETRY_WEIGHT * min(2.0, g.w / float(max(1, g.h)))
+    return rows
+
+
+class GlyphModel:
+    """Nearest-neighbour exemplars for one field; at most max_per_label per character."""
+
+    def __init__(self, max_per_label: int = 32):
+        self.max_per_label = max(1, int(max_per_label))
+        self.labels: List[str] = []
+        self.vectors = np.zeros((0, _FEATURE_DIM), dtype=np.float32)
+        self._next_slot: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def add(self, label: str, vector: np.ndarray) -> None:
+        slots = [i for i, lab in enumerate(self.labels) if lab == label]
+        if len(slots) < self.max_per_label:
+            self.labels.append(label)
+            self.vectors = np.vstack([self.vectors, vector[None, :]])
+            return
+        # Full: overwrite the oldest exemplar of this label (round robin).
+        k = self._next_slot.get(label, 0)
+        self.vectors[slots[k % len(slots)]] = vector
+        self._next_slot[label] = k + 1
+
+    def classify(self, rows: np.ndarray) -> List[Tuple[Optional[str], float, float]]:
+        """Per row: (label, RMS distance to it, distance to the nearest other label / that distance)."""
+        if not self.labels or rows.shape[0] == 0:
+            return [(None, float("inf"), 0.0)] * rows.shape[0]
+        d2 = (
+            (rows * rows).sum(axis=1)[:, None]
+            + (self.vectors * self.vectors).sum(axis=1)[None, :]
+            - 2.0 * rows @ self.vectors.T
+        )
+        dist = np.sqrt(np.maximum(d2, 0.0) / _FEATURE_DIM)
+        labels = np.asarray(self.labels)
+        out: List[Tuple[Optional[str], float, float]] = []
+        for row in dist:
+            best = int(np.argmin(row))
+            label = str(labels[best])
+            others = row[labels != label]
+            runner_up = float(others.min()) if others.size else float("inf")
+            d = float(row[best])
+            out.append((label, d, runner_up / d if d > 0 else float("inf")))
+        return out
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            version=np.int32(_MODEL_VERSION),
+            labels=np.asarray(self.labels, dtype="<U1"),
+            vectors=self.vectors,
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, max_per_label: int = 32) -> "GlyphModel":
+        model = cls(max_per_label)
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != _MODEL_VERSION or data["vectors"].shape[1:] != (_FEATURE_DIM,):
+                    return model
+                model.labels = [str(v) for v in data["labels"]]
+                model.vectors = np.ascontiguousarray(data["vectors"], dtype=np.float32)
+        except (OSError, KeyError, ValueError):
+            pass
+        return model
+
+
+class GlyphRecognizer:
+    """
+    Reads short numeric strings (digits, '/', ',') from a binary text mask by
+    classifying connected components against per-field exemplars.
+    Exemplars are learned from reads that two independent reads of the same crop
+    agreed on (learn(); callers check the agreement), and persisted as
+    <store_dir>/<key>.npz.
+    read() returns None whenever any glyph is unknown or ambiguous, so callers
+    fall back to full OCR.
+    """
+
+    def __init__(
+        self,
+        store_dir: Optional[Path] = Path("cache/glyphs"),
+        *,
+        alphabet: str = "0123456789/,",
+        max_distance: float = 0.2,
+        min_ratio: float = 1.3,
+        max_per_label: int = 32,
+        autosave_every: int = 16,
+    ):
+        self.store_dir = Path(store_dir) if store_dir else None
+        self.alphabet = alphabet
+        self.max_distance = max_distance
+        self.min_ratio = min_ratio
+        self.max_per_label = max_per_label
+        self.autosave_every = max(1, int(autosave_every))
+        self.hits = 0
+        self.misses = 0
+        self._models: Dict[str, GlyphModel] = {}
+        self._dirty: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        *,
+        store_dir: Optional[str] = None,
+        max_distance: Optional[float] = None,
+    ) -> None:
+        if store_dir is not None and Path(store_dir) != self.store_dir:
+            with self._lock:
+                self.store_dir = Path(store_dir)
+                self._models.clear()
+                self._dirty.clear()
+        if max_distance is not None:
+            self.max_distance = float(max_distance)
+
+    def _path(self, key: str) -> Optional[Path]:
+        return self.store_dir / f"{key}.npz" if self.store_dir is not None else None
+
+    def _model(self, key: str) -> GlyphModel:
+        model = self._models.get(key)
+        if model is None:
+            path = self._path(key)
+            if path is not None and path.is_file():
+                model = GlyphModel.load(path, self.max_per_label)
+            else:
+                model = GlyphModel(self.max_per_label)
+            self._models[key] = model
+        return model
+
+    def read(self, key: str, mask: np.ndarray) -> Optional[str]:
+        glyphs = segment_glyphs(mask)
+        if not glyphs:
+            return None
+        rows = glyph_features(glyphs)
+        with self._lock:
+            results = self._model(key).classify(rows)
+        chars = []
+        for label, dist, ratio in results:
+            if label is None or dist > self.max_distance or ratio < self.min_ratio:
+                with self._lock:
+                    self.misses += 1
+                return None
+            chars.append(label)
+        with self._lock:
+            self.hits += 1
+        return "".join(chars)
+
+    def learn(self, key: str, mask: np.ndarray, text: str) -> bool:
+        """Add one exemplar per glyph when the mask segments into exactly len(text) glyphs."""
+        expected = "".join(ch for ch in text if not ch.isspace())
+        if not expected or any(ch not in self.alphabet for ch in expected):
+            return False
+        glyphs = segment_glyphs(mask)
+        if len(glyphs) != len(expected):
+            return False
+        rows = glyph_features(glyphs)
+        with self._lock:
+            model = self._model(key)
+            for ch, row in zip(expected, rows):
+                model.add(ch, row)
+            self._dirty[key] = self._dirty.get(key, 0) + 1
+            if self._dirty[key] >= self.autosave_every:
+                self._save_locked(key)
+        return True
+
+    def _save_locked(self, key: str) -> None:
+        path = self._path(key)
+        self._dirty.pop(key, None)
+        if path is None:
+            return
+        try:
+            self._models[key].save(path)
+        except OSError as exc:
+            print(f"[ocr] glyph model save failed ({key}): {exc}")
+
+    def save_all(self) -> None:
+        with self._lock:
+            for key in list(self._dirty):
+                self._save_locked(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "models": len(self._models),
+                "exemplars": sum(len(m) for m in self._models.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+RECOGNIZER = GlyphRecognizer()
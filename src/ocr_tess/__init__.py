@@ -0,0 +1 @@
+"""Persistent Tesseract engine package."""
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import threading
+
+import cv2
+import numpy as np
+
+try:
+    import tesserocr
+except Exception:  # pragma: no cover - optional in-process binding
+    tesserocr = None
+
+try:
+    import pytesseract
+except Exception:  # pragma: no cover - allow import failure in minimal envs
+    pytesseract = None
+
+# One initialised TessBaseAPI per (thread, tessdata, lang, oem, user words):
+# the API is not thread-safe, but re-initialising it costs as much as the
+# process spawn it replaces, so each worker thread keeps its own.
+_LOCAL = threading.local()
+_APIS_LOCK = threading.Lock()
+_ALL_APIS: list = []
+_GENERATION = 0  # bumped by shutdown() so every thread drops its ended APIs
+_INIT_FAILED: Dict[Tuple, Exception] = {}
+_ANNOUNCED = False
+
+
+def engine_name() -> Optional[str]:
+    if tesserocr is not None:
+        return "tesserocr"
+    if pytesseract is not None:
+        return "pytesseract"
+    return None
+
+
+def available() -> bool:
+    return engine_name() is not None
+
+
+def _tessdata_dir(tesseract_cmd: Optional[str]) -> Optional[str]:
+    if not tesseract_cmd:
+        return None
+    tessdata = Path(tesseract_cmd).parent / "tessdata"
+    if not tessdata.is_dir():
+        return None
+    # Older tesserocr builds want the trailing separator.
+    return str(tessdata.resolve()) + "/"
+
+
+def _user_words_file(user_words: Optional[str]) -> Optional[str]:
+    if not user_words:
+        return None
+    path = Path(user_words)
+    return str(path) if path.is_file() else None
+
+
+def _get_api(lang: str, oem: int, tesseract_cmd: Optional[str], user_words: Optional[str]):
+    key = (_tessdata_dir(tesseract_cmd), lang, int(oem), user_words)
+    apis = getattr(_LOCAL, "apis", None)
+    if apis is None or getattr(_LOCAL, "generation", -1) != _GENERATION:
+        apis = _LOCAL.apis = {}
+        _LOCAL.generation = _GENERATION
+    api = apis.get(key)
+    if api is not None:
+        return api
+    if key in _INIT_FAILED:
+        raise _INIT_FAILED[key]
+    tessdata, _, _, words = key
+    kwargs = {"lang": lang, "oem": tesserocr.OEM(int(oem)), "init": True}
+    if tessdata:
+        kwargs["path"] = tessdata
+    if words:
+        # user_words_file is an init-only parameter.
+        kwargs["variables"] = {"user_words_file": words}
+        kwargs["set_only_non_debug_params"] = False
+    try:
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+    except Exception as exc:
+        _INIT_FAILED[key] = exc
+        print(f"[ocr] tesserocr init failed ({exc}); falling back to pytesseract")
+        raise
+    apis[key] = api
+    with _APIS_LOCK:
+        _ALL_APIS.append(api)
+    return api
+
+
+def _announce() -> None:
+    global _ANNOUNCED
+    if not _ANNOUNCED:
+        _ANNOUNCED = True
+        print(f"[ocr] tesseract engine: {engine_name()}")
+
+
+def _to_gray_u8(img: np.ndarray) -> np.ndarray:
+    if img.ndim == 3:
+        if img.shape[2] == 1:
+            img = img[:, :, 0]
+        else:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    if img.dtype != np.uint8:
+        img = np.clip(img, 0, 255).astype(np.uint8)
+    return np.ascontiguousarray(img)
+
+
+def _tesserocr_prepare(
+    img: np.ndarray,
+    *,
+    lang: str,
+    oem: int,
+    psm: int,
+    whitelist: Optional[str],
+    blacklist: Optional[str],
+    dpi: Optional[int],
+    user_words: Optional[str],
+    tesseract_cmd: Optional[str],
+):
+    api = _get_api(lang, oem, tesseract_cmd, user_words)
+    gray = _to_gray_u8(img)
+    h, w = gray.shape[:2]
+    api.SetPageSegMode(tesserocr.PSM(int(psm)))
+    # Variables persist on the API between calls; reset every one we use.
+    api.SetVariable("tessedit_char_whitelist", whitelist or "")
+    api.SetVariable("tessedit_char_blacklist", blacklist or "")
+    api.SetImageBytes(gray.tobytes(), w, h, 1, w)
+    api.SetSourceResolution(int(dpi) if dpi else 70)
+    return api
+
+
+def _tesserocr_string(img: np.ndarray, **kwargs) -> str:
+    api = _tesserocr_prepare(img, **kwargs)
+    try:
+        return api.GetUTF8Text() or ""
+    finally:
+        api.Clear()
+
+
+def _tesserocr_lines(img: np.ndarray, **kwargs) -> List[Tuple[int, int, str]]:
+    api = _tesserocr_prepare(img, **kwargs)
+    lines: List[Tuple[int, int, str]] = []
+    try:
+        api.Recognize()
+        level = tesserocr.RIL.TEXTLINE
+        for item in tesserocr.iterate_level(api.GetIterator(), level):
+            box = item.BoundingBox(level)
+            text = item.GetUTF8Text(level)
+            if box is None or not text or not text.strip():
+                continue
+            lines.append((int(box[1]), int(box[3]), text.strip()))
+    finally:
+        api.Clear()
+    return lines
+
+
+def _pytesseract_config(
+    *,
+    oem: int,
+    psm: int,
+    whitelist: Optional[str],
+    blacklist: Optional[str],
+    dpi: Optional[int],
+    user_words: Optional[str],
+    tesseract_cmd: Optional[str],
+) -> str:
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    config = f"--oem {oem} --psm {psm}"
+    if dpi:
+        config += f" -c user_defined_dpi={int(dpi)}"
+    if user_words:
+        config += f" --user-words \"{user_words}\""
+    if whitelist:
+        config += f" -c tessedit_char_whitelist={whitelist}"
+    if blacklist:
+        config += f" -c tessedit_char_blacklist={blacklist}"
+    return config
+
+
+def _pytesseract_string(img: np.ndarray, *, lang: str, **kwargs) -> str:
+    return pytesseract.image_to_string(img, lang=lang, config=_pytesseract_config(**kwargs))
+
+
+def _pytesseract_lines(img: np.ndarray, *, lang: str, **kwargs) -> List[Tuple[int, int, str]]:
+    data = pytesseract.image_to_data(
+        img,
+        lang=lang,
+        config=_pytesseract_config(**kwargs),
+        output_type=pytesseract.Output.DICT,
+    )
+    grouped: Dict[Tuple[int, int, int], List[Tuple[int, int, int, str]]] = {}
+    for i, word in enumerate(data.get("text", [])):
+        if not word or not str(word).strip():
+            continue
+        key = (int(data["block_num"][i]), int(data["par_num"][i]), int(data["line_num"][i]))
+        top = int(data["top"][i])
+        grouped.setdefault(key, []).append((int(data["left"][i]), top, top + int(data["height"][i]), str(word).strip()))
+    lines: List[Tuple[int, int, str]] = []
+    for words in grouped.values():
+        words.sort()
+        lines.append((min(w[1] for w in words), max(w[2] for w in words), " ".join(w[3] for w in words)))
+    lines.sort()
+    return lines
+
+
+def image_to_string(
+    img: np.ndarray,
+    *,
+    lang: str = "eng",
+    oem: int = 1,
+    psm: int = 7,
+    whitelist: Optional[str] = None,
+    blacklist: Optional[str] = None,
+    dpi: Optional[int] = None,
+    user_words: Optional[str] = None,
+    tesseract_cmd: Optional[str] = None,
+) -> str:
+    """
+    Tesseract text for a grayscale/BGR uint8 image. Uses a long-lived in-process
+    tesserocr API per thread when available, otherwise one pytesseract process per call.
+    Raises like pytesseract does when no engine is usable.
+    """
+    _announce()
+    words = _user_words_file(user_words)
+    kwargs = dict(
+        lang=lang,
+        oem=oem,
+        psm=psm,
+        whitelist=whitelist,
+        blacklist=blacklist,
+        dpi=dpi,
+        user_words=words,
+        tesseract_cmd=tesseract_cmd,
+    )
+    if tesserocr is not None:
+        try:
+            return _tesserocr_string(img, **kwargs)
+        except Exception:
+            if pytesseract is None:
+                raise
+    if pytesseract is None:
+        raise RuntimeError("no tesseract engine available (install tesserocr or pytesseract)")
+    return _pytesseract_string(img, **kwargs)
+
+
+def image_to_lines(
+    img: np.ndarray,
+    *,
+    lang: str = "eng",
+    oem: int = 1,
+    psm: int = 6,
+    whitelist: Optional[str] = None,
+    blacklist: Optional[str] = None,
+    dpi: Optional[int] = None,
+    tesseract_cmd: Optional[str] = None,
+) -> List[Tuple[int, int, str]]:
+    """
+    Recognised text lines as (top, bottom, text), top to bottom, with the same
+    engine selection as image_to_string (tesserocr line iterator, else pytesseract
+    image_to_data grouped by block/paragraph/line).
+    """
+    _announce()
+    kwargs = dict(
+        lang=lang,
+        oem=oem,
+        psm=psm,
+        whitelist=whitelist,
+        blacklist=blacklist,
+        dpi=dpi,
+        user_words=None,
+        tesseract_cmd=tesseract_cmd,
+    )
+    if tesserocr is not None:
+        try:
+            return sorted(_tesserocr_lines(img, **kwargs))
+        except Exception:
+            if pytesseract is None:
+                raise
+    if pytesseract is None:
+        raise RuntimeError("no tesseract engine available (install tesserocr or pytesseract)")
+    return _pytesseract_lines(img, **kwargs)
+
+
+def shutdown() -> None:
+    """Release every cached API (all threads). Threads re-create theirs on next use."""
+    global _GENERATION
+    with _APIS_LOCK:
+        apis = list(_ALL_APIS)
+        _ALL_APIS.clear()
+        _GENERATION += 1
+        _INIT_FAILED.clear()
+    for api in apis:
+        try:
+            api.End()
+        except Exception:
+            pass
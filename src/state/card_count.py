@@ -8,7 +8,10 @@ import numpy as np
 import threading
 
 from state.game_state import PlayerHandState
+from utils.frames import FramePlanes
+from utils.region_cache import RegionCache, region_cached
 from utils.roi import crop_relative, draw_relative_roi
+from utils.template_bank import TEMPLATE_BANK
 
 
 @dataclass(frozen=True)
@@ -25,7 +28,6 @@ class CardCountConfig:
     center_match_max_dist_px: float = 90.0
 
 
-_TEMPLATE_CACHE: Dict[str, List[Tuple[str, np.ndarray]]] = {}
 _CARD_COUNT_LOG_QUEUE: List[str] = []
 _CARD_COUNT_LOG_LOCK = threading.Lock()
 _KNOWN_ASPECT_TAGS = ("4x3", "16x9", "43x18")
@@ -58,46 +60,28 @@ def _stem_aspect_tag(stem: str) -> Optional[str]:
 
 
 def _load_templates(base_dir: Path, aspect_key: str) -> List[Tuple[str, np.ndarray]]:
-    key = _template_key(base_dir, aspect_key)
-    if key in _TEMPLATE_CACHE:
-        return _TEMPLATE_CACHE[key]
-
-    tag = aspect_key.replace(":", "x").lower()
-    candidates: List[Path] = []
-
-    aspect_dir = base_dir / tag
-    if aspect_dir.exists():
-        candidates.extend(sorted(aspect_dir.glob("*.png")))
-
-    # Flat layout support, strict by aspect:
-    # only include files explicitly tagged for the active aspect.
-    for path in sorted(base_dir.glob("*.png")):
-        stem_tag = _stem_aspect_tag(path.stem)
-        if stem_tag == tag:
-            candidates.append(path)
-
-    candidates.extend(
-        [
-            base_dir / f"card_count_slot_{tag}.png",
-        ]
-    )
-
-    bank: List[Tuple[str, np.ndarray]] = []
-    seen: set[str] = set()
-    for path in candidates:
-        if not path.exists():
-            continue
-        key_path = str(path.resolve()).lower()
-        if key_path in seen:
-            continue
-        seen.add(key_path)
-        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
-        if img is None or img.size == 0:
-            continue
-        bank.append((path.stem, img))
+    def _build() -> List[Tuple[str, np.ndarray]]:
+        tag = aspect_key.replace(":", "x").lower()
+        candidates = TEMPLATE_BANK.files(base_dir / tag)
+
+        # Flat layout support, strict by aspect:
+        # only include files explicitly tagged for the active aspect
+        # (this also covers the canonical card_count_slot_<tag>.png).
+        for templ in TEMPLATE_BANK.files(base_dir):
+            if _stem_aspect_tag(templ.name) == tag:
+                candidates.append(templ)
+
+        bank: List[Tuple[str, np.ndarray]] = []
+        seen: set[str] = set()
+        for templ in candidates:
+            key_path = str(templ.path.resolve()).lower()
+            if key_path in seen:
+                continue
+            seen.add(key_path)
+            bank.append((templ.name, templ.image))
+        return bank
 
-    _TEMPLATE_CACHE[key] = bank
-    return bank
+    return TEMPLATE_BANK.cached(("card_count", _template_key(base_dir, aspect_key)), _build)
 
 
 def _nearest_count_from_center(
@@ -138,6 +122,30 @@ def _nearest_count_from_center(
     return int(best_count)
 
 
+def _best_slot_match(
+    roi_gray: Optional[np.ndarray],
+    templates: List[Tuple[str, np.ndarray]],
+) -> Tuple[float, Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+    best_score = -1.0
+    best_loc: Optional[Tuple[int, int]] = None
+    best_size: Optional[Tuple[int, int]] = None
+    if roi_gray is None or roi_gray.size == 0:
+        return best_score, best_loc, best_size
+    rh, rw = roi_gray.shape[:2]
+    for _name, templ in templates:
+        th, tw = templ.shape[:2]
+        if tw > rw or th > rh:
+            continue
+        res = cv2.matchTemplate(roi_gray, templ, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        score = float(max_val)
+        if score > best_score:
+            best_score = score
+            best_loc = max_loc
+            best_size = (tw, th)
+    return best_score, best_loc, best_size
+
+
 def extract_player_hand_state(
     frame_bgr: np.ndarray,
     cfg: CardCountConfig,
@@ -145,6 +153,8 @@ def extract_player_hand_state(
     aspect_key: str,
     timestamp: Optional[float] = None,
     debug_dump_roi: bool = False,
+    planes: Optional[FramePlanes] = None,
+    region_cache: Optional[RegionCache] = None,
 ) -> PlayerHandState:
     profile = cfg.profiles.get(aspect_key) or cfg.profiles.get("16:9")
     if frame_bgr is None or frame_bgr.size == 0 or profile is None:
@@ -153,26 +163,20 @@ def extract_player_hand_state(
     h, w = frame_bgr.shape[:2]
     roi = profile.slot_rel_roi
     roi_crop = crop_relative(frame_bgr, roi)
-    roi_gray = cv2.cvtColor(roi_crop, cv2.COLOR_BGR2GRAY) if roi_crop.size > 0 else None
-
-    best_score = -1.0
-    best_loc: Optional[Tuple[int, int]] = None
-    best_size: Optional[Tuple[int, int]] = None
+    if roi_crop.size == 0:
+        roi_gray = None
+    elif planes is not None:
+        roi_gray = crop_relative(planes.gray, roi)
+    else:
+        roi_gray = cv2.cvtColor(roi_crop, cv2.COLOR_BGR2GRAY)
 
     templates = _load_templates(Path(cfg.templates_base_dir), aspect_key)
-    if roi_gray is not None and roi_gray.size > 0:
-        rh, rw = roi_gray.shape[:2]
-        for _name, templ in templates:
-            th, tw = templ.shape[:2]
-            if tw > rw or th > rh:
-                continue
-            res = cv2.matchTemplate(roi_gray, templ, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(res)
-            score = float(max_val)
-            if score > best_score:
-                best_score = score
-                best_loc = max_loc
-                best_size = (tw, th)
+    best_score, best_loc, best_size = region_cached(
+        region_cache,
+        ("card_count", aspect_key),
+        roi,
+        lambda: _best_slot_match(roi_gray, templates),
+    )
 
     detected = bool(best_loc is not None and best_size is not None and best_score >= cfg.template_threshold)
     center_px: Optional[Tuple[int, int]] = None
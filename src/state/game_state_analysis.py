@@ -7,6 +7,9 @@ import cv2
 import numpy as np
 
 from utils.button_detect import detect_button
+from utils.frames import FramePlanes
+from utils.profiler import PROFILER, profile_stage
+from utils.region_cache import RegionCache, region_cached
 from utils.roi import crop_relative, draw_status_list
 from config.roi_config import BUTTON_ROI_CFG, PLAYER_HUD_PROFILES, CARD_COUNT_CFG
 from state.game_state import GameState, BattleState
@@ -18,6 +21,7 @@ from state.participants import (
     render_participants_overlay,
     extract_player_wizard_state,
     render_player_wizard_overlay,
+    ocr_jobs_for,
 )
 from config.wizmatic_config import (
     PARTICIPANT_OCCUPANCY_REFRESH_S,
@@ -43,6 +47,12 @@ class AnalysisResult:
     player_wizard_overlay: Optional[np.ndarray] = None
     button_overlay: Optional[np.ndarray] = None
     button_states: Optional[Dict[str, bool]] = None
+    # Provenance of the analysed frame (filled in by the caller that owns the pipeline).
+    frame_seq: int = 0
+    captured_at: Optional[float] = None  # perf_counter at capture
+    submitted_at: Optional[float] = None  # perf_counter when handed to analysis
+    analysis_started_at: Optional[float] = None
+    analysis_done_at: Optional[float] = None
 
 
 def _clear_ocr_dump_dir() -> None:
@@ -68,6 +78,7 @@ STATE_BATTLE = "battle"
 STATE_CARD_SELECT = "card_select"
 STATE_ROUND_ANIMATION = "round_animation"
 BATTLE_STATES = {STATE_BATTLE, STATE_CARD_SELECT, STATE_ROUND_ANIMATION}
+_HUD_JOB_KEYS = [("hud", "health"), ("hud", "mana"), ("hud", "energy")]
 
 _PVP_MODE = str(COMBAT_MODE).strip().lower() == "pvp"
 _RETREAT_STATE_KEY = "concede" if _PVP_MODE else "flee"
@@ -189,10 +200,19 @@ def analyze_game_state(
     debug_print_health_ocr: bool = True,
     debug_dump_ocr_id: Optional[str] = None,
     debug_dump_ocr_limit: int = 0,
+    planes: Optional[FramePlanes] = None,
+    region_cache: Optional[RegionCache] = None,
+    timestamp: Optional[float] = None,
 ) -> AnalysisResult:
+    profiled = PROFILER.begin_frame()
+    analysis_started_at = time.perf_counter()
     was_state = game_state.state
     was_in_card_select = game_state.battle.in_card_select
-    game_state.updated_at = time.time()
+    # Stamp state with the frame's capture time, not the (later) time analysis ran.
+    game_state.updated_at = timestamp if timestamp is not None else time.time()
+    if analysis is not None and (planes is None or planes.bgr is not analysis):
+        # Detectors share one set of derived planes (gray/HSV) per analysed frame.
+        planes = FramePlanes(analysis)
     if analysis is None:
         aspect_key = "16:9"
         button_profile = None
@@ -238,13 +258,20 @@ def analyze_game_state(
         }
         for name, rel_roi in button_rois.items():
             try:
-                hit = detect_button(
-                    analysis,
-                    button_templates.get(name, name),
-                    templates_base_dir=Path(base_dir),
-                    rel_roi=rel_roi,
-                    threshold=threshold,
-                )
+                with profile_stage(f"buttons.{name}"):
+                    hit = region_cached(
+                        region_cache,
+                        ("button", name, aspect_key),
+                        rel_roi,
+                        lambda: detect_button(
+                            analysis,
+                            button_templates.get(name, name),
+                            templates_base_dir=Path(base_dir),
+                            rel_roi=rel_roi,
+                            threshold=threshold,
+                            planes=planes,
+                        ),
+                    )
             except Exception:
                 hit = False
             button_states[name] = hit
@@ -264,6 +291,14 @@ def analyze_game_state(
     game_state.battle.active = in_battle
     game_state.battle.in_card_select = in_card_select
     entered_card_select = in_card_select and (not was_in_card_select)
+    ocr_jobs = ocr_jobs_for(participants_cfg.ocr) if participants_cfg is not None else None
+    if ocr_jobs is not None and ((was_state in BATTLE_STATES) != in_battle):
+        # Reads queued in the previous battle (or for the idle HUD) belong to other slots.
+        ocr_jobs.clear()
+    if ocr_jobs is not None and (entered_card_select or entered_idle):
+        # The HUD is scanned afresh on entry; reads queued before it are stale.
+        ocr_jobs.discard(_HUD_JOB_KEYS)
+    hud_jobs_pending = ocr_jobs is not None and ocr_jobs.has_any(_HUD_JOB_KEYS)
 
     initiative_overlay = None
     participants_overlay = None
@@ -366,12 +401,15 @@ def analyze_game_state(
                 should_check_initiative = (not stable_ok) or within_window
 
             if should_check_initiative:
-                init = extract_initiative(
-                    analysis,
-                    initiative_cfg,
-                    timestamp=game_state.updated_at,
-                    debug_dump_rois=debug_dump_initiative_roi,
-                )
+                with profile_stage("initiative"):
+                    init = extract_initiative(
+                        analysis,
+                        initiative_cfg,
+                        timestamp=game_state.updated_at,
+                        debug_dump_rois=debug_dump_initiative_roi,
+                        planes=planes,
+                        region_cache=region_cache,
+                    )
                 if init.side:
                     if init.side == game_state.battle.initiative.stable_side:
                         init.stable_side = game_state.battle.initiative.stable_side or init.side
@@ -395,34 +433,38 @@ def analyze_game_state(
 
         if participants_cfg is not None:
             previous_participants = game_state.battle.participants if game_state.battle.participants.detected else None
-            game_state.battle.participants = extract_participants(
-                analysis,
-                participants_cfg,
-                previous=previous_participants,
-                skip_name_ocr=False,
-                skip_health_ocr=False,
-                occupancy_refresh_s=PARTICIPANT_OCCUPANCY_REFRESH_S,
-                details_refresh_s=PARTICIPANT_DETAILS_REFRESH_S,
-                lock_name=True,
-                lock_school=True,
-                lock_health_max=True,
-                force_health_refresh=entered_card_select,
-                force_pips_refresh=entered_card_select,
-                force_school_refresh=entered_card_select,
-                refresh_health_on_force_only=True,
-                refresh_pips_on_force_only=True,
-                timestamp=game_state.updated_at,
-                debug_dump=debug_dump_ocr,
-                debug_dump_health=debug_dump_health_roi,
-                debug_dump_empty_names=debug_dump_empty_names,
-                debug_dump_sigil_roi=debug_dump_sigil_roi,
-                debug_dump_school_roi=debug_dump_school_roi,
-                debug_dump_pips=(debug_dump_pip_roi and entered_card_select),
-                debug_print_health_ocr=debug_print_health_ocr,
-                debug_print_health_ocr_initial_read=(entered_card_select and (not game_state.battle.initial_card_select_done)),
-                debug_dump_id=debug_dump_ocr_id,
-                debug_dump_limit=debug_dump_ocr_limit,
-            )
+            with profile_stage("participants"):
+                game_state.battle.participants = extract_participants(
+                    analysis,
+                    participants_cfg,
+                    previous=previous_participants,
+                    skip_name_ocr=False,
+                    skip_health_ocr=False,
+                    occupancy_refresh_s=PARTICIPANT_OCCUPANCY_REFRESH_S,
+                    details_refresh_s=PARTICIPANT_DETAILS_REFRESH_S,
+                    lock_name=True,
+                    lock_school=True,
+                    lock_health_max=True,
+                    force_health_refresh=entered_card_select,
+                    force_pips_refresh=entered_card_select,
+                    force_school_refresh=entered_card_select,
+                    refresh_health_on_force_only=True,
+                    refresh_pips_on_force_only=True,
+                    timestamp=game_state.updated_at,
+                    debug_dump=debug_dump_ocr,
+                    debug_dump_health=debug_dump_health_roi,
+                    debug_dump_empty_names=debug_dump_empty_names,
+                    debug_dump_sigil_roi=debug_dump_sigil_roi,
+                    debug_dump_school_roi=debug_dump_school_roi,
+                    debug_dump_pips=(debug_dump_pip_roi and entered_card_select),
+                    debug_print_health_ocr=debug_print_health_ocr,
+                    debug_print_health_ocr_initial_read=(entered_card_select and (not game_state.battle.initial_card_select_done)),
+                    debug_dump_id=debug_dump_ocr_id,
+                    debug_dump_limit=debug_dump_ocr_limit,
+                    planes=planes,
+                    region_cache=region_cache,
+                    ocr_jobs=ocr_jobs,
+                )
             if render_participants:
                 participants_overlay = render_participants_overlay(
                     analysis,
@@ -436,30 +478,31 @@ def analyze_game_state(
             hud_profile = PLAYER_HUD_PROFILES.get(aspect_key) or PLAYER_HUD_PROFILES.get("16:9")
             if hud_profile is not None:
                 previous_player = game_state.battle.player_wizard
-                should_scan_idle = entered_idle
-                if (
-                    (not should_scan_idle)
-                    and (
-                        previous_player.timestamp is None
-                        or (game_state.updated_at - previous_player.timestamp) >= PLAYER_WIZARD_IDLE_RESCAN_S
-                    )
-                ):
-                    should_scan_idle = True
+                rescan_due = (
+                    entered_idle
+                    or previous_player.timestamp is None
+                    or (game_state.updated_at - previous_player.timestamp) >= PLAYER_WIZARD_IDLE_RESCAN_S
+                )
+                # Between due rescans, only collect reads that are already queued.
+                should_scan_idle = rescan_due or hud_jobs_pending
                 if should_scan_idle:
-                    idle_player = extract_player_wizard_state(
-                        analysis,
-                        game_state.battle.participants,
-                        participants_cfg.ocr,
-                        hud_profile,
-                        previous=previous_player,
-                        timestamp=game_state.updated_at,
-                        debug_dump_rois=debug_dump_player_wizard_roi,
-                        resolve_slot_lookup=False,
-                        slot_confirm_rounds=PLAYER_WIZARD_SLOT_CONFIRM_ROUNDS,
-                        scan_health=True,
-                        scan_mana=True,
-                        scan_energy=True,
-                    )
+                    with profile_stage("player_wizard"):
+                        idle_player = extract_player_wizard_state(
+                            analysis,
+                            game_state.battle.participants,
+                            participants_cfg.ocr,
+                            hud_profile,
+                            previous=previous_player,
+                            timestamp=game_state.updated_at,
+                            debug_dump_rois=debug_dump_player_wizard_roi,
+                            resolve_slot_lookup=False,
+                            slot_confirm_rounds=PLAYER_WIZARD_SLOT_CONFIRM_ROUNDS,
+                            scan_health=True,
+                            scan_mana=True,
+                            scan_energy=True,
+                            ocr_jobs=ocr_jobs,
+                            poll_only=not rescan_due,
+                        )
                     if previous_player is not None:
                         if idle_player.health_current is None:
                             idle_player.health_current = previous_player.health_current
@@ -486,24 +529,28 @@ def analyze_game_state(
                 and previous_player.health_current is None
                 and (game_state.updated_at - previous_player.timestamp) >= PLAYER_WIZARD_UNKNOWN_RESCAN_S
             )
-            should_scan_player = entered_card_select or retry_unknown_health
+            rescan_due = entered_card_select or retry_unknown_health
+            should_scan_player = rescan_due or hud_jobs_pending
             if should_scan_player:
                 scan_health = (not previous_player.slot_locked)
                 scan_mana = entered_card_select
-                next_player = extract_player_wizard_state(
-                    analysis,
-                    game_state.battle.participants,
-                    participants_cfg.ocr,
-                    hud_profile,
-                    previous=previous_player,
-                    timestamp=game_state.updated_at,
-                    debug_dump_rois=debug_dump_player_wizard_roi,
-                    resolve_slot_lookup=((not previous_player.slot_locked) and scan_health),
-                    slot_confirm_rounds=PLAYER_WIZARD_SLOT_CONFIRM_ROUNDS,
-                    scan_health=scan_health,
-                    scan_mana=scan_mana,
-                    scan_energy=False,
-                )
+                with profile_stage("player_wizard"):
+                    next_player = extract_player_wizard_state(
+                        analysis,
+                        game_state.battle.participants,
+                        participants_cfg.ocr,
+                        hud_profile,
+                        previous=previous_player,
+                        timestamp=game_state.updated_at,
+                        debug_dump_rois=debug_dump_player_wizard_roi,
+                        resolve_slot_lookup=((not previous_player.slot_locked) and scan_health),
+                        slot_confirm_rounds=PLAYER_WIZARD_SLOT_CONFIRM_ROUNDS,
+                        scan_health=scan_health,
+                        scan_mana=scan_mana,
+                        scan_energy=False,
+                        ocr_jobs=ocr_jobs,
+                        poll_only=not rescan_due,
+                    )
                 game_state.battle.player_wizard = next_player
         previous_hand = game_state.battle.player_hand
         should_scan_hand = entered_card_select
@@ -516,13 +563,16 @@ def analyze_game_state(
                 and (game_state.updated_at - previous_hand.timestamp) >= retry_interval_s
             )
         if should_scan_hand:
-            game_state.battle.player_hand = extract_player_hand_state(
-                analysis,
-                CARD_COUNT_CFG,
-                aspect_key=aspect_key,
-                timestamp=game_state.updated_at,
-                debug_dump_roi=debug_dump_player_hand_roi,
-            )
+            with profile_stage("player_hand"):
+                game_state.battle.player_hand = extract_player_hand_state(
+                    analysis,
+                    CARD_COUNT_CFG,
+                    aspect_key=aspect_key,
+                    timestamp=game_state.updated_at,
+                    debug_dump_roi=debug_dump_player_hand_roi,
+                    planes=planes,
+                    region_cache=region_cache,
+                )
 
     if render_player_wizard and analysis is not None and (in_battle or (resolved_state == STATE_IDLE)):
         player_wizard_overlay = render_player_wizard_overlay(
@@ -531,6 +581,9 @@ def analyze_game_state(
             in_battle=in_battle,
         )
 
+    if profiled:
+        PROFILER.record("analysis", (time.perf_counter() - analysis_started_at) * 1000.0)
+
     return AnalysisResult(
         game_state=game_state,
         in_card_select=in_card_select,
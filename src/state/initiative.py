@@ -5,7 +5,10 @@ from typing import Dict, Optional, Tuple, List
 import cv2
 import numpy as np
 
+from utils.frames import FramePlanes
+from utils.region_cache import RegionCache, region_cached
 from utils.roi import crop_relative, draw_relative_roi
+from utils.template_bank import TEMPLATE_BANK
 from state.game_state import InitiativeState
 
 
@@ -53,7 +56,6 @@ def _aspect_bucket(aspect: float) -> str:
     return best_key
 
 
-_INITIATIVE_TEMPLATE_CACHE: Dict[str, List[np.ndarray]] = {}
 _ROI_DUMP_DIR = Path("debug/initiative")
 _ROI_DUMP_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -69,36 +71,22 @@ def _template_suffixes_for_aspect(aspect_key: str) -> Tuple[str, ...]:
 
 
 def _load_templates(base_dir: Path, side: str, state: str, aspect_key: str) -> List[np.ndarray]:
-    candidates: List[Path] = []
-    side_dir = base_dir / side / state
-    if side_dir.exists():
-        candidates.extend(sorted(side_dir.glob("*.png")))
-    if not candidates:
-        generic_dir = base_dir / state
-        if generic_dir.exists():
-            candidates.extend(sorted(generic_dir.glob("*.png")))
-    key = f"{base_dir.resolve()}::{side}::{state}::{aspect_key}"
-    if key in _INITIATIVE_TEMPLATE_CACHE:
-        return _INITIATIVE_TEMPLATE_CACHE[key]
-    templates: List[np.ndarray] = []
-    suffixes = _template_suffixes_for_aspect(aspect_key)
-    for p in candidates:
-        stem = p.stem.strip().lower()
-        if suffixes and not any(stem.endswith(suf) for suf in suffixes):
-            continue
-        img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
-        if img is None:
-            continue
-        templates.append(img)
-    if not templates:
-        # Fall back to any templates if none matched the aspect suffix.
-        for p in candidates:
-            img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
-            if img is None:
-                continue
-            templates.append(img)
-    _INITIATIVE_TEMPLATE_CACHE[key] = templates
-    return templates
+    def _build() -> List[np.ndarray]:
+        candidates = TEMPLATE_BANK.files(base_dir / side / state)
+        if not candidates:
+            candidates = TEMPLATE_BANK.files(base_dir / state)
+        suffixes = _template_suffixes_for_aspect(aspect_key)
+        templates = [
+            t.image
+            for t in candidates
+            if not suffixes or any(t.name.strip().lower().endswith(suf) for suf in suffixes)
+        ]
+        if not templates:
+            # Fall back to any templates if none matched the aspect suffix.
+            templates = [t.image for t in candidates]
+        return templates
+
+    return TEMPLATE_BANK.cached(("initiative", str(base_dir).lower(), side, state, aspect_key), _build)
 
 
 def _best_template_score(roi_gray: np.ndarray, templates: List[np.ndarray]) -> float:
@@ -124,11 +112,17 @@ def _template_ring_score(
     base_dir: Path,
     side: str,
     aspect_key: str,
+    planes: Optional[FramePlanes] = None,
 ) -> Tuple[float, float]:
-    roi_bgr = crop_relative(frame_bgr, roi)
-    if roi_bgr.size == 0:
-        return (0.0, 0.0)
-    roi_gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+    if planes is not None:
+        roi_gray = crop_relative(planes.gray, roi)
+        if roi_gray.size == 0:
+            return (0.0, 0.0)
+    else:
+        roi_bgr = crop_relative(frame_bgr, roi)
+        if roi_bgr.size == 0:
+            return (0.0, 0.0)
+        roi_gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
     on_templates = _load_templates(base_dir, side, "on", aspect_key)
     off_templates = _load_templates(base_dir, side, "off", aspect_key)
     on_score = _best_template_score(roi_gray, on_templates)
@@ -151,6 +145,8 @@ def extract_initiative(
     *,
     timestamp: Optional[float] = None,
     debug_dump_rois: bool = False,
+    planes: Optional[FramePlanes] = None,
+    region_cache: Optional[RegionCache] = None,
 ) -> InitiativeState:
     state = InitiativeState()
     if frame_bgr is None:
@@ -176,19 +172,31 @@ def extract_initiative(
         _dump_initiative_roi(dagger_crop, "dagger")
 
     base_dir = Path(cfg.templates_base_dir)
-    sun_on, sun_off = _template_ring_score(
-        frame_bgr,
+    sun_on, sun_off = region_cached(
+        region_cache,
+        ("initiative", "sun", bucket),
         sun_roi,
-        base_dir=base_dir,
-        side="sun",
-        aspect_key=bucket,
+        lambda: _template_ring_score(
+            frame_bgr,
+            sun_roi,
+            base_dir=base_dir,
+            side="sun",
+            aspect_key=bucket,
+            planes=planes,
+        ),
     )
-    dagger_on, dagger_off = _template_ring_score(
-        frame_bgr,
+    dagger_on, dagger_off = region_cached(
+        region_cache,
+        ("initiative", "dagger", bucket),
         dagger_roi,
-        base_dir=base_dir,
-        side="dagger",
-        aspect_key=bucket,
+        lambda: _template_ring_score(
+            frame_bgr,
+            dagger_roi,
+            base_dir=base_dir,
+            side="dagger",
+            aspect_key=bucket,
+            planes=planes,
+        ),
     )
     sun_score = sun_on - sun_off
     dagger_score = dagger_on - dagger_off
@@ -3,22 +3,34 @@ from __future__ import annotations
 from dataclasses import dataclass, replace, field
 from datetime import datetime
 from pathlib import Path
+import hashlib
+import json
+import os
+import pickle
 import time
 import threading
-from typing import Dict, Optional, Tuple, List, Set
+from typing import Dict, Optional, Sequence, Tuple, List, Set
 import re
 
 import cv2
 import numpy as np
 
+from utils.attempts import AttemptExecutor
+from utils.edit_distance import levenshtein
+from utils.frames import FramePlanes
+from utils.fuzzy_index import FuzzyIndex
+from utils.lru import LRUCache
+from utils.ocr_jobs import OCRJobService
+from utils.variant_stats import VariantScheduler
+from utils.word_trie import WordTrie
+from utils.profiler import PROFILER, profile_stage
+from utils.region_cache import RegionCache, region_cached
 from utils.roi import crop_relative, draw_relative_roi
+from utils.template_bank import TEMPLATE_BANK, TemplateGroup
+from ocr_tess import engine as tess
+from ocr_glyph.recognizer import RECOGNIZER as GLYPHS
 from state.game_state import ParticipantsState, ParticipantState, PipInventory, PlayerWizardState
 
-try:
-    import pytesseract
-except Exception:  # pragma: no cover - allow import failure in minimal envs
-    pytesseract = None
-
 _OCR_DUMP_DIR = Path("debug/ocr")
 _OCR_DUMP_DIR.mkdir(parents=True, exist_ok=True)
 _PARTICIPANT_DUMP_DIR = Path("debug/participants")
@@ -29,9 +41,12 @@ _OCR_DUMP_COUNTS: Dict[str, int] = {}
 _WORDLIST_CACHE: Dict[str, List[str]] = {}
 _WORDLIST_NORM_CACHE: Dict[str, List[str]] = {}
 _WORDLIST_NORM_NS_CACHE: Dict[str, List[str]] = {}
-_WORDLIST_PREFIX_CACHE: Dict[str, Dict[int, Dict[str, List[int]]]] = {}
+_WORDLIST_TRIE_CACHE: Dict[str, WordTrie] = {}
 _WORDLIST_TOKEN_INDEX_CACHE: Dict[str, Dict[str, List[int]]] = {}
 _WORDLIST_NORM_MAP_CACHE: Dict[str, Dict[str, str]] = {}
+_WORDLIST_FUZZY_CACHE: Dict[str, Tuple[FuzzyIndex, FuzzyIndex]] = {}
+_WORDLIST_STAMP_CACHE: Dict[str, str] = {}
+_WORDLIST_LOAD_LOCK = threading.Lock()
 _EASYOCR_WARNED = False
 _HEALTH_OCR_LOG_QUEUE: List[str] = []
 _HEALTH_OCR_LOG_LOCK = threading.Lock()
@@ -40,7 +55,12 @@ _NAME_OCR_LOG_LOCK = threading.Lock()
 _SLOT_ACTIVITY_LOG_QUEUE: List[str] = []
 _SLOT_ACTIVITY_LOG_LOCK = threading.Lock()
 
-_WORDLIST_PREFIX_MAX_LEN = 4
+# Edit distance the deletion index is built for; larger queries scan linearly.
+_WORDLIST_FUZZY_MAX_DIST = 2
+# Compiled wordlist indexes live in this folder next to the lists themselves.
+_WORDLIST_INDEX_DIRNAME = ".wordlist_cache"
+# Bump when normalization or any compiled structure changes; older files are rebuilt.
+_WORDLIST_INDEX_VERSION = 2
 _WORDLIST_MULTI_SEP = "|"
 
 
@@ -186,10 +206,31 @@ class OCRConfig:
     name_blacklist: str = "$§/\\|_`~=+?><,!@#%^&*(}{][)"
     wordlist_prefix_min_ratio: float = 0.6
     wordlist_prefix_min_chars: int = 4
+    wordlist_cache: bool = True  # memoize wordlist corrections by normalized input, wordlist and thresholds
+    wordlist_cache_size: int = 2048
+    wordlist_cache_path: Optional[str] = "cache/wordlist_corrections.json"  # None keeps them in memory only
     backend: str = "tesseract"  # "tesseract" or "easyocr"
     easyocr_langs: Tuple[str, ...] = ("en",)
     easyocr_gpu: bool = True
     easyocr_model_dir: Optional[str] = "src/ocr_easy/models"
+    # Tight single-line ROIs can skip EasyOCR's text detector and go straight to recognition.
+    easyocr_recognize_only_text: bool = False
+    easyocr_recognize_only_names: bool = False
+    easyocr_recognize_only_health: bool = False
+    easyocr_batch_quantum: int = 8  # batched canvases are multiples of this many px
+    easyocr_batch_max_pad: float = 1.25  # a crop is padded by at most this factor per axis (squared, by area)
+    result_cache: bool = True  # memoize OCR reads by crop fingerprint across slots/rounds/battles
+    result_cache_size: int = 4096
+    health_montage: bool = True  # Tesseract: read all slots' health crops stacked on one page, then per-slot fallback
+    health_parallel: bool = True  # run Tesseract health variants concurrently, stop at the first complete pair
+    attempt_workers: int = 4
+    glyph_fast_path: bool = True  # try the learned glyph recognizer before OCR for health/HUD numbers
+    glyph_store_dir: Optional[str] = "cache/glyphs"
+    glyph_max_distance: float = 0.2
+    adaptive_variants: bool = True  # try the preprocessing variant that usually wins first (per field/side/aspect)
+    variant_stats_path: Optional[str] = "cache/ocr_variant_stats.json"
+    async_jobs: bool = False  # name/health/HUD OCR runs on background workers; results merge on later frames
+    async_workers: int = 2
 
 
 @dataclass(frozen=True)
@@ -252,7 +293,7 @@ def _binary_ink_ratio(bin_img: np.ndarray) -> float:
 def _name_roi_hash(img_bgr: np.ndarray) -> Optional[int]:
     if img_bgr.size == 0:
         return None
-    gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+    gray = _ensure_gray(img_bgr)
     small = cv2.resize(gray, (32, 8), interpolation=cv2.INTER_AREA)
     mean = small.mean()
     bits = (small > mean).astype(np.uint8)
@@ -260,6 +301,80 @@ def _name_roi_hash(img_bgr: np.ndarray) -> Optional[int]:
     return int.from_bytes(packed.tobytes(), "big")
 
 
+_OCR_RESULT_CACHE = LRUCache(4096)
+_OCR_JOBS = OCRJobService(workers=2)
+_OCR_CACHE_KIND_COUNTS: Dict[str, List[int]] = {}  # kind -> [hits, misses]
+_OCR_CACHE_LOCK = threading.Lock()
+
+
+def _ocr_crop_fingerprint(img: np.ndarray) -> bytes:
+    # Pixels quantized to 16 levels per channel, then hashed. Unlike _name_roi_hash
+    # (32x8 average hash) this never merges crops whose digits/letters differ, while
+    # still absorbing low-bit capture noise.
+    quantized = np.ascontiguousarray(img) >> 4
+    return hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+
+
+def _ocr_cache_key(kind: str, img: Optional[np.ndarray], cfg: OCRConfig, variant) -> Optional[tuple]:
+    """(kind, variant, crop shape + fingerprint, cfg), or None when caching is off for this read."""
+    if not cfg.result_cache or img is None or img.size == 0:
+        return None
+    if _OCR_RESULT_CACHE.max_entries != cfg.result_cache_size:
+        _OCR_RESULT_CACHE.resize(cfg.result_cache_size)
+    return (kind, variant, img.shape, _ocr_crop_fingerprint(img), cfg)
+
+
+def _ocr_cache_lookup(key: tuple) -> Tuple[bool, object]:
+    hit, value = _OCR_RESULT_CACHE.lookup(key)
+    with _OCR_CACHE_LOCK:
+        counts = _OCR_CACHE_KIND_COUNTS.setdefault(key[0], [0, 0])
+        counts[0 if hit else 1] += 1
+    return hit, value
+
+
+def _ocr_cached(kind: str, img: Optional[np.ndarray], cfg: OCRConfig, variant, compute):
+    """Memoize an OCR read. None results are cached too: the same pixels fail the same way."""
+    key = _ocr_cache_key(kind, img, cfg, variant)
+    if key is None:
+        return compute()
+    hit, value = _ocr_cache_lookup(key)
+    if hit:
+        return value
+    value = compute()
+    _OCR_RESULT_CACHE.store(key, value)
+    return value
+
+
+def ocr_result_cache_stats() -> Dict[str, Dict[str, float]]:
+    """Overall LRU stats under "all", plus hits/misses per OCR kind."""
+    out: Dict[str, Dict[str, float]] = {"all": _OCR_RESULT_CACHE.stats()}
+    with _OCR_CACHE_LOCK:
+        for kind, (hits, misses) in sorted(_OCR_CACHE_KIND_COUNTS.items()):
+            total = hits + misses
+            out[kind] = {"hits": hits, "misses": misses, "hit_rate": (hits / total) if total else 0.0}
+    return out
+
+
+def clear_ocr_result_cache() -> None:
+    _OCR_RESULT_CACHE.clear()
+
+
+def ocr_jobs_for(cfg: OCRConfig) -> Optional[OCRJobService]:
+    """The shared background OCR service when cfg enables async OCR, else None."""
+    if not cfg.async_jobs:
+        return None
+    _OCR_JOBS.configure(workers=cfg.async_workers)
+    return _OCR_JOBS
+
+
+def ocr_job_stats() -> Dict[str, int]:
+    return _OCR_JOBS.stats()
+
+
+def shutdown_ocr_jobs() -> None:
+    _OCR_JOBS.shutdown()
+
+
 def _ensure_black_text_on_white(bin_img: np.ndarray) -> np.ndarray:
     if bin_img.size == 0:
         return bin_img
@@ -506,7 +621,7 @@ def _crop_to_foreground(bin_img: np.ndarray, pad: int = 4) -> np.ndarray:
 def _ocr_name_per_char(img_bgr: np.ndarray, cfg: OCRConfig) -> Optional[str]:
     if cfg.backend != "tesseract":
         return None
-    if pytesseract is None or img_bgr.size == 0:
+    if not tess.available() or img_bgr.size == 0:
         return None
     bin_img = _prep_ocr_name(img_bgr, cfg.scale, invert=False)
     bin_img = _crop_to_foreground(bin_img, pad=2)
@@ -578,11 +693,15 @@ def _ocr_name_per_char(img_bgr: np.ndarray, cfg: OCRConfig) -> Optional[str]:
         cx2 = min(w, x2 + pad + 1)
         crop = bin_img[:, cx1:cx2]
         crop = cv2.copyMakeBorder(crop, 4, 4, 6, 6, cv2.BORDER_CONSTANT, value=255)
-        config = f"--oem {cfg.oem} --psm 10"
-        if cfg.name_whitelist:
-            config += f" -c tessedit_char_whitelist={cfg.name_whitelist}"
         try:
-            ch = pytesseract.image_to_string(crop, lang=cfg.lang, config=config)
+            ch = tess.image_to_string(
+                crop,
+                lang=cfg.lang,
+                oem=cfg.oem,
+                psm=10,
+                whitelist=cfg.name_whitelist or None,
+                tesseract_cmd=cfg.tesseract_cmd,
+            )
         except Exception:
             ch = ""
         ch = ch.strip()
@@ -906,34 +1025,20 @@ def _match_wordlist_prefix(prefix: str, cfg: OCRConfig) -> Optional[str]:
     if not prefix or len(prefix) < cfg.wordlist_prefix_min_chars:
         return None
     prefix = _normalize_ocr_compare(prefix)
-    words, norms, norms_ns, prefix_maps, _ = _load_wordlist_index(cfg.user_words_path)
+    words, _, norms_ns, trie, _ = _load_wordlist_index(cfg.user_words_path)
     if not words:
         return None
     prefix_ns = prefix.replace(" ", "")
-    candidates = _prefix_candidates(prefix_ns, prefix_maps)
-    if candidates is not None and not candidates:
+    if not prefix_ns:
         return None
-    best_i = -1
-    best_ratio = 0.0
-    best_len = 0
-    indices = candidates if candidates is not None else range(len(norms))
-    for i in indices:
-        norm_word = norms[i]
-        if not norm_word:
-            continue
-        norm_ns = norms_ns[i] if i < len(norms_ns) else norm_word.replace(" ", "")
-        if not (norm_word.startswith(prefix) or norm_ns.startswith(prefix_ns)):
-            continue
-        ratio = len(prefix_ns) / max(1, len(norm_ns))
-        if ratio < cfg.wordlist_prefix_min_ratio:
-            continue
-        if ratio > best_ratio or (ratio == best_ratio and len(norm_word) < best_len):
-            best_ratio = ratio
-            best_len = len(norm_word)
-            best_i = i
-    if best_i >= 0:
-        return words[best_i]
-    return None
+    # The shortest completion has the best ratio; the trie breaks its ties.
+    i = trie.complete(prefix_ns)
+    if i is None:
+        return None
+    ratio = len(prefix_ns) / max(1, len(norms_ns[i]))
+    if ratio < cfg.wordlist_prefix_min_ratio:
+        return None
+    return words[i]
 
 
 def _match_wordlist_short_prefix(prefix: str, cfg: OCRConfig) -> Optional[str]:
@@ -943,54 +1048,30 @@ def _match_wordlist_short_prefix(prefix: str, cfg: OCRConfig) -> Optional[str]:
     prefix_ns = prefix.replace(" ", "")
     if len(prefix_ns) < 3:
         return None
-    words, norms, norms_ns, prefix_maps, _ = _load_wordlist_index(cfg.user_words_path)
+    words, _, norms_ns, trie, _ = _load_wordlist_index(cfg.user_words_path)
     if not words:
         return None
-    candidates = _prefix_candidates(prefix_ns, prefix_maps)
-    if candidates is not None and not candidates:
-        return None
-    best_i = -1
-    best_ratio = 0.0
-    best_len = 0
     min_ratio = max(cfg.wordlist_prefix_min_ratio, 0.75)
     max_len = 5
-    indices = candidates if candidates is not None else range(len(norms))
-    for i in indices:
-        norm_word = norms[i]
-        if not norm_word:
-            continue
-        norm_ns = norms_ns[i] if i < len(norms_ns) else norm_word.replace(" ", "")
-        if len(norm_ns) > max_len:
-            continue
-        if not (norm_word.startswith(prefix) or norm_ns.startswith(prefix_ns)):
-            continue
-        ratio = len(prefix_ns) / max(1, len(norm_ns))
-        if ratio < min_ratio:
-            continue
-        if ratio > best_ratio or (ratio == best_ratio and len(norm_word) < best_len):
-            best_ratio = ratio
-            best_len = len(norm_word)
-            best_i = i
-    if best_i >= 0:
-        return words[best_i]
-    return None
+    # Any longer completion is both too long and lower in ratio than the shortest.
+    i = trie.complete(prefix_ns)
+    if i is None or len(norms_ns[i]) > max_len:
+        return None
+    ratio = len(prefix_ns) / max(1, len(norms_ns[i]))
+    if ratio < min_ratio:
+        return None
+    return words[i]
 
 
 def _match_wordlist_substring(substring: str, cfg: OCRConfig) -> Optional[str]:
     if not substring or len(substring) < cfg.wordlist_prefix_min_chars:
         return None
     substring = _normalize_ocr_compare(substring)
-    words, norms = _load_wordlist(cfg.user_words_path)
+    words, _, _, trie, _ = _load_wordlist_index(cfg.user_words_path)
     if not words:
         return None
-    sub_ns = substring.replace(" ", "")
-    for i, norm_word in enumerate(norms):
-        if not norm_word:
-            continue
-        norm_ns = norm_word.replace(" ", "")
-        if sub_ns in norm_ns:
-            return words[i]
-    return None
+    i = trie.first_containing(substring.replace(" ", ""))
+    return words[i] if i is not None else None
 
 
 def _match_wordlist_close(norm_text: str, cfg: OCRConfig) -> Optional[str]:
@@ -1000,20 +1081,22 @@ def _match_wordlist_close(norm_text: str, cfg: OCRConfig) -> Optional[str]:
     words, norms = _load_wordlist(cfg.user_words_path)
     if not words:
         return None
+    fuzzy, _ = _load_wordlist_fuzzy(cfg.user_words_path)
+    # One batched pass, exact up to the loosest per-word bound below.
+    longest = max(len(norm_text), fuzzy.longest)
+    dists = fuzzy.distances(norm_text, max(2, int(longest * 0.3)))
+    # Per-word length and distance bounds in bulk; only survivors reach the loop.
+    max_lens = np.maximum(fuzzy.lengths, len(norm_text))
+    bounds = np.maximum(2, (max_lens * 0.3).astype(np.int64))
+    survivors = np.flatnonzero((fuzzy.lengths > 0) & (max_lens >= 4) & (dists <= bounds))
     best_i = -1
     best_score = 0.0
     best_len = 0
     text_tokens = norm_text.split()
-    for i, norm_word in enumerate(norms):
-        if not norm_word:
-            continue
-        max_len = max(len(norm_text), len(norm_word))
-        if max_len < 4:
-            continue
-        max_dist = max(2, int(max_len * 0.3))
-        dist = _levenshtein(norm_text, norm_word, max_dist)
-        if dist > max_dist:
-            continue
+    for i in survivors.tolist():
+        norm_word = norms[i]
+        max_len = int(max_lens[i])
+        dist = int(dists[i])
         score = 1.0 - (dist / max_len)
         if score < 0.7:
             continue
@@ -1037,30 +1120,15 @@ def _match_wordlist_prefix_distance(norm_text: str, cfg: OCRConfig) -> Optional[
     text_ns = norm_text.replace(" ", "")
     if len(text_ns) < 4:
         return None
-    words, norms = _load_wordlist(cfg.user_words_path)
+    words, norms, _, trie, _ = _load_wordlist_index(cfg.user_words_path)
     if not words:
         return None
-    best_i = -1
-    best_dist = 2
-    best_len = 0
-    max_dist = 1
-    for i, norm_word in enumerate(norms):
-        if not norm_word:
-            continue
-        norm_ns = norm_word.replace(" ", "")
-        if len(norm_ns) < len(text_ns):
-            continue
-        candidate = norm_ns[: len(text_ns)]
-        dist = _levenshtein(text_ns, candidate, max_dist)
-        if dist > max_dist:
-            continue
-        if dist < best_dist or (dist == best_dist and len(norm_word) < best_len):
-            best_dist = dist
-            best_len = len(norm_word)
-            best_i = i
-    if best_i >= 0:
-        return words[best_i]
-    return None
+    # Each trie prefix of len(text_ns) within one edit, with its shortest word.
+    matches = trie.prefix_matches(text_ns, 1)
+    if not matches:
+        return None
+    _, _, best_i = min((dist, len(norms[i]), i) for dist, i in matches)
+    return words[best_i]
 
 
 def _match_wordlist_token_remainder(norm_text: str, cfg: OCRConfig) -> Optional[str]:
@@ -1125,7 +1193,7 @@ def _match_wordlist_token_remainder(norm_text: str, cfg: OCRConfig) -> Optional[
             best_dist = max_dist + 1
             best_len = 0
             for opt in options:
-                dist = _levenshtein(raw_ns, opt, max_dist)
+                dist = levenshtein(raw_ns, opt, max_dist)
                 if dist < best_dist:
                     best_dist = dist
                     best_len = max(len(raw_ns), len(opt))
@@ -1182,7 +1250,7 @@ def _match_wordlist_token_remainder(norm_text: str, cfg: OCRConfig) -> Optional[
             cand_comp = cand_remain_ns[: len(raw_remain_ns)]
             max_len = max(len(raw_remain_ns), len(cand_comp))
             max_dist = max(1, int(max_len * 0.3))
-            dist = _levenshtein(raw_remain_ns, cand_comp, max_dist)
+            dist = levenshtein(raw_remain_ns, cand_comp, max_dist)
             score = 1.0 - (dist / max_len)
             if score < 0.7 and close_count > 0:
                 def _generate_insdel_candidates(raw: str, target: str, cap: int = 64) -> List[str]:
@@ -1206,7 +1274,7 @@ def _match_wordlist_token_remainder(norm_text: str, cfg: OCRConfig) -> Optional[
                     comp = cand_comp[: len(cand_raw)]
                     max_len_alt = max(len(cand_raw), len(comp))
                     max_dist_alt = max(1, int(max_len_alt * 0.3))
-                    dist_alt = _levenshtein(cand_raw, comp, max_dist_alt)
+                    dist_alt = levenshtein(cand_raw, comp, max_dist_alt)
                     alt_score = 1.0 - (dist_alt / max_len_alt)
                     if alt_score > best_alt:
                         best_alt = alt_score
@@ -1308,7 +1376,7 @@ def _best_wordlist_match_from_candidates(
         if not match:
             continue
         score = _score_wordlist_match(norm_text, match)
-        penalty = _levenshtein(base, cand, max(len(base), len(cand)))
+        penalty = levenshtein(base, cand, max(len(base), len(cand)))
         if score > best_score or (score == best_score and penalty < best_penalty):
             best_score = score
             best_penalty = penalty
@@ -1323,7 +1391,7 @@ def _score_wordlist_match(norm_text: str, match_word: str) -> float:
     if not left or not right:
         return 0.0
     max_len = max(len(left), len(right))
-    dist = _levenshtein(left, right, max_len)
+    dist = levenshtein(left, right, max_len)
     return 1.0 - (dist / max_len)
 
 
@@ -1364,16 +1432,12 @@ def _match_wordlist_for_text(norm_text: str, cfg: OCRConfig, *, truncated: bool)
     words, norms = _load_wordlist(cfg.user_words_path)
     if not words:
         return None
+    fuzzy, _ = _load_wordlist_fuzzy(cfg.user_words_path)
     best_i = -1
     best_dist = cfg.wordlist_max_distance + 1
     best_ratio = 0.0
-    for i, norm_word in enumerate(norms):
-        if not norm_word:
-            continue
-        max_len = max(len(norm_text), len(norm_word))
-        dist = _levenshtein(norm_text, norm_word, cfg.wordlist_max_distance)
-        if dist > cfg.wordlist_max_distance:
-            continue
+    for i, dist in fuzzy.within(norm_text, cfg.wordlist_max_distance):
+        max_len = max(len(norm_text), len(norms[i]))
         ratio = 1.0 - (dist / max_len)
         if dist < best_dist or (dist == best_dist and ratio > best_ratio):
             best_dist = dist
@@ -1396,7 +1460,7 @@ def _match_wordlist_for_text(norm_text: str, cfg: OCRConfig, *, truncated: bool)
 
 
 def _best_wordlist_fallback(norm_text: str, cfg: OCRConfig) -> Optional[str]:
-    words, norms = _load_wordlist(cfg.user_words_path)
+    words, norms, _, _, token_index = _load_wordlist_index(cfg.user_words_path)
     if not words:
         return None
     text_ns = norm_text.replace(" ", "")
@@ -1404,56 +1468,30 @@ def _best_wordlist_fallback(norm_text: str, cfg: OCRConfig) -> Optional[str]:
         return None
     tokens = [token for token in norm_text.split() if token]
     first_token = tokens[0] if tokens else ""
+    _, fuzzy_ns = _load_wordlist_fuzzy(cfg.user_words_path)
 
-    def _best_from_indices(indices: List[int]) -> Optional[str]:
+    def _best_from_indices(indices: Optional[List[int]]) -> Optional[str]:
+        # Highest no-space similarity; ties go to the shorter word, then the earlier one.
         best_i = -1
-        best_score = -1.0
         best_len = 0
-        for i in indices:
-            norm_word = norms[i]
-            if not norm_word:
-                continue
-            word_ns = norm_word.replace(" ", "")
-            max_len = max(len(text_ns), len(word_ns))
-            dist = _levenshtein(text_ns, word_ns, max_len)
-            score = 1.0 - (dist / max_len)
-            if score > best_score or (score == best_score and len(norm_word) < best_len):
-                best_score = score
-                best_len = len(norm_word)
+        for i, _ in fuzzy_ns.best_ratio(text_ns, indices):
+            if best_i < 0 or len(norms[i]) < best_len:
+                best_len = len(norms[i])
                 best_i = i
         return words[best_i] if best_i >= 0 else None
 
     if first_token:
-        exact_indices = [i for i, norm in enumerate(norms) if first_token in norm.split()]
+        exact_indices = token_index.get(first_token)
         if exact_indices:
             return _best_from_indices(exact_indices)
-        close_indices: List[int] = []
-        for i, norm in enumerate(norms):
-            for tok in norm.split():
-                if _levenshtein(first_token, tok[: len(first_token)], 2) <= 2:
-                    close_indices.append(i)
-                    break
-        if close_indices:
-            return _best_from_indices(close_indices)
+        close: Set[int] = set()
+        for tok, indices in token_index.items():
+            if levenshtein(first_token, tok[: len(first_token)], 2) <= 2:
+                close.update(indices)
+        if close:
+            return _best_from_indices(sorted(close))
 
-    return _best_from_indices(list(range(len(norms))))
-
-
-def _build_prefix_maps(norms_ns: List[str], max_len: int) -> Dict[int, Dict[str, List[int]]]:
-    maps: Dict[int, Dict[str, List[int]]] = {length: {} for length in range(1, max_len + 1)}
-    for i, norm_ns in enumerate(norms_ns):
-        if not norm_ns:
-            continue
-        for length in range(1, max_len + 1):
-            if len(norm_ns) < length:
-                break
-            key = norm_ns[:length]
-            bucket = maps[length].get(key)
-            if bucket is None:
-                maps[length][key] = [i]
-            else:
-                bucket.append(i)
-    return maps
+    return _best_from_indices(None)
 
 
 def _split_wordlist_paths(path: Optional[str]) -> List[str]:
@@ -1490,77 +1528,97 @@ def _combine_wordlist_paths(primary: Optional[str], secondary: Optional[str]) ->
 
 def _load_wordlist_index(
     path: Optional[str],
-) -> Tuple[List[str], List[str], List[str], Dict[int, Dict[str, List[int]]], Dict[str, List[int]]]:
+) -> Tuple[List[str], List[str], List[str], WordTrie, Dict[str, List[int]]]:
     words, norms = _load_wordlist(path)
     if not path:
-        return (words, norms, [], {}, {})
+        return (words, norms, [], WordTrie([], []), {})
     key = _wordlist_cache_key(path)
     norms_ns = _WORDLIST_NORM_NS_CACHE.get(key, [])
-    prefix_maps = _WORDLIST_PREFIX_CACHE.get(key, {})
+    trie = _WORDLIST_TRIE_CACHE.get(key) or WordTrie([], [])
     token_index = _WORDLIST_TOKEN_INDEX_CACHE.get(key, {})
-    return (words, norms, norms_ns, prefix_maps, token_index)
+    return (words, norms, norms_ns, trie, token_index)
+
+
+def _load_wordlist_fuzzy(path: Optional[str]) -> Tuple[FuzzyIndex, FuzzyIndex]:
+    """Fuzzy indexes over the normalized words and over their no-space forms."""
+    _load_wordlist(path)
+    cached = _WORDLIST_FUZZY_CACHE.get(_wordlist_cache_key(path)) if path else None
+    if cached is None:
+        cached = (FuzzyIndex([], 0), FuzzyIndex([], 0))
+    return cached
+
+
+def _wordlist_files(parts: List[str]) -> List[Path]:
+    files: List[Path] = []
+    for raw_path in parts:
+        p = Path(raw_path)
+        if not p.exists():
+            continue
+        if p.is_dir():
+            files.extend(sorted(p.glob("*.txt")))
+        else:
+            files.append(p)
+    return files
+
+
+def _wordlist_index_file(parts: List[str], key: str) -> Optional[Path]:
+    for raw_path in parts:
+        p = Path(raw_path)
+        if p.exists():
+            folder = p if p.is_dir() else p.parent
+            digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+            return folder / _WORDLIST_INDEX_DIRNAME / f"{digest}.pickle"
+    return None
 
 
-def _prefix_candidates(prefix_ns: str, prefix_maps: Dict[int, Dict[str, List[int]]]) -> Optional[List[int]]:
-    if not prefix_ns or not prefix_maps:
+def _wordlist_index_stamp(files: List[Path]) -> Tuple:
+    stamp: List[Tuple[str, int, int]] = []
+    for file_path in files:
+        st = file_path.stat()
+        stamp.append((str(file_path.resolve()), st.st_mtime_ns, st.st_size))
+    return (_WORDLIST_INDEX_VERSION, _WORDLIST_FUZZY_MAX_DIST, tuple(stamp))
+
+
+def _read_wordlist_index(index_file: Optional[Path], stamp: Tuple) -> Optional[Dict[str, object]]:
+    if index_file is None or not index_file.is_file():
+        return None
+    try:
+        index = pickle.loads(index_file.read_bytes())
+    except Exception:
         return None
-    plen = min(len(prefix_ns), _WORDLIST_PREFIX_MAX_LEN)
-    table = prefix_maps.get(plen)
-    if table is None:
+    if not isinstance(index, dict) or index.get("stamp") != stamp:
         return None
-    return table.get(prefix_ns[:plen], [])
+    return index
 
 
-def _load_wordlist(path: Optional[str]) -> Tuple[List[str], List[str]]:
-    if not path:
-        return ([], [])
-    parts = _split_wordlist_paths(path)
-    if not parts:
-        return ([], [])
-    key = _wordlist_cache_key(path)
-    if (
-        key in _WORDLIST_CACHE
-        and key in _WORDLIST_NORM_CACHE
-        and key in _WORDLIST_NORM_NS_CACHE
-        and key in _WORDLIST_TOKEN_INDEX_CACHE
-        and key in _WORDLIST_NORM_MAP_CACHE
-    ):
-        return (_WORDLIST_CACHE[key], _WORDLIST_NORM_CACHE[key])
-    if not any(Path(raw_path).exists() for raw_path in parts):
-        _WORDLIST_CACHE[key] = []
-        _WORDLIST_NORM_CACHE[key] = []
-        _WORDLIST_NORM_NS_CACHE[key] = []
-        _WORDLIST_PREFIX_CACHE[key] = {}
-        _WORDLIST_TOKEN_INDEX_CACHE[key] = {}
-        _WORDLIST_NORM_MAP_CACHE[key] = {}
-        return ([], [])
+def _write_wordlist_index(index_file: Optional[Path], index: Dict[str, object]) -> None:
+    if index_file is None:
+        return
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: another process may be saving the same index.
+        tmp = index_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, index_file)
+    except OSError as exc:
+        print(f"[ocr] wordlist index save failed: {exc}")
+
+
+def _build_wordlist_index(files: List[Path]) -> Dict[str, object]:
     words: List[str] = []
     norms: List[str] = []
     try:
-        for raw_path in parts:
-            p = Path(raw_path)
-            if not p.exists():
-                continue
-            paths: List[Path]
-            if p.is_dir():
-                paths = sorted(p.glob("*.txt"))
-            else:
-                paths = [p]
-            for file_path in paths:
-                for line in file_path.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    words.append(line)
-                    norms.append(_normalize_word(line))
+        for file_path in files:
+            for line in file_path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                words.append(line)
+                norms.append(_normalize_word(line))
     except Exception:
         words = []
         norms = []
-    _WORDLIST_CACHE[key] = words
-    _WORDLIST_NORM_CACHE[key] = norms
     norms_ns = [norm.replace(" ", "") for norm in norms]
-    _WORDLIST_NORM_NS_CACHE[key] = norms_ns
-    _WORDLIST_PREFIX_CACHE[key] = _build_prefix_maps(norms_ns, _WORDLIST_PREFIX_MAX_LEN)
     token_index: Dict[str, List[int]] = {}
     norm_map: Dict[str, str] = {}
     for i, norm in enumerate(norms):
@@ -1576,9 +1634,73 @@ def _load_wordlist(path: Optional[str]) -> Tuple[List[str], List[str]]:
                 token_index[tok] = [i]
             else:
                 bucket.append(i)
-    _WORDLIST_TOKEN_INDEX_CACHE[key] = token_index
-    _WORDLIST_NORM_MAP_CACHE[key] = norm_map
-    return (words, norms)
+    return {
+        "words": words,
+        "norms": norms,
+        "norms_ns": norms_ns,
+        "trie": WordTrie(norms_ns, norms),
+        "token_index": token_index,
+        "norm_map": norm_map,
+        # The no-space index only serves best_ratio(), which needs no deletion variants.
+        "fuzzy": (FuzzyIndex(norms, _WORDLIST_FUZZY_MAX_DIST), FuzzyIndex(norms_ns, 0)),
+    }
+
+
+def _load_wordlist(path: Optional[str]) -> Tuple[List[str], List[str]]:
+    if not path:
+        return ([], [])
+    parts = _split_wordlist_paths(path)
+    if not parts:
+        return ([], [])
+    key = _wordlist_cache_key(path)
+    if key in _WORDLIST_FUZZY_CACHE:
+        return (_WORDLIST_CACHE[key], _WORDLIST_NORM_CACHE[key])
+    # Async OCR workers can ask for the same list at once; only one builds it.
+    with _WORDLIST_LOAD_LOCK:
+        if key in _WORDLIST_FUZZY_CACHE:
+            return (_WORDLIST_CACHE[key], _WORDLIST_NORM_CACHE[key])
+        return _load_wordlist_locked(key, parts)
+
+
+def _load_wordlist_locked(key: str, parts: List[str]) -> Tuple[List[str], List[str]]:
+    # _WORDLIST_FUZZY_CACHE is filled last: its key marks the whole entry as ready.
+    if not any(Path(raw_path).exists() for raw_path in parts):
+        _WORDLIST_CACHE[key] = []
+        _WORDLIST_NORM_CACHE[key] = []
+        _WORDLIST_NORM_NS_CACHE[key] = []
+        _WORDLIST_TRIE_CACHE[key] = WordTrie([], [])
+        _WORDLIST_TOKEN_INDEX_CACHE[key] = {}
+        _WORDLIST_NORM_MAP_CACHE[key] = {}
+        _WORDLIST_STAMP_CACHE[key] = ""
+        _WORDLIST_FUZZY_CACHE[key] = (FuzzyIndex([], 0), FuzzyIndex([], 0))
+        return ([], [])
+    # The compiled index is reused while every source file keeps its mtime and size.
+    files = _wordlist_files(parts)
+    index_file = _wordlist_index_file(parts, key)
+    try:
+        stamp = _wordlist_index_stamp(files)
+    except OSError:
+        stamp = None
+    index = _read_wordlist_index(index_file, stamp) if stamp is not None else None
+    if index is None:
+        index = _build_wordlist_index(files)
+        if stamp is not None and index["words"]:
+            index["stamp"] = stamp
+            _write_wordlist_index(index_file, index)
+    _WORDLIST_CACHE[key] = index["words"]
+    _WORDLIST_NORM_CACHE[key] = index["norms"]
+    _WORDLIST_NORM_NS_CACHE[key] = index["norms_ns"]
+    _WORDLIST_TRIE_CACHE[key] = index["trie"]
+    _WORDLIST_TOKEN_INDEX_CACHE[key] = index["token_index"]
+    _WORDLIST_NORM_MAP_CACHE[key] = index["norm_map"]
+    # Identifies this exact list content; corrections memoized against it go stale with it.
+    _WORDLIST_STAMP_CACHE[key] = (
+        hashlib.blake2b(repr(stamp).encode("utf-8"), digest_size=8).hexdigest()
+        if stamp is not None and index["words"]
+        else ""
+    )
+    _WORDLIST_FUZZY_CACHE[key] = index["fuzzy"]
+    return (index["words"], index["norms"])
 
 
 def _wordlist_path_for_side(cfg: OCRConfig, side: Optional[str]) -> Optional[str]:
@@ -1609,31 +1731,83 @@ def _should_use_wizard_wordlist(cfg: OCRConfig, side: Optional[str]) -> bool:
     return False
 
 
-def _levenshtein(a: str, b: str, max_dist: int) -> int:
-    if a == b:
-        return 0
-    if not a or not b:
-        return max(len(a), len(b))
-    if abs(len(a) - len(b)) > max_dist:
-        return max_dist + 1
-    prev = list(range(len(b) + 1))
-    for i, ca in enumerate(a, start=1):
-        cur = [i]
-        row_min = cur[0]
-        for j, cb in enumerate(b, start=1):
-            cost = 0 if ca == cb else 1
-            val = min(
-                prev[j] + 1,
-                cur[j - 1] + 1,
-                prev[j - 1] + cost,
-            )
-            cur.append(val)
-            if val < row_min:
-                row_min = val
-        if row_min > max_dist:
-            return max_dist + 1
-        prev = cur
-    return prev[-1]
+# Bump when the key layout or matcher behaviour changes; older files are ignored.
+_WORDLIST_CORRECTIONS_VERSION = 1
+_WORDLIST_CORRECTIONS = LRUCache(2048)
+_WORDLIST_CORRECTIONS_LOCK = threading.Lock()
+_WORDLIST_CORRECTIONS_FILE: Optional[Path] = None
+
+
+def _read_wordlist_corrections(path: Path) -> None:
+    if not path.is_file():
+        return
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict) or data.get("version") != _WORDLIST_CORRECTIONS_VERSION:
+        return
+    # Entries are stored least recently used first, so replaying them keeps the order.
+    for entry in data.get("entries", []):
+        if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], list):
+            _WORDLIST_CORRECTIONS.store(tuple(entry[0]), entry[1])
+
+
+def _wordlist_corrections_for(cfg: OCRConfig) -> Optional[LRUCache]:
+    """The shared correction memo sized for cfg (loading its saved table once), or None when off."""
+    global _WORDLIST_CORRECTIONS_FILE
+    if not cfg.wordlist_cache:
+        return None
+    if _WORDLIST_CORRECTIONS.max_entries != cfg.wordlist_cache_size:
+        _WORDLIST_CORRECTIONS.resize(cfg.wordlist_cache_size)
+    path = Path(cfg.wordlist_cache_path) if cfg.wordlist_cache_path else None
+    if path is not None and path != _WORDLIST_CORRECTIONS_FILE:
+        with _WORDLIST_CORRECTIONS_LOCK:
+            if path != _WORDLIST_CORRECTIONS_FILE:
+                _WORDLIST_CORRECTIONS_FILE = path
+                _read_wordlist_corrections(path)
+    return _WORDLIST_CORRECTIONS
+
+
+def _wordlist_correction_key(base: str, truncated: bool, cfg: OCRConfig) -> Optional[tuple]:
+    """Everything the correction depends on; None (no memo) when the wordlist is missing or unreadable."""
+    if not cfg.user_words_path:
+        return None
+    _load_wordlist(cfg.user_words_path)
+    stamp = _WORDLIST_STAMP_CACHE.get(_wordlist_cache_key(cfg.user_words_path))
+    if not stamp:
+        return None
+    return (
+        stamp,
+        truncated,
+        base,
+        cfg.wordlist_max_distance,
+        cfg.wordlist_min_ratio,
+        cfg.wordlist_prefix_min_ratio,
+        cfg.wordlist_prefix_min_chars,
+    )
+
+
+def wordlist_correction_stats() -> Dict[str, float]:
+    return _WORDLIST_CORRECTIONS.stats()
+
+
+def clear_wordlist_corrections() -> None:
+    _WORDLIST_CORRECTIONS.clear()
+
+
+def save_wordlist_corrections() -> None:
+    path = _WORDLIST_CORRECTIONS_FILE
+    if path is None:
+        return
+    entries = [[list(key), value] for key, value in _WORDLIST_CORRECTIONS.items()]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"version": _WORDLIST_CORRECTIONS_VERSION, "entries": entries}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"[ocr] wordlist corrections save failed: {exc}")
 
 
 def _apply_wordlist_correction_for_cfg(text: Optional[str], cfg: OCRConfig) -> Optional[str]:
@@ -1643,8 +1817,19 @@ def _apply_wordlist_correction_for_cfg(text: Optional[str], cfg: OCRConfig) -> O
     base = _normalize_ocr_input(text.replace("â€¦", "...").replace(".", " "))
     if not base:
         return text
+    # The match depends only on (base, truncated, wordlist, thresholds); misses are memoized as None.
+    cache = _wordlist_corrections_for(cfg)
+    key = _wordlist_correction_key(base, truncated, cfg) if cache is not None else None
+    if key is None:
+        match = _match_wordlist_correction(base, truncated, cfg)
+    else:
+        match = cache.cached(key, lambda: _match_wordlist_correction(base, truncated, cfg))
+    return match if match else text
+
+
+def _match_wordlist_correction(base: str, truncated: bool, cfg: OCRConfig) -> Optional[str]:
     base_norm = _normalize_word(base)
-    words, norms = _load_wordlist(cfg.user_words_path)
+    _, norms, _, _, token_index = _load_wordlist_index(cfg.user_words_path)
     if cfg.user_words_path:
         key = _wordlist_cache_key(cfg.user_words_path)
         norm_map = _WORDLIST_NORM_MAP_CACHE.get(key, {})
@@ -1655,7 +1840,7 @@ def _apply_wordlist_correction_for_cfg(text: Optional[str], cfg: OCRConfig) -> O
     base_first_token = base_tokens[0] if base_tokens else ""
     has_any_exact_first = False
     if base_first_token and norms:
-        has_any_exact_first = any(base_first_token in norm.split() for norm in norms)
+        has_any_exact_first = base_first_token in token_index
 
     def _accept_match(match_word: Optional[str]) -> bool:
         if not match_word:
@@ -1674,8 +1859,7 @@ def _apply_wordlist_correction_for_cfg(text: Optional[str], cfg: OCRConfig) -> O
         match = _best_wordlist_match_from_candidates(base, candidates, cfg, truncated=truncated)
         if match and _accept_match(match):
             return match
-    fallback = _best_wordlist_fallback(base_norm, cfg)
-    return fallback if fallback else text
+    return _best_wordlist_fallback(base_norm, cfg)
 
 
 def _is_confident_wordlist_match(base_norm: str, corrected: Optional[str], cfg: OCRConfig) -> bool:
@@ -1760,11 +1944,48 @@ def _easyocr_text(
 
     allowlist = whitelist if whitelist else None
     try:
-        return read_text(prepped, cfg, allowlist=allowlist)
+        return read_text(prepped, cfg, allowlist=allowlist, recognize_only=cfg.easyocr_recognize_only_text)
     except Exception:
         return None
 
 
+_VARIANTS = VariantScheduler()
+
+
+def _variant_order(cfg: OCRConfig, contexts: Sequence[Tuple[str, ...]], names: Sequence[str]) -> List[int]:
+    """Attempt order for these variants: learned when adaptive_variants is on, else as listed."""
+    if not cfg.adaptive_variants or not contexts:
+        return list(range(len(names)))
+    _VARIANTS.configure(path=cfg.variant_stats_path)
+    return _VARIANTS.order(contexts, names)
+
+
+def _record_variant(cfg: OCRConfig, context: Optional[Tuple[str, ...]], winner: Optional[str], passes: int) -> None:
+    if cfg.adaptive_variants and context is not None:
+        _VARIANTS.record(context, winner, passes)
+
+
+def _name_variant_name(key: Tuple[bool, Optional[bool], str, bool, bool], cfg: OCRConfig) -> str:
+    name_mode, invert, whitelist, clahe, prefer_red = key
+    parts = ["name" if name_mode else "easy"]
+    if invert is not None:
+        parts.append("inv" if invert else "noinv")
+    parts.append("wl" if whitelist == cfg.name_whitelist else ("nowl" if not whitelist else "wl2"))
+    if clahe:
+        parts.append("clahe")
+    if prefer_red:
+        parts.append("red")
+    return "_".join(parts)
+
+
+def ocr_variant_stats() -> Dict[str, Dict[str, float]]:
+    return _VARIANTS.stats()
+
+
+def save_ocr_variant_stats() -> None:
+    _VARIANTS.save()
+
+
 @dataclass
 class _NameWorkItem:
     key: Tuple[str, int]
@@ -1778,40 +1999,7 @@ class _NameWorkItem:
     preprocess_ms: float = 0.0
     ocr_share_ms: float = 0.0
     resolve_ms: float = 0.0
-
-
-def _pad_batch_images(imgs: List[np.ndarray]) -> List[np.ndarray]:
-    if not imgs:
-        return imgs
-    fixed: List[np.ndarray] = []
-    max_h = 0
-    max_w = 0
-    for img in imgs:
-        if not isinstance(img, np.ndarray) or img.size == 0:
-            continue
-        h, w = img.shape[:2]
-        max_h = max(max_h, h)
-        max_w = max(max_w, w)
-    if max_h == 0 or max_w == 0:
-        return imgs
-    for img in imgs:
-        if not isinstance(img, np.ndarray) or img.size == 0:
-            fixed.append(np.full((max_h, max_w), 255, dtype=np.uint8))
-            continue
-        h, w = img.shape[:2]
-        pad_h = max_h - h
-        pad_w = max_w - w
-        top = pad_h // 2
-        bottom = pad_h - top
-        left = pad_w // 2
-        right = pad_w - left
-        if img.ndim == 2:
-            fixed.append(cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=255))
-        else:
-            channels = img.shape[2]
-            value = tuple([255] * channels)
-            fixed.append(cv2.copyMakeBorder(img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=value))
-    return fixed
+    passes: int = 0
 
 
 def _batch_easyocr_names(
@@ -1820,6 +2008,7 @@ def _batch_easyocr_names(
     *,
     debug_dump: bool,
     debug_dump_limit: int,
+    aspect_key: Optional[str] = None,
 ) -> Dict[Tuple[str, int], Tuple[Optional[str], Optional[str], Optional[float], Optional[Tuple[float, float, float, float]]]]:
     if not items:
         return {}
@@ -1832,6 +2021,17 @@ def _batch_easyocr_names(
             _EASYOCR_WARNED = True
         return {}
 
+    cache_keys = {item.key: _ocr_cache_key("name", item.crop, cfg, "easyocr_batch") for item in items}
+    ocr_items: List[_NameWorkItem] = []
+    for item in items:
+        cache_key = cache_keys[item.key]
+        hit, cached_raw = _ocr_cache_lookup(cache_key) if cache_key is not None else (False, None)
+        if hit:
+            item.raw = cached_raw
+            item.end_time = time.perf_counter()
+        else:
+            ocr_items.append(item)
+
     attempts = [
         {"name_mode": True, "invert": None, "whitelist": cfg.name_whitelist, "clahe": True, "prefer_red": False},
         {"name_mode": True, "invert": True, "whitelist": cfg.name_whitelist, "clahe": True, "prefer_red": False},
@@ -1853,6 +2053,12 @@ def _batch_easyocr_names(
     variant_keys: List[Tuple[bool, Optional[bool], str, bool, bool]] = []
     for att in deduped:
         variant_keys.append((att["name_mode"], att["invert"], att["whitelist"], att["clahe"], att["prefer_red"]))
+    variant_names = [_name_variant_name(key, cfg) for key in variant_keys]
+    contexts = sorted({("name", item.key[0], aspect_key or "any") for item in ocr_items})
+    order = _variant_order(cfg, contexts, variant_names)
+    deduped = [deduped[i] for i in order]
+    variant_keys = [variant_keys[i] for i in order]
+    variant_names = [variant_names[i] for i in order]
 
     prepped_cache: Dict[Tuple[str, int], Dict[Tuple[bool, Optional[bool], str, bool, bool], np.ndarray]] = {}
 
@@ -1877,7 +2083,7 @@ def _batch_easyocr_names(
         return prepped
 
     for attempt_idx, (att, key) in enumerate(zip(deduped, variant_keys)):
-        pending = [item for item in items if item.raw is None]
+        pending = [item for item in ocr_items if item.raw is None]
         if not pending:
             break
         prepped_imgs: List[np.ndarray] = []
@@ -1899,21 +2105,27 @@ def _batch_easyocr_names(
                     cv2.imwrite(str(prep_path), prepped)
                 except Exception:
                     pass
-        prepped_imgs = _pad_batch_images(prepped_imgs)
         ocr_start = time.perf_counter()
-        texts = read_text_batch(prepped_imgs, cfg, allowlist=att["whitelist"])
+        texts = read_text_batch(
+            prepped_imgs,
+            cfg,
+            allowlist=att["whitelist"],
+            recognize_only=cfg.easyocr_recognize_only_names,
+        )
         ocr_ms = (time.perf_counter() - ocr_start) * 1000.0
         if pending:
             ocr_share = ocr_ms / len(pending)
             for item in pending:
                 item.ocr_share_ms += ocr_share
         for item, text in zip(pending, texts):
+            item.passes += 1
             if text:
                 item.raw = text
                 item.end_time = time.perf_counter()
+                _record_variant(cfg, ("name", item.key[0], aspect_key or "any"), variant_names[attempt_idx], item.passes)
 
         if attempt_idx == 0:
-            pending_after = [item for item in items if item.raw is None]
+            pending_after = [item for item in ocr_items if item.raw is None]
             if pending_after:
                 for item in pending_after:
                     cache = prepped_cache.setdefault(item.key, {})
@@ -1922,6 +2134,13 @@ def _batch_easyocr_names(
                             continue
                         cache[later_key] = _prep_for_variant(item, later_key)
 
+    for item in ocr_items:
+        if item.raw is None:
+            _record_variant(cfg, ("name", item.key[0], aspect_key or "any"), None, item.passes)
+        cache_key = cache_keys[item.key]
+        if cache_key is not None:
+            _OCR_RESULT_CACHE.store(cache_key, item.raw)
+
     end_all = time.perf_counter()
     results: Dict[Tuple[str, int], Tuple[Optional[str], Optional[str], Optional[float], Optional[Tuple[float, float, float, float]]]] = {}
     for item in items:
@@ -1933,9 +2152,44 @@ def _batch_easyocr_names(
         elapsed_ms = item.capture_ms + item.preprocess_ms + item.ocr_share_ms + item.resolve_ms
         parts = (item.capture_ms, item.preprocess_ms, item.ocr_share_ms, item.resolve_ms)
         results[item.key] = (item.raw, final, elapsed_ms, parts)
+        if PROFILER.active():
+            stage = f"participants.{item.key[0]}_{item.key[1]}.name"
+            PROFILER.record(f"{stage}.capture", item.capture_ms)
+            PROFILER.record(f"{stage}.preprocess", item.preprocess_ms)
+            PROFILER.record(f"{stage}.ocr_share", item.ocr_share_ms)
+            PROFILER.record(f"{stage}.resolve", item.resolve_ms)
+            PROFILER.record(stage, elapsed_ms)
     return results
 
 
+def _prep_tesseract_text(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    invert: bool,
+    prefer_red: bool = False,
+    clahe: bool = False,
+) -> np.ndarray:
+    if prefer_red:
+        hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
+        lower1 = np.array([0, 120, 80])
+        upper1 = np.array([10, 255, 255])
+        lower2 = np.array([170, 120, 80])
+        upper2 = np.array([179, 255, 255])
+        mask1 = cv2.inRange(hsv, lower1, upper1)
+        mask2 = cv2.inRange(hsv, lower2, upper2)
+        mask = cv2.bitwise_or(mask1, mask2)
+        gray = cv2.bitwise_and(hsv[:, :, 2], hsv[:, :, 2], mask=mask)
+    else:
+        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+
+    if clahe:
+        clahe_op = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        gray = clahe_op.apply(gray)
+
+    return _prep_ocr(gray, cfg.scale, invert)
+
+
 def _ocr_text(
     img_bgr: np.ndarray,
     cfg: OCRConfig,
@@ -1968,33 +2222,14 @@ def _ocr_text(
             debug_dump_id=debug_dump_id,
             debug_dump_limit=debug_dump_limit,
         )
-    if pytesseract is None or img_bgr.size == 0:
+    if not tess.available() or img_bgr.size == 0:
         return None
-    if cfg.tesseract_cmd:
-        pytesseract.pytesseract.tesseract_cmd = cfg.tesseract_cmd
 
     invert = cfg.invert if invert_override is None else invert_override
     if name_mode:
         prepped = _prep_ocr_name(img_bgr, cfg.scale, invert)
     else:
-        if prefer_red:
-            hsv = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2HSV)
-            lower1 = np.array([0, 120, 80])
-            upper1 = np.array([10, 255, 255])
-            lower2 = np.array([170, 120, 80])
-            upper2 = np.array([179, 255, 255])
-            mask1 = cv2.inRange(hsv, lower1, upper1)
-            mask2 = cv2.inRange(hsv, lower2, upper2)
-            mask = cv2.bitwise_or(mask1, mask2)
-            gray = cv2.bitwise_and(hsv[:, :, 2], hsv[:, :, 2], mask=mask)
-        else:
-            gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-
-        if clahe:
-            clahe_op = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            gray = clahe_op.apply(gray)
-
-        prepped = _prep_ocr(gray, cfg.scale, invert)
+        prepped = _prep_tesseract_text(img_bgr, cfg, invert=invert, prefer_red=prefer_red, clahe=clahe)
     if debug_dump and debug_tag and _allow_ocr_dump(debug_dump_id, debug_dump_limit):
         try:
             stamp = f"{int(time.time() * 1000)}"
@@ -2005,23 +2240,21 @@ def _ocr_text(
         except Exception:
             pass
     psm = cfg.psm if psm_override is None else psm_override
-    config = f"--oem {cfg.oem} --psm {psm}"
-    if name_mode:
-        config += " -c user_defined_dpi=300"
-        if cfg.user_words_path:
-            user_words_path = Path(cfg.user_words_path)
-            if user_words_path.is_file():
-                user_words = str(user_words_path)
-                config += f" --user-words \"{user_words}\""
-    if whitelist:
-        config += f" -c tessedit_char_whitelist={whitelist}"
-    if blacklist:
-        config += f" -c tessedit_char_blacklist={blacklist}"
     try:
         ocr_img = prepped
         if name_mode:
             ocr_img = _crop_to_foreground(ocr_img, pad=6)
-        text = pytesseract.image_to_string(ocr_img, lang=cfg.lang, config=config)
+        text = tess.image_to_string(
+            ocr_img,
+            lang=cfg.lang,
+            oem=cfg.oem,
+            psm=psm,
+            whitelist=whitelist or None,
+            blacklist=blacklist or None,
+            dpi=300 if name_mode else None,
+            user_words=cfg.user_words_path if name_mode else None,
+            tesseract_cmd=cfg.tesseract_cmd,
+        )
     except Exception:
         return None
     text = text.strip().replace("\n", " ").strip()
@@ -2124,7 +2357,111 @@ def _normalize_health_pair(cur: Optional[int], maxv: Optional[int]) -> Tuple[Opt
     return (cur, maxv)
 
 
-def _easyocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+# EasyOCR health preprocessing variants (invert, clahe, binarize), in priority order.
+_EASYOCR_HEALTH_ATTEMPTS: Tuple[Tuple[bool, bool, bool], ...] = (
+    (False, True, False),
+    (True, True, False),
+    (False, True, True),
+    (True, True, True),
+    (False, False, False),
+    (True, False, False),
+)
+
+
+def _easy_health_variant_name(attempt: Tuple[bool, bool, bool]) -> str:
+    invert, clahe, binarize = attempt
+    return "_".join(["inv" if invert else "noinv"] + (["clahe"] if clahe else []) + (["bin"] if binarize else []))
+
+
+def _health_variant_context(field: str, variant_context: Optional[Tuple[str, str]]) -> Optional[Tuple[str, str, str]]:
+    # variant_context is (side, aspect bucket) of the slot being read.
+    return (field, variant_context[0], variant_context[1]) if variant_context is not None else None
+
+
+def _parse_easyocr_health_text(text: str) -> Tuple[Optional[int], Optional[int]]:
+    cur, maxv = _parse_health(text)
+    if cur is not None or maxv is not None:
+        return (cur, maxv)
+    nums = _HEALTH_NUM_RE.findall(text or "")
+    if len(nums) >= 2:
+        return (int(nums[0]), int(nums[1]))
+    if len(nums) == 1:
+        return (int(nums[0]), None)
+    return (None, None)
+
+
+def _batch_easyocr_health(
+    crops: Dict[Tuple[str, int], np.ndarray],
+    cfg: OCRConfig,
+    *,
+    aspect_key: Optional[str] = None,
+) -> Dict[Tuple[str, int], Tuple[Optional[int], Optional[int], Optional[str]]]:
+    """
+    The first EasyOCR health variant for every slot in one batched read. Only
+    complete cur/max pairs are returned; the other slots run the full cascade in
+    _easyocr_health as before.
+    """
+    if not crops:
+        return {}
+    try:
+        from ocr_easy.adapter import read_text_batch
+    except Exception:
+        return {}
+    variant_names = [_easy_health_variant_name(att) for att in _EASYOCR_HEALTH_ATTEMPTS]
+    contexts = sorted({("health_easy", side, aspect_key or "any") for side, _ in crops})
+    first = _variant_order(cfg, contexts, variant_names)[0]
+    invert, clahe, binarize = _EASYOCR_HEALTH_ATTEMPTS[first]
+    keys = list(crops)
+    prepped = [
+        _prep_easyocr_image(crops[key], cfg, invert=invert, prefer_red=True, clahe=clahe, binarize=binarize)
+        for key in keys
+    ]
+    texts = read_text_batch(prepped, cfg, allowlist="0123456789/,", recognize_only=cfg.easyocr_recognize_only_health)
+    out: Dict[Tuple[str, int], Tuple[Optional[int], Optional[int], Optional[str]]] = {}
+    for key, text in zip(keys, texts):
+        text = (text or "").replace(",", "")
+        cur, maxv = _parse_easyocr_health_text(text)
+        if cur is not None and maxv is not None:
+            out[key] = (cur, maxv, text)
+            _record_variant(cfg, ("health_easy", key[0], aspect_key or "any"), variant_names[first], 1)
+    return out
+
+
+def _wants_health_prefetch(img_bgr: np.ndarray, cfg: OCRConfig) -> bool:
+    """False when _ocr_health would answer without OCR (cached read or a complete glyph read)."""
+    if img_bgr.size == 0:
+        return False
+    key = _ocr_cache_key("health", img_bgr, cfg, None)
+    if key is not None and key in _OCR_RESULT_CACHE:
+        return False
+    if _use_glyphs(cfg):
+        mask = _prep_tesseract_health(img_bgr, cfg, invert=False)
+        if _candidate_complete(_health_candidate(GLYPHS.read(f"health_h{img_bgr.shape[0]}", mask))):
+            return False
+    return True
+
+
+def _easyocr_health(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    variant_context: Optional[Tuple[str, str]] = None,
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    return _ocr_cached(
+        "easyocr_health",
+        img_bgr,
+        cfg,
+        None,
+        lambda: _easyocr_health_uncached(img_bgr, cfg, variant_context=variant_context),
+    )
+
+
+def _easyocr_health_uncached(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    variant_context: Optional[Tuple[str, str]] = None,
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
     if img_bgr.size == 0:
         return (None, None, None)
     try:
@@ -2133,7 +2470,12 @@ def _easyocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int],
         return (None, None, None)
 
     def _read_combined(prepped: np.ndarray) -> str:
-        results = read_text_with_boxes(prepped, cfg, allowlist="0123456789/,")
+        results = read_text_with_boxes(
+            prepped,
+            cfg,
+            allowlist="0123456789/,",
+            recognize_only=cfg.easyocr_recognize_only_health,
+        )
         if results:
             def _x_min(bbox: List[Tuple[float, float]]) -> float:
                 return min((pt[0] for pt in bbox), default=0.0)
@@ -2145,32 +2487,17 @@ def _easyocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int],
                     parts.append(cleaned)
             if parts:
                 return " ".join(parts)
-        return read_text(prepped, cfg, allowlist="0123456789/,") or ""
-
-    def _parse_text(text: str) -> Tuple[Optional[int], Optional[int]]:
-        cur, maxv = _parse_health(text)
-        if cur is not None or maxv is not None:
-            return (cur, maxv)
-        nums = _HEALTH_NUM_RE.findall(text or "")
-        if len(nums) >= 2:
-            return (int(nums[0]), int(nums[1]))
-        if len(nums) == 1:
-            return (int(nums[0]), None)
-        return (None, None)
+        return read_text(prepped, cfg, allowlist="0123456789/,", recognize_only=cfg.easyocr_recognize_only_health) or ""
 
     best_cur = None
     best_max = None
     best_text = None
 
-    attempts = [
-        (False, True, False),
-        (True, True, False),
-        (False, True, True),
-        (True, True, True),
-        (False, False, False),
-        (True, False, False),
-    ]
-    for invert, clahe, binarize in attempts:
+    context = _health_variant_context("health_easy", variant_context)
+    variant_names = [_easy_health_variant_name(att) for att in _EASYOCR_HEALTH_ATTEMPTS]
+    order = _variant_order(cfg, [context] if context else [], variant_names)
+    for passes, idx in enumerate(order, start=1):
+        invert, clahe, binarize = _EASYOCR_HEALTH_ATTEMPTS[idx]
         prepped = _prep_easyocr_image(
             img_bgr,
             cfg,
@@ -2180,7 +2507,7 @@ def _easyocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int],
             binarize=binarize,
         )
         text = _read_combined(prepped)
-        cur, maxv = _parse_text(text)
+        cur, maxv = _parse_easyocr_health_text(text)
         if cur is not None:
             best_cur = cur
             best_text = text
@@ -2188,71 +2515,281 @@ def _easyocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int],
             best_max = maxv
             best_text = text
         if cur is not None and maxv is not None:
+            _record_variant(cfg, context, variant_names[idx], passes)
             return (cur, maxv, text or None)
 
+    _record_variant(cfg, context, None, len(order))
     if best_cur is not None or best_max is not None:
         return (best_cur, best_max, best_text)
     return (None, None, None)
 
 
-def _ocr_health(img_bgr: np.ndarray, cfg: OCRConfig) -> Tuple[Optional[int], Optional[int], Optional[str]]:
-    candidates: List[Tuple[int, Optional[int], Optional[int], Optional[str]]] = []
+def _ocr_health(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    prefetch: Optional[Tuple[Optional[int], Optional[int], Optional[str]]] = None,
+    variant_context: Optional[Tuple[str, str]] = None,
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    return _ocr_cached(
+        "health",
+        img_bgr,
+        cfg,
+        None,
+        lambda: _ocr_health_uncached(
+            img_bgr,
+            cfg,
+            prefetch=prefetch,
+            variant_context=variant_context,
+        ),
+    )
+
+
+# Tesseract health variants, in priority order; all use the red text mask and psm 7.
+_HEALTH_OCR_VARIANTS: Tuple[Dict[str, bool], ...] = (
+    {"clahe": True},
+    {"clahe": True, "invert_override": True},
+    {"invert_override": True},
+    {},
+)
+_HEALTH_ATTEMPTS = AttemptExecutor(workers=4)
+
+
+def _health_variant_name(variant: Dict[str, bool]) -> str:
+    return "_".join(key.replace("_override", "") for key, on in sorted(variant.items()) if on) or "plain"
+
+_HealthCandidate = Tuple[int, Optional[int], Optional[int], Optional[str]]
+
+
+def _health_pair_complete(cur: Optional[int], maxv: Optional[int]) -> bool:
+    """
+    A plausible cur/max pair (no _health_score penalties). Health reads accept the
+    first such pair; a later variant reading more digits could still score higher.
+    """
+    if cur is None or maxv is None:
+        return False
+    return maxv >= cur and abs(len(str(maxv)) - len(str(cur))) <= 1
+
+
+def _health_candidate(text: Optional[str]) -> Optional[_HealthCandidate]:
+    if not text:
+        return None
+    cur, maxv = _parse_health(text)
+    cur, maxv = _normalize_health_pair(cur, maxv)
+    if cur is None and maxv is None:
+        return None
+    return (_health_score(cur, maxv), cur, maxv, text.strip())
+
+
+def _candidate_complete(candidate: Optional[_HealthCandidate]) -> bool:
+    return candidate is not None and _health_pair_complete(candidate[1], candidate[2])
 
-    def _try(text: Optional[str]) -> None:
-        if not text:
-            return
-        cur, maxv = _parse_health(text)
-        cur, maxv = _normalize_health_pair(cur, maxv)
-        if cur is None and maxv is None:
-            return
-        candidates.append((_health_score(cur, maxv), cur, maxv, text.strip()))
+
+def _use_glyphs(cfg: OCRConfig) -> bool:
+    if not cfg.glyph_fast_path:
+        return False
+    GLYPHS.configure(store_dir=cfg.glyph_store_dir, max_distance=cfg.glyph_max_distance)
+    return True
+
+
+def save_glyph_models() -> None:
+    GLYPHS.save_all()
+
+
+def _ocr_health_uncached(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    prefetch: Optional[Tuple[Optional[int], Optional[int], Optional[str]]] = None,
+    variant_context: Optional[Tuple[str, str]] = None,
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """
+    prefetch is this crop's read from a batched pass (EasyOCR batch or Tesseract
+    montage) and is used when it is a complete pair. variant_context is the slot's
+    (side, aspect bucket), used to order preprocessing variants.
+    """
+    candidates: List[_HealthCandidate] = []
+    # Every (cur, max) read from this crop; the glyph model only learns a pair two reads agree on.
+    pairs: List[Tuple[Optional[int], Optional[int]]] = []
+
+    glyph_mask = None
+    glyph_key = f"health_h{img_bgr.shape[0]}"
+    if img_bgr.size > 0 and _use_glyphs(cfg):
+        glyph_mask = _prep_tesseract_health(img_bgr, cfg, invert=False)
+        candidate = _health_candidate(GLYPHS.read(glyph_key, glyph_mask))
+        if _candidate_complete(candidate):
+            return (candidate[1], candidate[2], candidate[3])
+        if candidate is not None:
+            pairs.append((candidate[1], candidate[2]))
+
+    if prefetch is not None:
+        pre_cur, pre_max = _normalize_health_pair(prefetch[0], prefetch[1])
+        if _health_pair_complete(pre_cur, pre_max):
+            return (pre_cur, pre_max, prefetch[2])
+        if pre_cur is not None or pre_max is not None:
+            pairs.append((pre_cur, pre_max))
 
     if cfg.backend == "easyocr":
-        easy_cur, easy_max, easy_text = _easyocr_health(img_bgr, cfg)
+        # EasyOCR shares one reader and stays sequential; it has its own early exit.
+        easy_cur, easy_max, easy_text = _easyocr_health(img_bgr, cfg, variant_context=variant_context)
         easy_cur, easy_max = _normalize_health_pair(easy_cur, easy_max)
         if easy_cur is not None or easy_max is not None:
             candidates.append((_health_score(easy_cur, easy_max), easy_cur, easy_max, easy_text))
+            pairs.append((easy_cur, easy_max))
+            if _health_pair_complete(easy_cur, easy_max):
+                return (easy_cur, easy_max, easy_text)
+
+    if _HEALTH_ATTEMPTS.workers != cfg.attempt_workers:
+        _HEALTH_ATTEMPTS.resize(cfg.attempt_workers)
+    context = _health_variant_context("health", variant_context)
+    variant_names = [_health_variant_name(variant) for variant in _HEALTH_OCR_VARIANTS]
+    order = _variant_order(cfg, [context] if context else [], variant_names)
+    attempts = [
+        (lambda variant=_HEALTH_OCR_VARIANTS[idx]: _health_candidate(
+            _ocr_text(img_bgr, cfg, cfg.health_whitelist, prefer_red=True, psm_override=7, **variant)
+        ))
+        for idx in order
+    ]
 
-    _try(_ocr_text(img_bgr, cfg, cfg.health_whitelist, prefer_red=True, clahe=True, psm_override=7))
-    _try(
-        _ocr_text(
-            img_bgr,
-            cfg,
-            cfg.health_whitelist,
-            prefer_red=True,
-            clahe=True,
-            invert_override=True,
-            psm_override=7,
-        )
-    )
-    _try(
-        _ocr_text(
-            img_bgr,
-            cfg,
-            cfg.health_whitelist,
-            prefer_red=True,
-            invert_override=True,
-            psm_override=7,
-        )
-    )
-    _try(_ocr_text(img_bgr, cfg, cfg.health_whitelist, prefer_red=True, psm_override=7))
+    def _accept(candidate: Optional[_HealthCandidate]) -> bool:
+        if candidate is None:
+            return False
+        pair = (candidate[1], candidate[2])
+        agreed = pair in pairs
+        pairs.append(pair)
+        # While the glyph model is learning, keep reading until a second variant confirms the pair.
+        return _candidate_complete(candidate) and (glyph_mask is None or agreed)
+
+    results = _HEALTH_ATTEMPTS.run(attempts, _accept, parallel=cfg.health_parallel)
+    candidates.extend(c for c in results if c is not None)
+    passes = next((i + 1 for i, c in enumerate(results) if _candidate_complete(c)), None)
+    winner = variant_names[order[passes - 1]] if passes is not None else None
+    _record_variant(cfg, context, winner, passes or len(results))
 
     best = max(candidates, key=lambda item: item[0], default=None)
     if best is None:
         return (None, None, None)
+    if (
+        glyph_mask is not None
+        and best[3]
+        and _health_pair_complete(best[1], best[2])
+        and pairs.count((best[1], best[2])) >= 2
+    ):
+        # Only teach the glyph model reads whose text parses back to the pair as-is.
+        expected = _normalize_health_text(best[3])
+        if _parse_health(expected) == (best[1], best[2]):
+            GLYPHS.learn(glyph_key, glyph_mask, expected)
     return (best[1], best[2], best[3])
 
 
+def _ocr_health_montage(
+    crops: Dict[Tuple[str, int], np.ndarray],
+    cfg: OCRConfig,
+    *,
+    aspect_key: Optional[str] = None,
+) -> Dict[Tuple[str, int], Tuple[Optional[int], Optional[int], Optional[str]]]:
+    """
+    Every slot's health in one Tesseract pass: the preprocessed crops are stacked
+    into one page separated by blank bands, read with psm 6, and each recognised
+    line is mapped back to the crop whose band holds its centre. Only complete pairs
+    from bands with exactly one line are returned; other slots fall back to _ocr_health.
+    """
+    keys = [key for key, crop in crops.items() if crop.size > 0]
+    if len(keys) < 2 or not tess.available():
+        return {}
+    variant_names = [_health_variant_name(variant) for variant in _HEALTH_OCR_VARIANTS]
+    contexts = sorted({("health", side, aspect_key or "any") for side, _ in keys})
+    first = _variant_order(cfg, contexts, variant_names)[0]
+    variant = _HEALTH_OCR_VARIANTS[first]
+    prepped = [
+        _ensure_black_text_on_white(
+            _prep_tesseract_text(
+                crops[key],
+                cfg,
+                invert=variant.get("invert_override", cfg.invert),
+                prefer_red=True,
+                clahe=variant.get("clahe", False),
+            )
+        )
+        for key in keys
+    ]
+    gap = max(8, max(img.shape[0] for img in prepped) // 2)
+    width = max(img.shape[1] for img in prepped) + 2 * gap
+    height = sum(img.shape[0] for img in prepped) + gap * (len(prepped) + 1)
+    page = np.full((height, width), 255, dtype=np.uint8)
+    bands: List[Tuple[int, int]] = []
+    y = gap
+    for img in prepped:
+        h, w = img.shape[:2]
+        page[y:y + h, gap:gap + w] = img
+        bands.append((y - gap // 2, y + h + gap // 2))
+        y += h + gap
+    try:
+        lines = tess.image_to_lines(
+            page,
+            lang=cfg.lang,
+            oem=cfg.oem,
+            psm=6,
+            whitelist=cfg.health_whitelist or None,
+            tesseract_cmd=cfg.tesseract_cmd,
+        )
+    except Exception:
+        return {}
+    band_lines: Dict[int, List[str]] = {}
+    for top, bottom, text in lines:
+        center = (top + bottom) * 0.5
+        for i, (band_top, band_bottom) in enumerate(bands):
+            if band_top <= center < band_bottom:
+                band_lines.setdefault(i, []).append(text)
+                break
+    out: Dict[Tuple[str, int], Tuple[Optional[int], Optional[int], Optional[str]]] = {}
+    for i, key in enumerate(keys):
+        texts = band_lines.get(i, [])
+        if len(texts) != 1:
+            continue
+        candidate = _health_candidate(texts[0])
+        if _candidate_complete(candidate):
+            out[key] = (candidate[1], candidate[2], candidate[3])
+            _record_variant(cfg, ("health", key[0], aspect_key or "any"), variant_names[first], 1)
+    return out
+
+
 def _ocr_yellow_numeric_text(
     img_bgr: np.ndarray,
     cfg: OCRConfig,
     *,
     strict_mask: bool = False,
 ) -> Optional[str]:
-    if pytesseract is None or img_bgr.size == 0:
+    return _ocr_cached(
+        "hud_numeric",
+        img_bgr,
+        cfg,
+        strict_mask,
+        lambda: _ocr_yellow_numeric_text_uncached(img_bgr, cfg, strict_mask=strict_mask),
+    )
+
+
+def _ocr_yellow_numeric_text_uncached(
+    img_bgr: np.ndarray,
+    cfg: OCRConfig,
+    *,
+    strict_mask: bool = False,
+) -> Optional[str]:
+    if img_bgr.size == 0:
+        return None
+    glyph_mask = None
+    glyph_key = f"hud_{'strict' if strict_mask else 'loose'}_h{img_bgr.shape[0]}"
+    # Every read of this crop, whitespace removed; the glyph model only learns text two reads agree on.
+    reads: List[str] = []
+    if _use_glyphs(cfg):
+        glyph_mask = _prep_tesseract_yellow_numeric(img_bgr, cfg, invert=True, strict=strict_mask)
+        glyph_text = GLYPHS.read(glyph_key, glyph_mask)
+        if glyph_text and _parse_resource_numbers(glyph_text)[0] is not None:
+            return glyph_text
+        if glyph_text:
+            reads.append(glyph_text)
+    if not tess.available():
         return None
-    if cfg.tesseract_cmd:
-        pytesseract.pytesseract.tesseract_cmd = cfg.tesseract_cmd
     whitelist = cfg.player_resource_whitelist or "0123456789"
     attempts = [
         (False, 7),
@@ -2264,18 +2801,32 @@ def _ocr_yellow_numeric_text(
     best_score = -1
     for invert, psm in attempts:
         prepped = _prep_tesseract_yellow_numeric(img_bgr, cfg, invert=invert, strict=strict_mask)
-        config = f"--oem {cfg.oem} --psm {psm} -c tessedit_char_whitelist={whitelist}"
         try:
-            text = pytesseract.image_to_string(prepped, lang=cfg.lang, config=config)
+            text = tess.image_to_string(
+                prepped,
+                lang=cfg.lang,
+                oem=cfg.oem,
+                psm=psm,
+                whitelist=whitelist,
+                tesseract_cmd=cfg.tesseract_cmd,
+            )
         except Exception:
             text = ""
         text = text.strip().replace("\n", " ").strip()
         if not text:
             continue
+        reads.append("".join(text.split()))
         score = (len(_HEALTH_NUM_RE.findall(text)) * 10) + len(text)
         if score > best_score:
             best_text = text
             best_score = score
+    if (
+        glyph_mask is not None
+        and best_text
+        and _parse_resource_numbers(best_text)[0] is not None
+        and reads.count("".join(best_text.split())) >= 2
+    ):
+        GLYPHS.learn(glyph_key, glyph_mask, best_text)
     return best_text
 
 
@@ -2309,6 +2860,8 @@ def extract_player_wizard_state(
     scan_health: bool = True,
     scan_mana: bool = True,
     scan_energy: bool = False,
+    ocr_jobs: Optional[OCRJobService] = None,
+    poll_only: bool = False,
 ) -> PlayerWizardState:
     carry = previous if previous is not None else PlayerWizardState()
     health_crop = crop_relative(frame_bgr, hud_profile.health_roi) if scan_health else None
@@ -2345,15 +2898,40 @@ def extract_player_wizard_state(
         except Exception:
             pass
 
-    if scan_health and health_crop is not None and health_crop.size > 0:
-        health_raw = _ocr_yellow_numeric_text(health_crop, ocr_cfg, strict_mask=False)
+    def _read_hud(field: str, crop: Optional[np.ndarray], strict_mask: bool) -> Tuple[bool, Optional[str]]:
+        """
+        (scanned, raw): inline OCR, or with ocr_jobs a finished background read (queued on
+        request). poll_only takes finished reads without queueing new ones.
+        """
+        if ocr_jobs is None:
+            if crop is None or crop.size == 0:
+                return False, None
+            return True, _ocr_yellow_numeric_text(crop, ocr_cfg, strict_mask=strict_mask)
+        done, raw = ocr_jobs.take(("hud", field))
+        if done:
+            return True, raw
+        if (not poll_only) and crop is not None and crop.size > 0:
+            job_crop = crop.copy()
+            ocr_jobs.submit(
+                ("hud", field),
+                lambda: _ocr_yellow_numeric_text(job_crop, ocr_cfg, strict_mask=strict_mask),
+            )
+        return False, None
+
+    health_scanned, health_raw = _read_hud("health", health_crop, False)
+    mana_scanned, mana_raw = _read_hud("mana", mana_crop, False)
+    energy_scanned, energy_raw = _read_hud("energy", energy_crop, True)
+    if ocr_jobs is not None:
+        # A queued read carries the previous value, like a frame that skipped the scan.
+        scan_health = health_scanned
+
+    if health_scanned:
         hud_cur, hud_max = _parse_resource_numbers(health_raw)
     else:
         health_raw = carry.health_raw
         hud_cur, hud_max = (carry.health_current, carry.health_max)
 
-    if scan_mana and mana_crop is not None and mana_crop.size > 0:
-        mana_raw = _ocr_yellow_numeric_text(mana_crop, ocr_cfg, strict_mask=False)
+    if mana_scanned:
         mana_cur, mana_max = _parse_resource_numbers(mana_raw)
     else:
         mana_raw = carry.mana_raw
@@ -2365,8 +2943,7 @@ def extract_player_wizard_state(
     if (not mana_raw) and carry.mana_raw:
         mana_raw = carry.mana_raw
 
-    if scan_energy and energy_crop is not None and energy_crop.size > 0:
-        energy_raw = _ocr_yellow_numeric_text(energy_crop, ocr_cfg, strict_mask=True)
+    if energy_scanned:
         energy_cur, energy_max = _parse_resource_numbers(energy_raw)
     else:
         energy_raw = carry.energy_raw
@@ -2557,11 +3134,6 @@ def _count_blobs(mask: np.ndarray, min_area: int, max_area: int) -> int:
     return count
 
 
-_PIP_TEMPLATE_CACHE: Dict[str, Dict[str, List[np.ndarray]]] = {}
-_SIGIL_TEMPLATE_CACHE: Dict[str, List[Tuple[str, np.ndarray]]] = {}
-_SCHOOL_TEMPLATE_CACHE: Dict[str, List[Tuple[str, np.ndarray]]] = {}
-
-
 def _template_suffixes_for_aspect(aspect_key: str) -> Tuple[str, ...]:
     if aspect_key == "4:3":
         return ("_4x3",)
@@ -2575,43 +3147,31 @@ def _template_suffixes_for_aspect(aspect_key: str) -> Tuple[str, ...]:
 def _load_named_templates(
     base_dir: str,
     aspect_key: str,
-    cache: Dict[str, List[Tuple[str, np.ndarray]]],
+    kind: str,
     *,
     suffixes: Optional[Tuple[str, ...]] = None,
     cache_key_suffix: Optional[str] = None,
     allow_fallback: bool = True,
 ) -> List[Tuple[str, np.ndarray]]:
     base = Path(base_dir)
-    cache_key = f"{base.resolve()}::{aspect_key}"
-    if cache_key_suffix:
-        cache_key = f"{cache_key}::{cache_key_suffix}"
-    if cache_key in cache:
-        return cache[cache_key]
-
-    if not base.exists():
-        cache[cache_key] = []
-        return []
-
     suffixes = suffixes or _template_suffixes_for_aspect(aspect_key)
-    templates: List[Tuple[str, np.ndarray]] = []
-    fallback: List[Tuple[str, np.ndarray]] = []
-    for folder in sorted(p for p in base.iterdir() if p.is_dir()):
-        label = folder.name.lower()
-        for png in sorted(folder.glob("*.png")):
-            stem = png.stem.strip().lower()
-            img = cv2.imread(str(png), cv2.IMREAD_GRAYSCALE)
-            if img is None:
-                continue
-            if any(stem.endswith(suf) for suf in suffixes):
-                templates.append((label, img))
-            else:
-                fallback.append((label, img))
 
-    if allow_fallback and (not templates) and fallback:
-        templates = fallback
+    def _build() -> List[Tuple[str, np.ndarray]]:
+        templates: List[Tuple[str, np.ndarray]] = []
+        fallback: List[Tuple[str, np.ndarray]] = []
+        for folder in TEMPLATE_BANK.subdirs(base):
+            label = folder.name.lower()
+            for templ in TEMPLATE_BANK.files(folder):
+                stem = templ.name.strip().lower()
+                if any(stem.endswith(suf) for suf in suffixes):
+                    templates.append((label, templ.image))
+                else:
+                    fallback.append((label, templ.image))
+        if allow_fallback and (not templates) and fallback:
+            templates = fallback
+        return templates
 
-    cache[cache_key] = templates
-    return templates
+    return TEMPLATE_BANK.cached((kind, str(base).lower(), aspect_key, cache_key_suffix), _build)
 
 
 def _ensure_gray(img: np.ndarray) -> np.ndarray:
@@ -2668,7 +3228,7 @@ def _detect_sigil(
     cfg: SigilDetectConfig,
     aspect_key: str,
 ) -> Tuple[Optional[str], float]:
-    templates = _load_named_templates(cfg.templates_base_dir, aspect_key, _SIGIL_TEMPLATE_CACHE)
+    templates = _load_named_templates(cfg.templates_base_dir, aspect_key, "sigil")
     return _match_named_template(sigil_bgr, templates, cfg.template_threshold)
 
 
@@ -2689,7 +3249,7 @@ def _detect_school(
     templates = _load_named_templates(
         cfg.templates_base_dir,
         aspect_key,
-        _SCHOOL_TEMPLATE_CACHE,
+        "school",
         suffixes=_school_template_suffixes(aspect_key, side),
         cache_key_suffix=side,
         allow_fallback=False,
@@ -2697,70 +3257,53 @@ def _detect_school(
     return _match_named_template(school_bgr, templates, cfg.template_threshold, pad=4)
 
 
-def _load_pip_templates(cfg: PipDetectConfig, aspect_key: str) -> Dict[str, List[np.ndarray]]:
+def _load_pip_templates(cfg: PipDetectConfig, aspect_key: str) -> TemplateGroup:
     base = Path(cfg.templates_base_dir)
     aspect_dir = _pip_aspect_dir_name(aspect_key)
-    cache_key = f"{base.resolve()}::{aspect_dir}"
-    if cache_key in _PIP_TEMPLATE_CACHE:
-        return _PIP_TEMPLATE_CACHE[cache_key]
-
-    if not base.exists():
-        _PIP_TEMPLATE_CACHE[cache_key] = {}
-        return {}
 
-    templates: Dict[str, List[np.ndarray]] = {}
-    for folder in sorted(p for p in base.iterdir() if p.is_dir()):
-        token = folder.name.lower()
-        paths: List[Path] = []
-        # Preferred layout: assets/pips/<token>/<aspect_dir>/*.png
-        aspect_subdir = folder / aspect_dir
-        if aspect_subdir.exists():
-            paths.extend(sorted(aspect_subdir.glob("*.png")))
-        # Fallback layout: assets/pips/<token>/*.png
-        if not paths:
-            paths.extend(sorted(folder.glob("*.png")))
-        for png in paths:
-            img = cv2.imread(str(png), cv2.IMREAD_GRAYSCALE)
-            if img is None:
-                continue
-            if token not in templates:
-                templates[token] = []
-            templates[token].append(img)
+    def _build() -> TemplateGroup:
+        entries: List[Tuple[str, np.ndarray]] = []
+        for folder in TEMPLATE_BANK.subdirs(base):
+            token = folder.name.lower()
+            # Preferred layout: assets/pips/<token>/<aspect_dir>/*.png
+            # Fallback layout: assets/pips/<token>/*.png
+            templates = TEMPLATE_BANK.files(folder / aspect_dir) or TEMPLATE_BANK.files(folder)
+            entries.extend((token, templ.image) for templ in templates)
+        return TemplateGroup(entries)
 
-    _PIP_TEMPLATE_CACHE[cache_key] = templates
-    return templates
+    return TEMPLATE_BANK.cached(("pips", str(base).lower(), aspect_dir), _build)
 
 
 def _best_pip_template_match(
     crop_gray: np.ndarray,
-    templates_by_token: Dict[str, List[np.ndarray]],
+    templates: TemplateGroup,
     *,
     allowed_tokens: Optional[Set[str]] = None,
 ) -> Tuple[Optional[str], float]:
-    if crop_gray.size == 0 or not templates_by_token:
+    if crop_gray.size == 0 or not len(templates):
         return None, -1.0
-    best_name: Optional[str] = None
-    best_score = -1.0
-    for token, templates in templates_by_token.items():
-        if allowed_tokens is not None and token not in allowed_tokens:
-            continue
-        for templ in templates:
-            try:
-                resized = cv2.resize(crop_gray, (templ.shape[1], templ.shape[0]), interpolation=cv2.INTER_AREA)
-            except Exception:
-                continue
-            res = cv2.matchTemplate(resized, templ, cv2.TM_CCOEFF_NORMED)
-            score = float(res[0][0]) if res.size else -1.0
-            if score > best_score:
-                best_score = score
-                best_name = token
-    return best_name, best_score
+    # Same-size NCC against every template at once (one resize per template shape).
+    scores = templates.ncc_resized(crop_gray)
+    if allowed_tokens is not None:
+        allowed = np.fromiter((token in allowed_tokens for token in templates.labels), dtype=bool, count=len(templates))
+        scores = np.where(allowed, scores, -1.0)
+    best = int(np.argmax(scores))
+    best_score = float(scores[best])
+    if best_score <= -1.0:
+        return None, -1.0
+    return templates.labels[best], best_score
 
 
-def _pip_presence_metrics(slot_bgr: np.ndarray, cfg: PipDetectConfig) -> Tuple[float, int]:
+def _pip_presence_metrics(
+    slot_bgr: np.ndarray,
+    cfg: PipDetectConfig,
+    *,
+    hsv: Optional[np.ndarray] = None,
+) -> Tuple[float, int]:
     if slot_bgr.size == 0:
         return 0.0, 0
-    hsv = cv2.cvtColor(slot_bgr, cv2.COLOR_BGR2HSV)
+    if hsv is None:
+        hsv = cv2.cvtColor(slot_bgr, cv2.COLOR_BGR2HSV)
     s = hsv[:, :, 1]
     v = hsv[:, :, 2]
     white = (s <= cfg.white_sat_max) & (v >= cfg.white_val_min)
@@ -2843,6 +3386,9 @@ def _pip_counts(
     h, w = pips_eval.shape[:2]
     if h == 0 or w == 0:
         return counts
+    # Convert the whole strip once; slots are slices of these planes.
+    pips_hsv = cv2.cvtColor(pips_eval, cv2.COLOR_BGR2HSV)
+    pips_gray = cv2.cvtColor(pips_eval, cv2.COLOR_BGR2GRAY)
 
     slot_count = max(1, int(cfg.slot_count))
     start_x = _pip_slot_start_px(cfg, aspect_key, slot_name, side)
@@ -2854,7 +3400,7 @@ def _pip_counts(
     y1 = max(0, min(h - 1, top_cut))
     y2 = max(y1 + 1, min(h, h - bottom_cut))
 
-    templates_by_token = _load_pip_templates(cfg, aspect_key)
+    pip_templates = _load_pip_templates(cfg, aspect_key)
     tokens: List[str] = []
     for i in range(slot_count):
         x1 = start_x + (i * slot_step)
@@ -2867,7 +3413,7 @@ def _pip_counts(
         if slot.size == 0:
             continue
 
-        ink_ratio, largest = _pip_presence_metrics(slot, cfg)
+        ink_ratio, largest = _pip_presence_metrics(slot, cfg, hsv=pips_hsv[y1:y2, cx1:cx2])
         slot_area = max(1, slot.shape[0] * slot.shape[1])
         if not (
             ((ink_ratio >= 0.025) and (largest >= max(1, int(slot_area * 0.015))))
@@ -2875,8 +3421,8 @@ def _pip_counts(
         ):
             continue
 
-        slot_gray = cv2.cvtColor(slot, cv2.COLOR_BGR2GRAY)
-        best_match, best_score = _best_pip_template_match(slot_gray, templates_by_token)
+        slot_gray = pips_gray[y1:y2, cx1:cx2]
+        best_match, best_score = _best_pip_template_match(slot_gray, pip_templates)
         if best_score < _pip_slot_presence_threshold(cfg, side):
             # Treat as empty when template confidence is below configured threshold.
             continue
@@ -2938,6 +3484,112 @@ def _is_slot_occupied(
     return False
 
 
+def _ocr_name_cascade(
+    name_crop: np.ndarray,
+    ocr_cfg: OCRConfig,
+    *,
+    tag: str,
+    debug_dump: bool = False,
+    slot_dump_id: Optional[str] = None,
+    debug_dump_limit: int = 0,
+) -> Optional[str]:
+    name_text = _ocr_name_per_char(name_crop, ocr_cfg)
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            clahe=True,
+            psm_override=7,
+            name_mode=True,
+            debug_tag=tag,
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            clahe=True,
+            invert_override=True,
+            psm_override=7,
+            name_mode=True,
+            debug_tag=f"{tag}_inv",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            clahe=True,
+            psm_override=8,
+            name_mode=True,
+            debug_tag=f"{tag}_psm8",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            clahe=True,
+            invert_override=True,
+            psm_override=8,
+            name_mode=True,
+            debug_tag=f"{tag}_psm8_inv",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            clahe=True,
+            psm_override=6,
+            name_mode=True,
+            debug_tag=f"{tag}_psm6",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            "",
+            clahe=True,
+            psm_override=7,
+            name_mode=True,
+            debug_tag=f"{tag}_nowhitelist",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    if not name_text:
+        name_text = _ocr_text(
+            name_crop,
+            ocr_cfg,
+            ocr_cfg.name_whitelist,
+            psm_override=7,
+            name_mode=False,
+            blacklist=ocr_cfg.name_blacklist,
+            debug_tag=f"{tag}_otsu",
+            debug_dump=debug_dump,
+            debug_dump_id=slot_dump_id,
+            debug_dump_limit=debug_dump_limit,
+        )
+    return name_text
+
+
 def _extract_participant(
     frame_bgr: np.ndarray,
     side: str,
@@ -2954,6 +3606,7 @@ def _extract_participant(
     name_prev_hash: Optional[int] = None,
     name_ocr_override: Optional[bool] = None,
     skip_health_ocr: bool = False,
+    health_prefetch: Optional[Tuple[Optional[int], Optional[int], Optional[str]]] = None,
     health_override: Optional[Tuple[Optional[int], Optional[int]]] = None,
     health_max_override: Optional[int] = None,
     skip_school_detect: bool = False,
@@ -2977,6 +3630,8 @@ def _extract_participant(
     sigil_score_override: Optional[float] = None,
     sigil_checked: bool = False,
     previous_slot: Optional[ParticipantState] = None,
+    planes: Optional[FramePlanes] = None,
+    region_cache: Optional[RegionCache] = None,
 ) -> ParticipantState:
     slot_dump_id = f"{debug_dump_id}_{side}_{index}" if debug_dump_id else None
     layout = cfg.layout
@@ -3000,7 +3655,15 @@ def _extract_participant(
     else:
         sigil_crop = crop_relative(frame_bgr, sigil_roi)
         _dump_participant_roi(sigil_crop, kind="sigil", side=side, index=index, enabled=debug_dump_sigil_roi)
-        sigil_match, sigil_score = _detect_sigil(sigil_crop, cfg.sigil, aspect_key)
+        if planes is not None:
+            sigil_crop = crop_relative(planes.gray, sigil_roi)
+        with profile_stage(f"participants.{side}_{index}.sigil"):
+            sigil_match, sigil_score = region_cached(
+                region_cache,
+                ("sigil", side, index, aspect_key),
+                sigil_roi,
+                lambda: _detect_sigil(sigil_crop, cfg.sigil, aspect_key),
+            )
     if sigil_match is None:
         if previous_slot is not None:
             carried_pips = previous_slot.pips if previous_slot.pips is not None else PipInventory()
@@ -3061,7 +3724,10 @@ def _extract_participant(
 
     name_timer_start = time.perf_counter()
     name_crop = crop_relative(frame_bgr, name_roi)
-    name_hash = name_hash_override if name_hash_override is not None else _name_roi_hash(name_crop)
+    if name_hash_override is not None:
+        name_hash = name_hash_override
+    else:
+        name_hash = _name_roi_hash(crop_relative(planes.gray, name_roi) if planes is not None else name_crop)
     health_crop = None
     pips_crop = None
     school_crop = None
@@ -3085,7 +3751,14 @@ def _extract_participant(
         school_match = school_override
         school_score = school_score_override
     else:
-        school_match, school_score = _detect_school(school_crop, cfg.school, aspect_key, side)
+        school_input = crop_relative(planes.gray, school_roi) if planes is not None else school_crop
+        with profile_stage(f"participants.{side}_{index}.school"):
+            school_match, school_score = region_cached(
+                region_cache,
+                ("school", side, index, aspect_key),
+                school_roi,
+                lambda: _detect_school(school_input, cfg.school, aspect_key, side),
+            )
 
     if debug_dump_health and (health_crop is not None) and side in ("enemy", "ally"):
         prepped_list: List[Tuple[str, np.ndarray]] = [
@@ -3130,102 +3803,25 @@ def _extract_participant(
             name_time_parts = name_time_parts_override
         name_ocr = False if name_ocr_override is None else name_ocr_override
     else:
-        name_text = _ocr_name_per_char(name_crop, cfg.ocr)
-        if not name_text:
-            name_text = _ocr_text(
+        with profile_stage(f"participants.{side}_{index}.name"):
+            # OCR fields skip the region cache: its quarter-resolution check can miss a
+            # changed digit, and _ocr_cached already dedupes identical crops.
+            name_text = _ocr_cached(
+                "name",
                 name_crop,
                 cfg.ocr,
-                cfg.ocr.name_whitelist,
-                clahe=True,
-                psm_override=7,
-                name_mode=True,
-                debug_tag=tag,
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                cfg.ocr.name_whitelist,
-                clahe=True,
-                invert_override=True,
-                psm_override=7,
-                name_mode=True,
-                debug_tag=f"{tag}_inv",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                cfg.ocr.name_whitelist,
-                clahe=True,
-                psm_override=8,
-                name_mode=True,
-                debug_tag=f"{tag}_psm8",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                cfg.ocr.name_whitelist,
-                clahe=True,
-                invert_override=True,
-                psm_override=8,
-                name_mode=True,
-                debug_tag=f"{tag}_psm8_inv",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
+                None,
+                lambda: _ocr_name_cascade(
+                    name_crop,
+                    cfg.ocr,
+                    tag=tag,
+                    debug_dump=debug_dump,
+                    slot_dump_id=slot_dump_id,
+                    debug_dump_limit=debug_dump_limit,
+                ),
             )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                cfg.ocr.name_whitelist,
-                clahe=True,
-                psm_override=6,
-                name_mode=True,
-                debug_tag=f"{tag}_psm6",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                "",
-                clahe=True,
-                psm_override=7,
-                name_mode=True,
-                debug_tag=f"{tag}_nowhitelist",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        if not name_text:
-            name_text = _ocr_text(
-                name_crop,
-                cfg.ocr,
-                cfg.ocr.name_whitelist,
-                psm_override=7,
-                name_mode=False,
-                blacklist=cfg.ocr.name_blacklist,
-                debug_tag=f"{tag}_otsu",
-                debug_dump=debug_dump,
-                debug_dump_id=slot_dump_id,
-                debug_dump_limit=debug_dump_limit,
-            )
-        name_raw = name_text
-        name_text = _apply_wordlist_correction(name_text, cfg.ocr, side=side)
+            name_raw = name_text
+            name_text = _apply_wordlist_correction(name_text, cfg.ocr, side=side)
         name_time_ms = (time.perf_counter() - name_timer_start) * 1000.0
         name_time_parts = None
         name_ocr = True if name_ocr_override is None else name_ocr_override
@@ -3245,7 +3841,13 @@ def _extract_participant(
             health_current, health_max = health_override
         health_raw_text = None
     else:
-        health_current, health_max, health_raw_text = _ocr_health(health_crop, cfg.ocr)
+        with profile_stage(f"participants.{side}_{index}.health"):
+            health_current, health_max, health_raw_text = _ocr_health(
+                health_crop,
+                cfg.ocr,
+                prefetch=health_prefetch,
+                variant_context=(side, aspect_key),
+            )
         # Safety: participant HP must be read as "current/max". If slash is missing,
         # keep prior values to avoid propagating a bad parse.
         normalized_health_raw = _normalize_health_text(health_raw_text) if health_raw_text else ""
@@ -3272,13 +3874,21 @@ def _extract_participant(
     if skip_pip_detect:
         pips = pips_override if pips_override is not None else PipInventory()
     else:
-        pips = _pip_counts(
-            pips_crop,
-            cfg.pip,
-            aspect_key,
-            side=side,
-            slot_name=_pip_slot_name(side, index),
-        )
+        with profile_stage(f"participants.{side}_{index}.pips"):
+            pips = region_cached(
+                region_cache,
+                ("pips", side, index, aspect_key),
+                pips_roi,
+                lambda: _pip_counts(
+                    pips_crop,
+                    cfg.pip,
+                    aspect_key,
+                    side=side,
+                    slot_name=_pip_slot_name(side, index),
+                ),
+            )
+        # Cached inventories are shared across frames; hand out a private copy.
+        pips = replace(pips, tokens=list(pips.tokens))
 
     return ParticipantState(
         side=side,
@@ -3337,7 +3947,16 @@ def extract_participants(
     debug_print_health_ocr_initial_read: bool = False,
     debug_dump_id: Optional[str] = None,
     debug_dump_limit: int = 0,
+    planes: Optional[FramePlanes] = None,
+    region_cache: Optional[RegionCache] = None,
+    ocr_jobs: Optional[OCRJobService] = None,
 ) -> ParticipantsState:
+    """
+    With ocr_jobs, name and health OCR run in the background: a slot that needs a
+    read gets a job (at most one in flight per slot) and keeps its previous values;
+    finished reads are merged into the previous state on a later call. Health reads
+    of all slots share one job, so the EasyOCR batch or Tesseract montage still runs.
+    """
     state = ParticipantsState(detected=False, timestamp=timestamp)
     if frame_bgr is None:
         return state
@@ -3359,6 +3978,50 @@ def extract_participants(
     prev_enemies = previous.enemies if previous else []
     prev_allies = previous.allies if previous else []
 
+    def _merge_async_ocr(prev: ParticipantState) -> ParticipantState:
+        if not prev.occupied:
+            return prev
+        done, result = ocr_jobs.take(("participant", "name", prev.side, prev.index))
+        if done:
+            raw, final, job_hash, elapsed_ms = result
+            # Drop the read if the name plate changed while it was in flight.
+            if raw and (job_hash is None or prev.name_roi_hash is None or job_hash == prev.name_roi_hash):
+                prev = replace(
+                    prev,
+                    name=final,
+                    name_raw=raw,
+                    name_time_ms=elapsed_ms,
+                    name_time_parts=None,
+                    name_ocr=True,
+                )
+                _log_name_ocr(prev)
+        done, result = ocr_jobs.take(("participant", "health", prev.side, prev.index))
+        if done:
+            cur, maxv, raw = result
+            # Same safety as the synchronous path: only "current/max" reads are applied.
+            if raw and "/" in _normalize_health_text(raw):
+                if lock_health_max and prev.health_max is not None:
+                    maxv = prev.health_max
+                if debug_print_health_ocr:
+                    _log_health_ocr(
+                        side=prev.side,
+                        index=prev.index,
+                        sigil=prev.sigil,
+                        name=prev.name,
+                        raw_text=raw,
+                        prev_cur=prev.health_current,
+                        prev_max=prev.health_max,
+                        cur=cur,
+                        maxv=maxv,
+                        allow_initial_read=debug_print_health_ocr_initial_read,
+                    )
+                prev = replace(prev, health_current=cur, health_max=maxv)
+        return prev
+
+    if ocr_jobs is not None:
+        prev_enemies = [_merge_async_ocr(slot) for slot in prev_enemies]
+        prev_allies = [_merge_async_ocr(slot) for slot in prev_allies]
+
     def _prev_for(side: str, idx: int) -> Optional[ParticipantState]:
         arr = prev_enemies if side == "enemy" else prev_allies
         if idx < len(arr):
@@ -3528,7 +4191,70 @@ def extract_participants(
     if previous and previous.detected and previous.occupancy_checked_at is not None and occupancy_refresh_s > 0:
         do_occupancy_check = (ts - previous.occupancy_checked_at) >= occupancy_refresh_s
 
-    use_batch_easyocr = (not skip_name_ocr) and cfg.ocr.backend == "easyocr"
+    use_batch_easyocr = (not skip_name_ocr) and cfg.ocr.backend == "easyocr" and ocr_jobs is None
+    batch_health = (not skip_health_ocr) and (cfg.ocr.backend == "easyocr" or cfg.ocr.health_montage)
+    use_batch_health = batch_health and ocr_jobs is None
+    health_prefetch: Dict[Tuple[str, int], Tuple[Optional[int], Optional[int], Optional[str]]] = {}
+    async_name_items: List[Tuple[_NameWorkItem, Optional[int]]] = []
+    async_health_items: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def _submit_async_ocr(side: str, idx: int, box_roi, need_name: bool, need_health: bool) -> Tuple[bool, bool]:
+        """Queue the slot's OCR as background jobs; returns the (name, health) reads still to do inline."""
+        if ocr_jobs is None:
+            return (need_name, need_health)
+        is_enemy = side == "enemy"
+        slot_dump_id = f"{debug_dump_id}_{side}_{idx}" if debug_dump_id else None
+        if need_name and not skip_name_ocr and not ocr_jobs.busy(("participant", "name", side, idx)):
+            name_roi = _sub_roi(box_roi, layout.name_roi_enemy if is_enemy else layout.name_roi_ally)
+            name_crop = crop_relative(frame_bgr, name_roi).copy()
+            name_hash = _name_roi_hash(crop_relative(planes.gray, name_roi) if planes is not None else name_crop)
+            if cfg.ocr.backend == "easyocr":
+                async_name_items.append(
+                    (
+                        _NameWorkItem(
+                            key=(side, idx),
+                            crop=name_crop,
+                            tag=f"{side}_{idx}_name",
+                            dump_id=slot_dump_id,
+                            start_time=time.perf_counter(),
+                        ),
+                        name_hash,
+                    )
+                )
+            else:
+                def _read_name(crop=name_crop, name_hash=name_hash, tag=f"{side}_{idx}_name"):
+                    t0 = time.perf_counter()
+                    raw = _ocr_cached(
+                        "name",
+                        crop,
+                        cfg.ocr,
+                        None,
+                        lambda: _ocr_name_cascade(
+                            crop,
+                            cfg.ocr,
+                            tag=tag,
+                            debug_dump=debug_dump,
+                            slot_dump_id=slot_dump_id,
+                            debug_dump_limit=debug_dump_limit,
+                        ),
+                    )
+                    final = _apply_wordlist_correction(raw, cfg.ocr, side=side)
+                    return (raw, final, name_hash, (time.perf_counter() - t0) * 1000.0)
+
+                ocr_jobs.submit(("participant", "name", side, idx), _read_name)
+        if need_health and not skip_health_ocr:
+            health_roi = _sub_roi(box_roi, layout.health_roi_enemy if is_enemy else layout.health_roi_ally)
+            health_crop = crop_relative(frame_bgr, health_roi).copy()
+            if batch_health:
+                # Batched with the other slots in one job after the slot loop.
+                if not ocr_jobs.busy(("participant", "health", side, idx)):
+                    async_health_items[(side, idx)] = health_crop
+            else:
+                ocr_jobs.submit(
+                    ("participant", "health", side, idx),
+                    lambda: _ocr_health(health_crop, cfg.ocr, variant_context=(side, bucket)),
+                )
+        return (False, False)
     sigil_info: Dict[Tuple[str, int], Tuple[Optional[str], Optional[float], Tuple[float, float, float, float]]] = {}
     name_overrides: Dict[
         Tuple[str, int],
@@ -3551,14 +4277,23 @@ def extract_participants(
                 sigil_roi = _sub_roi(box_roi, sigil_rel)
                 sigil_crop = crop_relative(frame_bgr, sigil_roi)
                 _dump_participant_roi(sigil_crop, kind="sigil", side=side, index=i, enabled=debug_dump_sigil_roi)
-                sigil_match, sigil_score = _detect_sigil(sigil_crop, cfg.sigil, bucket)
+                if planes is not None:
+                    sigil_crop = crop_relative(planes.gray, sigil_roi)
+                with profile_stage(f"participants.{side}_{i}.sigil"):
+                    sigil_match, sigil_score = region_cached(
+                        region_cache,
+                        ("sigil", side, i, bucket),
+                        sigil_roi,
+                        lambda: _detect_sigil(sigil_crop, cfg.sigil, bucket),
+                    )
             else:
                 sigil_match = prev.sigil if (prev and prev.slot_active and prev.occupied) else None
                 sigil_score = prev.sigil_score if (prev and prev.slot_active and prev.occupied) else None
             sigil_info[(side, i)] = (sigil_match, sigil_score, box_roi)
 
-    if use_batch_easyocr:
+    if use_batch_easyocr or use_batch_health:
         name_items: List[_NameWorkItem] = []
+        health_items: Dict[Tuple[str, int], np.ndarray] = {}
         for i in range(profile.slots):
             enemy_roi = _shift_roi(profile.enemy_first_box, profile.enemy_spacing_x * i)
             if profile.ally_anchor == "right":
@@ -3574,14 +4309,19 @@ def extract_participants(
                 occupied_now = sigil_match is not None
                 needs = _detail_needs(prev, occupied_now)
                 detail_needs[(side, i)] = needs
-                need_name, _, _, _, _ = needs
-                if (not occupied_now) or (not need_name):
+                need_name, need_health, _, _, _ = needs
+                if use_batch_health and occupied_now and need_health:
+                    health_roi = _sub_roi(box_roi, layout.health_roi_enemy if is_enemy else layout.health_roi_ally)
+                    health_crop = crop_relative(frame_bgr, health_roi)
+                    if _wants_health_prefetch(health_crop, cfg.ocr):
+                        health_items[(side, i)] = health_crop
+                if (not use_batch_easyocr) or (not occupied_now) or (not need_name):
                     continue
                 name_roi = _sub_roi(box_roi, name_rel)
                 cap_start = time.perf_counter()
                 name_crop = crop_relative(frame_bgr, name_roi)
                 capture_ms = (time.perf_counter() - cap_start) * 1000.0
-                name_hash = _name_roi_hash(name_crop)
+                name_hash = _name_roi_hash(crop_relative(planes.gray, name_roi) if planes is not None else name_crop)
                 name_hash_overrides[(side, i)] = name_hash
                 if prev is not None and name_hash is not None and prev.name_roi_hash == name_hash and (prev.name or prev.name_raw):
                     name_time_parts = (capture_ms, 0.0, 0.0, 0.0)
@@ -3601,13 +4341,22 @@ def extract_participants(
                         capture_ms=capture_ms,
                     )
                 )
-        batch_results = _batch_easyocr_names(
-            name_items,
-            cfg.ocr,
-            debug_dump=debug_dump,
-            debug_dump_limit=debug_dump_limit,
-        )
-        name_overrides.update(batch_results)
+        if name_items:
+            with profile_stage("participants.names_batch"):
+                batch_results = _batch_easyocr_names(
+                    name_items,
+                    cfg.ocr,
+                    debug_dump=debug_dump,
+                    debug_dump_limit=debug_dump_limit,
+                    aspect_key=bucket,
+                )
+            name_overrides.update(batch_results)
+        if health_items and cfg.ocr.backend == "easyocr":
+            with profile_stage("participants.health_batch"):
+                health_prefetch = _batch_easyocr_health(health_items, cfg.ocr, aspect_key=bucket)
+        elif health_items:
+            with profile_stage("participants.health_montage"):
+                health_prefetch = _ocr_health_montage(health_items, cfg.ocr, aspect_key=bucket)
 
     for i in range(profile.slots):
         enemy_roi = _shift_roi(profile.enemy_first_box, profile.enemy_spacing_x * i)
@@ -3665,6 +4414,8 @@ def extract_participants(
 
         enemy_need_name, enemy_need_health, enemy_need_school, enemy_need_pips, enemy_details_at = enemy_needs
         ally_need_name, ally_need_health, ally_need_school, ally_need_pips, ally_details_at = ally_needs
+        enemy_need_name, enemy_need_health = _submit_async_ocr("enemy", i, enemy_roi, enemy_need_name, enemy_need_health)
+        ally_need_name, ally_need_health = _submit_async_ocr("ally", i, ally_roi, ally_need_name, ally_need_health)
 
         enemy_health_max_override = None
         if lock_health_max and prev_enemy is not None and prev_enemy.health_max is not None:
@@ -3692,6 +4443,7 @@ def extract_participants(
             name_prev_hash=(prev_enemy.name_roi_hash if prev_enemy is not None else None),
             name_ocr_override=enemy_name_ocr,
             skip_health_ocr=skip_health_ocr or (not enemy_need_health),
+            health_prefetch=health_prefetch.get(("enemy", i)),
             health_override=((prev_enemy.health_current, prev_enemy.health_max) if prev_enemy is not None else None),
             health_max_override=enemy_health_max_override,
             skip_school_detect=(not enemy_need_school),
@@ -3715,6 +4467,8 @@ def extract_participants(
             sigil_score_override=enemy_sigil_score,
             sigil_checked=True,
             previous_slot=prev_enemy,
+            planes=planes,
+            region_cache=region_cache,
         )
         enemy_slot_final = _merge_reactivated_slot(prev_enemy, enemy_slot)
         enemies.append(enemy_slot_final)
@@ -3741,6 +4495,7 @@ def extract_participants(
             name_prev_hash=(prev_ally.name_roi_hash if prev_ally is not None else None),
             name_ocr_override=ally_name_ocr,
             skip_health_ocr=skip_health_ocr or (not ally_need_health),
+            health_prefetch=health_prefetch.get(("ally", i)),
             health_override=((prev_ally.health_current, prev_ally.health_max) if prev_ally is not None else None),
             health_max_override=ally_health_max_override,
             skip_school_detect=(not ally_need_school),
@@ -3764,6 +4519,8 @@ def extract_participants(
             sigil_score_override=ally_sigil_score,
             sigil_checked=True,
             previous_slot=prev_ally,
+            planes=planes,
+            region_cache=region_cache,
         )
         ally_slot_final = _merge_reactivated_slot(prev_ally, ally_slot)
         allies.append(ally_slot_final)
@@ -3771,6 +4528,53 @@ def extract_participants(
         if ally_need_name and ally_slot_final.slot_active and ally_slot_final.occupied and ally_slot_final.name_ocr:
             _log_name_ocr(ally_slot_final)
 
+    if async_name_items:
+        name_hashes = {item.key: name_hash for item, name_hash in async_name_items}
+
+        def _read_names(items=[item for item, _ in async_name_items]):
+            t0 = time.perf_counter()
+            batch = _batch_easyocr_names(
+                items,
+                cfg.ocr,
+                debug_dump=debug_dump,
+                debug_dump_limit=debug_dump_limit,
+                aspect_key=bucket,
+            )
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            out = {}
+            for side, idx in name_hashes:
+                raw, final, _, _ = batch.get((side, idx), (None, None, None, None))
+                out[("participant", "name", side, idx)] = (raw, final, name_hashes[(side, idx)], elapsed_ms)
+            return out
+
+        ocr_jobs.submit_group([("participant", "name", side, idx) for side, idx in name_hashes], _read_names)
+
+    if async_health_items:
+
+        def _read_healths(crops=dict(async_health_items)):
+            # Same batched pass as the synchronous path; slots it cannot read fall back per slot.
+            wanted = {key: crop for key, crop in crops.items() if _wants_health_prefetch(crop, cfg.ocr)}
+            if not wanted:
+                prefetch = {}
+            elif cfg.ocr.backend == "easyocr":
+                prefetch = _batch_easyocr_health(wanted, cfg.ocr, aspect_key=bucket)
+            else:
+                prefetch = _ocr_health_montage(wanted, cfg.ocr, aspect_key=bucket)
+            return {
+                ("participant", "health", side, idx): _ocr_health(
+                    crop,
+                    cfg.ocr,
+                    prefetch=prefetch.get((side, idx)),
+                    variant_context=(side, bucket),
+                )
+                for (side, idx), crop in crops.items()
+            }
+
+        ocr_jobs.submit_group(
+            [("participant", "health", side, idx) for side, idx in async_health_items],
+            _read_healths,
+        )
+
     state.enemies = enemies
     state.allies = allies
     state.profile = bucket
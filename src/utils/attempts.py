@@ -0,0 +1,77 @@
+# utils/attempts.py
+from __future__ import annotations
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+_THREAD_PREFIX = "ocr-attempt"
+
+
+class AttemptExecutor:
+    """
+    Runs alternative attempts at one read (e.g. OCR preprocessing variants) on a
+    shared thread pool and stops at the first accepted result.
+
+    Results are consumed in attempt order, so the outcome is the same as running
+    the attempts sequentially with an early exit; attempts that have not started
+    yet when one is accepted are cancelled. Calls made from a pool thread run
+    sequentially instead of re-entering the pool.
+    """
+
+    def __init__(self, workers: int = 4):
+        self.workers = max(1, int(workers))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=_THREAD_PREFIX)
+            return self._pool
+
+    def resize(self, workers: int) -> None:
+        workers = max(1, int(workers))
+        with self._lock:
+            if workers == self.workers:
+                return
+            self.workers = workers
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def run(
+        self,
+        attempts: Sequence[Callable[[], T]],
+        accept: Callable[[T], bool],
+        *,
+        parallel: bool = True,
+    ) -> List[T]:
+        """Results of attempts[0..k], where k is the first accepted one (or the last attempt)."""
+        results: List[T] = []
+        if not parallel or len(attempts) < 2 or threading.current_thread().name.startswith(_THREAD_PREFIX):
+            for attempt in attempts:
+                result = attempt()
+                results.append(result)
+                if accept(result):
+                    break
+            return results
+        pool = self._get_pool()
+        futures: List[Future] = [pool.submit(attempt) for attempt in attempts]
+        try:
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                if accept(result):
+                    break
+        finally:
+            for future in futures[len(results):]:
+                future.cancel()
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=False, cancel_futures=True)
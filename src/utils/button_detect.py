@@ -1,41 +1,30 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Tuple, Optional, List
+from typing import Tuple, Optional, List
 import cv2
 import numpy as np
+from utils.frames import FramePlanes
 from utils.roi import crop_relative, draw_relative_roi
+from utils.template_bank import TEMPLATE_BANK
 
-# ---------------------------------------
-# Template bank cache: button -> [(name, gray_img), ...]
-# ---------------------------------------
-_TEMPLATE_BANK: Dict[str, List[Tuple[str, np.ndarray]]] = {}
 
 def _load_template_bank(button: str, base_dir: Path) -> List[Tuple[str, np.ndarray]]:
     """
-    Loads all PNG templates from: base_dir / button / *.png
-    Caches results in-memory so it only loads once.
+    All PNG templates from: base_dir / button / *.png, as [(name, gray_img), ...].
+    Served from the shared TemplateBank (folder lookup is case-insensitive).
     """
-    button = button.lower().strip()
-    if button in _TEMPLATE_BANK:
-        return _TEMPLATE_BANK[button]
+    button = button.strip()
+    folder = Path(base_dir) / button
 
-    folder = base_dir / button
-    if not folder.exists():
-        raise FileNotFoundError(f"Template folder not found: {folder}")
+    def _build() -> List[Tuple[str, np.ndarray]]:
+        if not TEMPLATE_BANK.has_dir(folder):
+            raise FileNotFoundError(f"Template folder not found: {folder}")
+        bank = [(t.name, t.image) for t in TEMPLATE_BANK.files(folder)]
+        if not bank:
+            raise FileNotFoundError(f"No .png templates found in: {folder}")
+        return bank
 
-    paths = sorted(folder.glob("*.png"))
-    if not paths:
-        raise FileNotFoundError(f"No .png templates found in: {folder}")
-
-    bank: List[Tuple[str, np.ndarray]] = []
-    for p in paths:
-        img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
-        if img is None:
-            raise FileNotFoundError(f"Failed to load template: {p}")
-        bank.append((p.stem, img))
-
-    _TEMPLATE_BANK[button] = bank
-    return bank
+    return TEMPLATE_BANK.cached(("button", str(base_dir).lower(), button.lower()), _build)
 
 
 def detect_button(
@@ -49,6 +38,7 @@ def detect_button(
     vis: bool = False,
     debug_window_prefix: str = "wizmatic",
     print_every_frame: bool = False,
+    planes: Optional[FramePlanes] = None,
 ) -> bool:
     """
     Returns True if the button template bank is detected in frame_bgr, else False.
@@ -63,6 +53,7 @@ def detect_button(
       vis: if True, show ROI overlay
       print_every_frame: if False, prints only when debug is True AND detection state changes
                          (this function stores last state per button when debug enabled)
+      planes: derived-plane cache for frame_bgr; the ROI is cropped from its shared gray plane
 
     Template layout expected:
       src/assets/buttons/pass/*.png
@@ -82,7 +73,10 @@ def detect_button(
             print(f"[{button}] Empty ROI (rel_roi={rel_roi})")
         return False
 
-    roi_gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+    if planes is not None:
+        roi_gray = crop_relative(planes.gray, rel_roi)
+    else:
+        roi_gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
 
     best_score = -1.0
     best_name = None
@@ -0,0 +1,37 @@
+# utils/capture_backend.py
+from __future__ import annotations
+from typing import Optional, Protocol
+import numpy as np
+
+
+class CaptureBackend(Protocol):
+    """
+    Anything FrameSource can pull frames from.
+    read() returns the most recent BGR frame (or None when nothing is available yet).
+    Backends may also expose `finished` (bool) when their stream has ended.
+    """
+
+    def read(self) -> Optional[np.ndarray]: ...
+
+    def close(self) -> None: ...
+
+
+def open_capture(
+    source: str = "live",
+    *,
+    fps: int = 60,
+    replay_path: Optional[str] = None,
+    replay_realtime: bool = True,
+    replay_loop: bool = False,
+) -> CaptureBackend:
+    source = str(source).strip().lower()
+    if source == "live":
+        # Imported lazily: the live backend needs dxcam/pywin32 (Windows only).
+        from utils.capture_wiz import Wizard101Capture
+        return Wizard101Capture(fps=fps)
+    if source == "replay":
+        if not replay_path:
+            raise ValueError("Replay capture requires a replay_path")
+        from utils.capture_replay import ReplayCapture
+        return ReplayCapture(replay_path, realtime=replay_realtime, loop=replay_loop)
+    raise ValueError(f"Unknown capture source: {source}")
@@ -0,0 +1,157 @@
+# utils/capture_replay.py
+from __future__ import annotations
+import math
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+import cv2
+import numpy as np
+from utils.session_archive import is_session_archive, iter_archive_frames
+
+_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp"}
+_VIDEO_EXTS = {".mp4", ".avi", ".mkv", ".mov", ".webm"}
+
+
+def _iter_image_dir(path: Path) -> Iterator[Tuple[float, np.ndarray]]:
+    files = sorted(p for p in path.iterdir() if p.is_file() and p.suffix.lower() in _IMAGE_EXTS)
+    for p in files:
+        frame = cv2.imread(str(p), cv2.IMREAD_COLOR)
+        if frame is None:
+            continue
+        yield math.nan, frame
+
+
+def _iter_video(path: Path) -> Iterator[Tuple[float, np.ndarray]]:
+    cap = cv2.VideoCapture(str(path))
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Could not open video: {path}")
+    try:
+        while True:
+            ok, frame = cap.read()
+            if not ok or frame is None:
+                break
+            pos_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+            yield (pos_ms / 1000.0 if pos_ms > 0 else math.nan), frame
+    finally:
+        cap.release()
+
+
+def open_replay_stream(path: Path) -> Iterator[Tuple[float, np.ndarray]]:
+    """
+    Yield (timestamp, frame) pairs from a recorded session.
+    Accepts a session archive directory, a directory of images, or a video file.
+    Timestamps are NaN when the source does not carry them.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Replay source not found: {path}")
+    if path.is_dir():
+        if is_session_archive(path):
+            return iter_archive_frames(path)
+        return _iter_image_dir(path)
+    if path.suffix.lower() in _VIDEO_EXTS:
+        return _iter_video(path)
+    raise ValueError(f"Unsupported replay source: {path}")
+
+
+class ReplayCapture:
+    """
+    Capture backend that replays a recorded session instead of grabbing the game window.
+    Drop-in for Wizard101Capture: read() returns the current BGR frame (or the last one).
+
+    realtime=True  -> frames are released at their original timing (read() never blocks,
+                      frames that fall between reads are skipped like a live capture would).
+    realtime=False -> every read() returns the next frame, as fast as the consumer pulls.
+    """
+
+    def __init__(self, path, *, realtime: bool = True, loop: bool = False, fps: float = 30.0):
+        self.path = Path(path)
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = max(1e-3, float(fps))
+        self.frame_id = 0
+        self.frame_time: Optional[float] = None
+        self.last_good: Optional[np.ndarray] = None
+        self.finished = False
+
+        self._stream: Optional[Iterator[Tuple[float, np.ndarray]]] = None
+        self._stream_index = 0
+        self._stream_t0: Optional[float] = None
+        self._first_ts: Optional[float] = None  # first recorded timestamp; frame_time counts on from it
+        self._offset_base = 0.0
+        self._last_offset = 0.0
+        self._start: Optional[float] = None
+        self._pending: Optional[Tuple[float, float, np.ndarray]] = None
+        self._open_stream()
+
+    def _open_stream(self) -> None:
+        self._stream = open_replay_stream(self.path)
+        self._stream_index = 0
+        self._stream_t0 = None
+
+    def _next_item(self) -> Optional[Tuple[float, float, np.ndarray]]:
+        while True:
+            try:
+                ts, frame = next(self._stream)
+            except StopIteration:
+                if not self.loop or self._stream_index == 0:
+                    return None
+                self._offset_base = self._last_offset + (1.0 / self.fps)
+                self._open_stream()
+                continue
+            if math.isnan(ts):
+                local = self._stream_index / self.fps
+            else:
+                if self._stream_t0 is None:
+                    self._stream_t0 = ts
+                if self._first_ts is None:
+                    self._first_ts = ts
+                local = ts - self._stream_t0
+            self._stream_index += 1
+            offset = self._offset_base + local
+            self._last_offset = offset
+            return offset, ts, np.array(frame)
+
+    def _emit(self, item: Tuple[float, float, np.ndarray]) -> np.ndarray:
+        offset, ts, frame = item
+        self.frame_id += 1
+        # The first pass keeps its recorded times; looped passes continue from them instead of
+        # jumping back, so capture times never decrease.
+        self.frame_time = None if (math.isnan(ts) or self._first_ts is None) else self._first_ts + offset
+        self.last_good = frame
+        return frame
+
+    def read(self) -> Optional[np.ndarray]:
+        if self.finished:
+            return self.last_good
+
+        if not self.realtime:
+            item = self._next_item()
+            if item is None:
+                self.finished = True
+                return self.last_good
+            return self._emit(item)
+
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now
+            self._pending = self._next_item()
+        elapsed = now - self._start
+        due = None
+        while self._pending is not None and self._pending[0] <= elapsed:
+            due = self._pending
+            self._pending = self._next_item()
+        if due is not None:
+            self._emit(due)
+        if self._pending is None:
+            self.finished = True
+        return self.last_good
+
+    def close(self) -> None:
+        if self._stream is not None and hasattr(self._stream, "close"):
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+        self._stream = None
+        self._pending = None
@@ -4,12 +4,22 @@ import time
 from utils.frames import FrameBundle
 
 class FrameSource:
-    def __init__(self, capture, hz=60):
+    def __init__(self, capture, hz=60, on_frame=None, lockstep=False):
+        # capture: any CaptureBackend (live window capture or replay). hz=None runs unpaced.
+        # on_frame: optional callback run on the capture thread for every new bundle; must not block.
+        # lockstep: don't read the next frame until wait_for_next has handed out the current one,
+        # so a consumer sees every frame (non-realtime replay).
         self.capture = capture
+        self.on_frame = on_frame
         self.hz = hz
-        self.dt = 1.0 / hz
+        self.lockstep = lockstep
+        self.dt = 1.0 / hz if hz else 0.0
         self.latest = None
-        self._lock = threading.Lock()
+        self.seq = 0  # increments once per published bundle
+        self._consumed = 0  # newest seq handed out by wait_for_next
+        self.finished = False
+        self._last_frame = None
+        self._cond = threading.Condition()
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
 
@@ -18,21 +28,59 @@ class FrameSource:
 
     def _run(self):
         while not self._stop.is_set():
+            if self.lockstep:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._consumed >= self.seq or self._stop.is_set())
+                if self._stop.is_set():
+                    break
             t0 = time.perf_counter()
             frame = self.capture.read()
-            if frame is not None:
-                bundle = FrameBundle(frame)
-                with self._lock:
+            # Backends hand back their last good frame when nothing new arrived; skip those.
+            if frame is not None and frame is not self._last_frame:
+                self._last_frame = frame
+                # Prefer the backend's own capture time (replays carry the recorded one).
+                stamp = getattr(self.capture, "frame_time", None)
+                with self._cond:
+                    bundle = FrameBundle(
+                        frame,
+                        seq=self.seq + 1,
+                        timestamp=stamp if stamp is not None else time.time(),
+                        captured_at=time.perf_counter(),
+                    )
                     self.latest = bundle
+                    self.seq = bundle.seq
+                    self._cond.notify_all()
+                if self.on_frame is not None:
+                    self.on_frame(bundle)
+            if getattr(self.capture, "finished", False):
+                self.finished = True
+                break
             elapsed = time.perf_counter() - t0
             sleep_for = self.dt - elapsed
             if sleep_for > 0:
                 time.sleep(sleep_for)
 
     def get_latest(self):
-        with self._lock:
+        with self._cond:
             return self.latest
 
+    def wait_for_next(self, seq, timeout=None):
+        """
+        Block until a bundle newer than `seq` is published, the source stops, or timeout.
+        Returns (latest_seq, bundle), or (seq, None) when nothing new arrived.
+        Intermediate bundles are skipped: consumers always get the newest frame
+        (in lockstep mode there are none to skip).
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq > seq or self._stop.is_set(), timeout)
+            if self.seq > seq:
+                self._consumed = self.seq
+                self._cond.notify_all()
+                return self.seq, self.latest
+            return seq, None
+
     def stop(self):
         self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
         self._thread.join(timeout=1.0)
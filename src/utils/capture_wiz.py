@@ -254,6 +254,7 @@ class Wizard101Capture:
     def __init__(self, fps=60):
         self.fps = fps
         self.frame_id = 0
+        self.frame_time = None  # time.time() of the last new frame
         self.hwnd = find_wizard101_window()
         if not self.hwnd:
             raise RuntimeError("Wizard101 window not found (exact title required).")
@@ -287,7 +288,8 @@ class Wizard101Capture:
         cropped = frame[y1:y2, x1:x2]
         self.last_good = cropped
         self.frame_id += 1
-        return cropped#, {"t": time.time(), "id": self.frame_id}
+        self.frame_time = time.time()
+        return cropped
 
     def close(self):
         self.capture.stop()
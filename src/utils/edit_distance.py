@@ -0,0 +1,173 @@
+# utils/edit_distance.py
+from __future__ import annotations
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# Widest query the batched kernel packs into one uint64 column; longer ones loop.
+_BATCH_MAX_QUERY = 64
+# Batched rows are compacted once fewer than this share of them can still match.
+_COMPACT_BELOW = 0.5
+
+
+def _peq(pattern: str) -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def levenshtein(a: str, b: str, max_dist: Optional[int] = None) -> int:
+    """
+    Levenshtein distance with Myers' bit-parallel algorithm: the shorter string is
+    a bit vector and each character of the longer one advances a whole DP column
+    in a few integer operations. With max_dist the result is exact up to max_dist
+    and max_dist + 1 otherwise; the scan stops as soon as the last-row score,
+    less the characters still to come, already exceeds max_dist.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if max_dist is not None and n - m > max_dist:
+        return max_dist + 1
+    if m == 0:
+        return n if max_dist is None else min(n, max_dist + 1)
+    peq = _peq(b)
+    full = (1 << m) - 1
+    top = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    for j, ch in enumerate(a, start=1):
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        # The top DP row is 0..n, so every column shifts in a +1 horizontal delta.
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        if max_dist is not None and score - (n - j) > max_dist:
+            return max_dist + 1
+    return score if max_dist is None else min(score, max_dist + 1)
+
+
+def _codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+class PackedWords:
+    """
+    A word list as a zero-padded code point matrix, so one query can be scored
+    against every word (or a subset of rows) with the bit-parallel kernel run as
+    NumPy column operations across all rows at once.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        self.words = list(words)
+        self.lengths = np.asarray([len(w) for w in self.words], dtype=np.int32)
+        width = int(self.lengths.max()) if len(self.words) else 0
+        self.codes = np.zeros((len(self.words), width), dtype=np.uint32)
+        for i, word in enumerate(self.words):
+            if word:
+                self.codes[i, : len(word)] = _codes(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def distances(
+        self,
+        query: str,
+        max_dist: Optional[int] = None,
+        *,
+        rows: Optional[Sequence[int]] = None,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        levenshtein(query, word) for every word, or for words[rows] in that order.
+        limit compares only the first limit characters of each word.
+        """
+        codes = self.codes
+        lengths = self.lengths
+        if rows is not None:
+            rows = np.asarray(rows, dtype=np.intp)
+            codes = codes[rows]
+            lengths = lengths[rows]
+        width = codes.shape[1]
+        if limit is not None:
+            width = min(width, max(0, int(limit)))
+            lengths = np.minimum(lengths, width)
+        m = len(query)
+        if m > _BATCH_MAX_QUERY:
+            picked = self.words if rows is None else [self.words[r] for r in rows.tolist()]
+            return np.asarray(
+                [levenshtein(query, w[:width], max_dist) for w in picked], dtype=np.int32
+            ).reshape(-1)
+        if m == 0 or len(lengths) == 0:
+            out = lengths.astype(np.int32)
+            return out if max_dist is None else np.minimum(out, max_dist + 1)
+
+        alphabet, slots = np.unique(_codes(query), return_inverse=True)
+        # One extra all-zero mask for characters the query does not contain.
+        peq = np.zeros(len(alphabet) + 1, dtype=np.uint64)
+        for i, slot in enumerate(slots.tolist()):
+            peq[slot] |= np.uint64(1 << i)
+        full = np.uint64((1 << m) - 1)
+        top = np.uint64(1 << (m - 1))
+        one = np.uint64(1)
+        zero = np.uint64(0)
+
+        count = len(lengths)
+        out = np.full(count, m, dtype=np.int32)
+        live = np.arange(count)
+        pv = np.full(count, full, dtype=np.uint64)
+        mv = np.zeros(count, dtype=np.uint64)
+        score = np.full(count, m, dtype=np.int32)
+        cols = codes[:, :width]
+        lens = lengths
+        done = np.zeros(count, dtype=bool)
+        for j in range(width):
+            col = cols[:, j]
+            slot = np.searchsorted(alphabet, col)
+            slot[slot >= len(alphabet)] = len(alphabet)
+            hit = slot < len(alphabet)
+            hit[hit] = alphabet[slot[hit]] == col[hit]
+            eq = np.where(hit, peq[slot], zero)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            active = lens > j
+            score += (active & ((ph & top) != zero)).astype(np.int32)
+            score -= (active & ((mh & top) != zero)).astype(np.int32)
+            ph = ((ph << one) | one) & full
+            mh = (mh << one) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+            if max_dist is None:
+                continue
+            alive = score - np.maximum(lens - (j + 1), 0) <= max_dist
+            if alive.all():
+                continue
+            if not alive.any():
+                done[live] = True
+                live, score = live[:0], score[:0]
+                break
+            if alive.mean() < _COMPACT_BELOW:
+                done[live[~alive]] = True
+                live, pv, mv, score, cols, lens = (
+                    live[alive], pv[alive], mv[alive], score[alive], cols[alive], lens[alive]
+                )
+        out[live] = score
+        if max_dist is not None:
+            out[done] = max_dist + 1
+            np.minimum(out, max_dist + 1, out=out)
+        return out
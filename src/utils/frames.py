@@ -1,15 +1,77 @@
 # utils/frames.py
 from __future__ import annotations
+import threading
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import cv2
 import numpy as np
 
+
+class FramePlanes:
+    """
+    Lazily derived planes of one BGR frame (grayscale, HSV, gray pyramid levels).
+    Each plane is computed on first use and shared by every detector cropping the
+    same frame, so a colour conversion happens once per frame instead of per ROI.
+    Planes have the frame's pixel grid, so crop_relative() on them lines up with
+    the same crop of the BGR frame.
+    """
+
+    def __init__(self, bgr: np.ndarray):
+        self.bgr = bgr
+        self._gray: Optional[np.ndarray] = None
+        self._hsv: Optional[np.ndarray] = None
+        self._pyramid: Dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            with self._lock:
+                if self._gray is None:
+                    self._gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    @property
+    def hsv(self) -> np.ndarray:
+        if self._hsv is None:
+            with self._lock:
+                if self._hsv is None:
+                    self._hsv = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2HSV)
+        return self._hsv
+
+    def pyramid(self, level: int) -> np.ndarray:
+        """Grayscale pyramid level: 0 = full size, 1 = half, 2 = quarter, ..."""
+        if level <= 0:
+            return self.gray
+        cached = self._pyramid.get(level)
+        if cached is not None:
+            return cached
+        parent = self.pyramid(level - 1)
+        with self._lock:
+            cached = self._pyramid.get(level)
+            if cached is None:
+                cached = cv2.pyrDown(parent)
+                self._pyramid[level] = cached
+        return cached
+
+    @property
+    def half(self) -> np.ndarray:
+        return self.pyramid(1)
+
+    @property
+    def quarter(self) -> np.ndarray:
+        return self.pyramid(2)
+
+
 @dataclass
 class FrameBundle:
     native: np.ndarray
+    seq: int = 0  # FrameSource publish sequence (0 = not published by a FrameSource)
+    timestamp: Optional[float] = None  # time.time() when captured
+    captured_at: Optional[float] = None  # time.perf_counter() when captured (latency tracing)
     _norm_cache: Optional[np.ndarray] = None
     _norm_key: Optional[Tuple[int, int, int]] = None  # (ref_w, ref_h, allow_upscale)
+    _planes_cache: Optional[FramePlanes] = None
 
     def normalized(
         self,
@@ -45,6 +107,104 @@ class FrameBundle:
         self._norm_key = key
         return out
 
+    def planes(
+        self,
+        ref_w: int = 1280,
+        ref_h: int = 720,
+        allow_upscale: bool = False,
+    ) -> FramePlanes:
+        """Derived-plane cache for normalized(ref_w, ref_h, allow_upscale)."""
+        norm = self.normalized(ref_w, ref_h, allow_upscale)
+        if self._planes_cache is None or self._planes_cache.bgr is not norm:
+            self._planes_cache = FramePlanes(norm)
+        return self._planes_cache
+
     def invalidate_cache(self):
         self._norm_cache = None
         self._norm_key = None
+        self._planes_cache = None
+
+
+@dataclass(frozen=True)
+class TileState:
+    """Snapshot of FrameChangeTracker for one frame (safe to hand to another thread)."""
+    generation: int
+    tile_generation: np.ndarray  # (rows, cols) generation at which each tile last changed
+    col_edges: np.ndarray  # relative x tile edges, len cols + 1
+    row_edges: np.ndarray  # relative y tile edges, len rows + 1
+
+
+class FrameChangeTracker:
+    """
+    Cheap frame-difference gate: per-tile mean (and peak) absolute difference on the
+    quarter resolution gray plane. Each tile is compared with its reference (the tile
+    as it was when it last changed), so slow drift still accumulates into a change.
+    tile_generation records the tracker generation at which each tile last changed.
+    """
+
+    def __init__(
+        self,
+        grid: Tuple[int, int] = (16, 9),
+        threshold: float = 1.5,
+        peak_threshold: float = 48.0,
+    ):
+        self.grid = grid  # (cols, rows)
+        self.threshold = float(threshold)
+        # A small glyph change (one HP digit) barely moves a tile's mean, so a large
+        # single-pixel difference also marks the tile.
+        self.peak_threshold = float(peak_threshold)
+        self.generation = 0
+        self.tile_generation: Optional[np.ndarray] = None
+        self._ref: Optional[np.ndarray] = None
+        self._ys: Optional[np.ndarray] = None
+        self._xs: Optional[np.ndarray] = None
+        self._shape: Tuple[int, int] = (0, 0)
+
+    def reset(self) -> None:
+        self._ref = None
+        self.tile_generation = None
+
+    def _tile_edges(self, h: int, w: int) -> None:
+        cols = max(1, min(int(self.grid[0]), w))
+        rows = max(1, min(int(self.grid[1]), h))
+        self._ys = np.linspace(0, h, rows + 1).astype(np.int64)
+        self._xs = np.linspace(0, w, cols + 1).astype(np.int64)
+        self._shape = (h, w)
+
+    def update(self, planes: FramePlanes) -> np.ndarray:
+        """Feed the next frame; returns the (rows, cols) bool mask of tiles that changed."""
+        thumb = planes.quarter
+        self.generation += 1
+        if self._ref is None or self._ref.shape != thumb.shape:
+            h, w = thumb.shape[:2]
+            self._tile_edges(h, w)
+            self._ref = thumb.copy()
+            shape = (len(self._ys) - 1, len(self._xs) - 1)
+            self.tile_generation = np.full(shape, self.generation, dtype=np.int64)
+            return np.ones(shape, dtype=bool)
+
+        diff = cv2.absdiff(thumb, self._ref)
+        sums = np.add.reduceat(
+            np.add.reduceat(diff.astype(np.float32), self._ys[:-1], axis=0), self._xs[:-1], axis=1
+        )
+        peaks = np.maximum.reduceat(np.maximum.reduceat(diff, self._ys[:-1], axis=0), self._xs[:-1], axis=1)
+        heights = np.diff(self._ys)
+        widths = np.diff(self._xs)
+        tile_mad = sums / np.outer(heights, widths)
+        dirty = (tile_mad > self.threshold) | (peaks > self.peak_threshold)
+        if dirty.any():
+            mask = np.repeat(np.repeat(dirty, heights, axis=0), widths, axis=1)
+            self._ref[mask] = thumb[mask]
+            self.tile_generation[dirty] = self.generation
+        return dirty
+
+    def snapshot(self) -> Optional[TileState]:
+        if self.tile_generation is None or self._ys is None or self._xs is None:
+            return None
+        h, w = self._shape
+        return TileState(
+            generation=self.generation,
+            tile_generation=self.tile_generation.copy(),
+            col_edges=self._xs / float(max(1, w)),
+            row_edges=self._ys / float(max(1, h)),
+        )
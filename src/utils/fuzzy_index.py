@@ -0,0 +1,156 @@
+# utils/fuzzy_index.py
+from __future__ import annotations
+import hashlib
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from utils.edit_distance import PackedWords, levenshtein
+
+
+def _deletes(word: str, depth: int) -> Set[str]:
+    """word plus every string reachable from it by deleting up to depth characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(depth):
+        nxt: Set[str] = set()
+        for s in frontier:
+            for i in range(len(s)):
+                nxt.add(s[:i] + s[i + 1:])
+        out |= nxt
+        frontier = nxt
+    return out
+
+
+def _key(text: str) -> int:
+    # Stable across processes (unlike hash()), so a built index can be stored.
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class FuzzyIndex:
+    """
+    Nearest-word lookups over a fixed word list under Levenshtein distance.
+
+    within() uses a symmetric-deletion (SymSpell) dictionary: two words are at most
+    k edits apart only if deleting up to k characters from each can make them
+    equal, so the candidates are the words sharing a deletion variant with the
+    query, found by hash in a sorted array and then verified. best_ratio() walks
+    words grouped by length, most similar length first, and stops once length
+    alone rules out beating the best score found, scoring each length group in one
+    batched call. distances() scores a query against the whole list the same way.
+
+    Both return (list index, exact distance) in list order and leave tie-breaks
+    to the caller, so results match a linear scan over the same list. Empty words
+    are never returned. Queries beyond the indexed max_dist scan linearly.
+    """
+
+    def __init__(self, words: Sequence[str], max_dist: int = 2):
+        self.max_dist = max(0, int(max_dist))
+        self._words: List[str] = []
+        self._indices: List[List[int]] = []
+        self._node_at: List[int] = []
+        self._by_len: Dict[int, List[int]] = {}
+        self._packed = PackedWords(words)
+        node_of: Dict[str, int] = {}
+        for i, word in enumerate(words):
+            if not word:
+                self._node_at.append(-1)
+                continue
+            node = node_of.get(word)
+            if node is None:
+                node = node_of[word] = len(self._words)
+                self._words.append(word)
+                self._indices.append([])
+                self._by_len.setdefault(len(word), []).append(node)
+            self._indices[node].append(i)
+            self._node_at.append(node)
+        keys: List[int] = []
+        nodes: List[int] = []
+        for node, word in enumerate(self._words):
+            for variant in _deletes(word, self.max_dist):
+                keys.append(_key(variant))
+                nodes.append(node)
+        keys_arr = np.asarray(keys, dtype=np.uint64)
+        order = np.argsort(keys_arr, kind="stable")
+        self._keys = keys_arr[order]
+        self._nodes = np.asarray(nodes, dtype=np.int32)[order]
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Length of every list entry, empty ones included."""
+        return self._packed.lengths
+
+    @property
+    def longest(self) -> int:
+        """Length of the longest list entry (0 for an empty list)."""
+        return int(self._packed.codes.shape[1])
+
+    def distances(self, query: str, max_dist: Optional[int] = None) -> np.ndarray:
+        """levenshtein(query, word, max_dist) for every list entry, empty ones included."""
+        return self._packed.distances(query, max_dist)
+
+    def _candidates(self, query: str, max_dist: int) -> Iterable[int]:
+        if max_dist > self.max_dist:
+            return range(len(self._words))
+        qkeys = np.asarray([_key(v) for v in _deletes(query, max_dist)], dtype=np.uint64)
+        lo = np.searchsorted(self._keys, qkeys, side="left")
+        hi = np.searchsorted(self._keys, qkeys, side="right")
+        found: Set[int] = set()
+        for a, b in zip(lo.tolist(), hi.tolist()):
+            if b > a:
+                found.update(self._nodes[a:b].tolist())
+        return found
+
+    def within(self, query: str, max_dist: int) -> List[Tuple[int, int]]:
+        """(index, distance) for every word within max_dist of query."""
+        out: List[Tuple[int, int]] = []
+        for node in self._candidates(query, max_dist):
+            d = levenshtein(query, self._words[node], max_dist)
+            if d <= max_dist:
+                out.extend((i, d) for i in self._indices[node])
+        out.sort()
+        return out
+
+    def best_ratio(self, query: str, indices: Optional[Iterable[int]] = None) -> List[Tuple[int, int]]:
+        """
+        (index, distance) for every word with the highest 1 - distance / max(len(query), len(word)),
+        optionally only among the given list indices.
+        """
+        if not query:
+            return []
+        allowed: Optional[Set[int]] = None
+        by_len = self._by_len
+        if indices is not None:
+            allowed = set(indices)
+            by_len = {}
+            for node in sorted({self._node_at[i] for i in allowed if 0 <= i < len(self._node_at)} - {-1}):
+                by_len.setdefault(len(self._words[node]), []).append(node)
+        qlen = len(query)
+        # Distance is at least the length gap, so min/max length caps each group's score.
+        lengths = sorted(by_len, key=lambda n: (-min(n, qlen) / max(n, qlen), n))
+        best_score = -1.0
+        best: List[Tuple[int, int]] = []
+        for length in lengths:
+            max_len = max(qlen, length)
+            if min(qlen, length) / max_len < best_score - 1e-9:
+                break
+            nodes = by_len[length]
+            # Only distances that can tie the best score so far need to be exact.
+            cap = max_len if best_score < 0 else int((1.0 - best_score) * max_len + 1e-9)
+            rows = [self._indices[node][0] for node in nodes]
+            dists = self._packed.distances(query, cap, rows=rows, limit=length).tolist()
+            for node, d in zip(nodes, dists):
+                if d > cap:
+                    continue
+                score = 1.0 - (d / max_len)
+                hits = [(i, d) for i in self._indices[node] if allowed is None or i in allowed]
+                if score > best_score:
+                    best_score = score
+                    best = hits
+                elif score == best_score:
+                    best.extend(hits)
+        best.sort()
+        return best
@@ -0,0 +1,95 @@
+# utils/latency.py
+from __future__ import annotations
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+import numpy as np
+
+# Pipeline stages, in order. Every value is in milliseconds.
+#   normalize: frame captured        -> normalized + handed to the analysis worker
+#   queue:     handed to the worker  -> worker picked it up
+#   analysis:  worker picked it up   -> analyze_game_state() returned
+#   display:   analysis done         -> first UI tick that rendered the result
+#   total:     frame captured        -> displayed
+LATENCY_STAGES = ("normalize", "queue", "analysis", "display", "total")
+
+
+class RollingHistogram:
+    """Latency samples (ms) over a sliding window; percentiles and bucket counts on demand."""
+
+    def __init__(self, window: int = 600):
+        self.window = max(1, int(window))
+        self.count = 0  # samples ever recorded
+        self._samples: Deque[float] = deque(maxlen=self.window)
+
+    def add(self, value_ms: float) -> None:
+        self._samples.append(float(value_ms))
+        self.count += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentiles(self, pcts: Sequence[float] = (50, 95, 99)) -> List[float]:
+        if not self._samples:
+            return [float("nan")] * len(pcts)
+        return [float(v) for v in np.percentile(np.fromiter(self._samples, dtype=np.float64), pcts)]
+
+    def histogram(self, edges_ms: Sequence[float]) -> List[int]:
+        """Counts per [edges[i], edges[i+1]) bucket, plus one overflow bucket."""
+        samples = np.fromiter(self._samples, dtype=np.float64)
+        bins = np.searchsorted(np.asarray(edges_ms, dtype=np.float64), samples, side="right")
+        return np.bincount(bins, minlength=len(edges_ms) + 1)[1:].tolist()
+
+    def max(self) -> float:
+        return max(self._samples) if self._samples else float("nan")
+
+
+class LatencyTracker:
+    """Per-stage rolling histograms for the capture -> analysis -> display pipeline."""
+
+    def __init__(self, window: int = 600):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, RollingHistogram] = {name: RollingHistogram(window) for name in LATENCY_STAGES}
+
+    def record(self, stage: str, value_ms: float) -> None:
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = self._stages[stage] = RollingHistogram(next(iter(self._stages.values())).window)
+            hist.add(value_ms)
+
+    def record_frame(
+        self,
+        *,
+        captured_at: Optional[float],
+        submitted_at: Optional[float],
+        started_at: Optional[float],
+        done_at: Optional[float],
+        displayed_at: float,
+    ) -> None:
+        """All times are time.perf_counter() values; missing stages are skipped."""
+        marks = [captured_at, submitted_at, started_at, done_at, displayed_at]
+        for stage, start, end in zip(LATENCY_STAGES, marks, marks[1:]):
+            if start is not None and end is not None:
+                self.record(stage, (end - start) * 1000.0)
+        if captured_at is not None:
+            self.record("total", (displayed_at - captured_at) * 1000.0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for name, hist in self._stages.items():
+                p50, p95, p99 = hist.percentiles((50, 95, 99))
+                out[name] = {"n": len(hist), "p50": p50, "p95": p95, "p99": p99, "max": hist.max()}
+        return out
+
+    def format_summary(self) -> List[str]:
+        lines = []
+        for name, s in self.summary().items():
+            if not s["n"]:
+                continue
+            lines.append(
+                f"[latency] {name:<9} n={s['n']:<4d} p50={s['p50']:6.1f}ms p95={s['p95']:6.1f}ms "
+                f"p99={s['p99']:6.1f}ms max={s['max']:6.1f}ms"
+            )
+        return lines
@@ -0,0 +1,83 @@
+# utils/lru.py
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """Thread-safe least-recently-used map with hit/miss counters. Stored values may be None."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        # Membership only: no recency update, no hit/miss counting.
+        with self._lock:
+            return key in self._entries
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns (hit, value); value is only meaningful on a hit."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def cached(self, key: Hashable, compute: Callable[[], T]) -> T:
+        # compute() runs outside the lock; concurrent misses on one key both compute.
+        hit, value = self.lookup(key)
+        if hit:
+            return value
+        value = compute()
+        self.store(key, value)
+        return value
+
+    def resize(self, max_entries: int) -> None:
+        with self._lock:
+            self.max_entries = max(1, int(max_entries))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of (key, value) pairs, least recently used first; no recency update."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
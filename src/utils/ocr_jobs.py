@@ -0,0 +1,134 @@
+# utils/ocr_jobs.py
+from __future__ import annotations
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+
+class OCRJobService:
+    """
+    Background OCR for the analysis loop.
+
+    Detectors submit a job for one or more slot keys and keep going with the values
+    they already have; a later analysis tick take()s the finished result per key and
+    merges it. A key with a job in flight (or a result not yet taken) is never
+    submitted again, so each slot has at most one outstanding read.
+    Group jobs return {key: result} for every key they were submitted for.
+    """
+
+    def __init__(self, workers: int = 2):
+        self.workers = max(1, int(workers))
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Hashable, Future] = {}
+        self._done: Dict[Hashable, Any] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def configure(self, *, workers: Optional[int] = None) -> None:
+        if workers is not None and max(1, int(workers)) != self.workers:
+            with self._lock:
+                self.workers = max(1, int(workers))
+                old, self._pool = self._pool, None
+            if old is not None:
+                old.shutdown(wait=False)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-job")
+        return self._pool
+
+    def busy(self, key: Hashable) -> bool:
+        """True while the key has a job in flight or a finished result waiting to be taken."""
+        with self._lock:
+            return key in self._pending or key in self._done
+
+    def has_any(self, keys: Iterable[Hashable]) -> bool:
+        with self._lock:
+            return any(k in self._pending or k in self._done for k in keys)
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> bool:
+        """Queue fn() for one key; returns False (and does nothing) if the key is busy."""
+        return self.submit_group([key], lambda: {key: fn()})
+
+    def submit_group(self, keys: Sequence[Hashable], fn: Callable[[], Dict[Hashable, Any]]) -> bool:
+        """Queue one job covering several keys; all of them must be idle."""
+        keys = list(keys)
+        if not keys:
+            return False
+        with self._lock:
+            if any(k in self._pending or k in self._done for k in keys):
+                return False
+            future = self._get_pool().submit(fn)
+            generation = self._generation
+            for k in keys:
+                self._pending[k] = future
+            self.submitted += 1
+        future.add_done_callback(lambda f: self._finish(keys, f, generation))
+        return True
+
+    def _finish(self, keys: Sequence[Hashable], future: Future, generation: int) -> None:
+        if future.cancelled():
+            return
+        try:
+            results = future.result()
+        except Exception as exc:
+            results = None
+            print(f"[ocr] async job failed for {list(keys)}: {exc}")
+        with self._lock:
+            if generation != self._generation:
+                return
+            for k in keys:
+                if self._pending.get(k) is future:
+                    del self._pending[k]
+                    if results is not None and k in results:
+                        self._done[k] = results[k]
+            if results is None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def take(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, result) once the key's job has finished, then forgets it; else (False, None)."""
+        with self._lock:
+            if key in self._done:
+                return True, self._done.pop(key)
+        return False, None
+
+    def discard(self, keys: Iterable[Hashable]) -> None:
+        """Forget the given keys: their finished results are dropped and in-flight ones discarded."""
+        with self._lock:
+            for k in keys:
+                self._done.pop(k, None)
+                future = self._pending.pop(k, None)
+                if future is not None and future not in self._pending.values():
+                    future.cancel()
+
+    def clear(self) -> None:
+        """Drop finished results and disown in-flight jobs (their results are discarded)."""
+        with self._lock:
+            self._generation += 1
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._done.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(set(map(id, self._pending.values()))),
+                "ready": len(self._done),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def shutdown(self) -> None:
+        self.clear()
+        with self._lock:
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=False, cancel_futures=True)
+
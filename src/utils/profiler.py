@@ -0,0 +1,133 @@
+# utils/profiler.py
+from __future__ import annotations
+import json
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+from utils.latency import RollingHistogram
+
+# Shared no-op returned by stage() whenever nothing is being recorded, so an
+# instrumented call site costs one attribute check and an empty with-block.
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("_profiler", "_name", "_t0")
+
+    def __init__(self, profiler: "StageProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+        self._t0 = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._profiler.record(self._name, (time.perf_counter() - self._t0) * 1000.0)
+
+
+class StageProfiler:
+    """
+    Named stage timers (ms) with rolling p50/p95/p99 and call counts.
+    Off by default. When enabled, only every `sample_every`-th analysed frame is
+    timed (begin_frame() decides per thread); everything else gets the no-op stage.
+    """
+
+    def __init__(self, *, enabled: bool = False, sample_every: int = 1, window: int = 512):
+        self.enabled = enabled
+        self.sample_every = max(1, int(sample_every))
+        self.window = max(1, int(window))
+        self._frames = 0
+        self._lock = threading.Lock()
+        self._stages: Dict[str, RollingHistogram] = {}
+        self._local = threading.local()
+
+    def configure(
+        self,
+        *,
+        enabled: Optional[bool] = None,
+        sample_every: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> None:
+        if enabled is not None:
+            self.enabled = bool(enabled)
+        if sample_every is not None:
+            self.sample_every = max(1, int(sample_every))
+        if window is not None and int(window) != self.window:
+            self.window = max(1, int(window))
+            self.reset()
+
+    def begin_frame(self) -> bool:
+        """Start a unit of work on this thread; returns whether its stages are sampled."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            self._frames += 1
+            sampled = (self._frames - 1) % self.sample_every == 0
+        self._local.sampled = sampled
+        return sampled
+
+    def active(self) -> bool:
+        return self.enabled and getattr(self._local, "sampled", True)
+
+    def stage(self, name: str):
+        if not self.enabled or not getattr(self._local, "sampled", True):
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name: str, value_ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            hist = self._stages.get(name)
+            if hist is None:
+                hist = self._stages[name] = RollingHistogram(self.window)
+            hist.add(value_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._frames = 0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for name in sorted(self._stages):
+                hist = self._stages[name]
+                p50, p95, p99 = hist.percentiles((50, 95, 99))
+                out[name] = {"count": hist.count, "p50": p50, "p95": p95, "p99": p99, "max": hist.max()}
+        return out
+
+    def format_summary(self) -> List[str]:
+        stats = self.summary()
+        if not stats:
+            return ["[profile] no samples"]
+        width = max(len(name) for name in stats)
+        return [
+            f"[profile] {name:<{width}} n={s['count']:<6d} p50={s['p50']:7.2f}ms "
+            f"p95={s['p95']:7.2f}ms p99={s['p99']:7.2f}ms max={s['max']:7.2f}ms"
+            for name, s in stats.items()
+        ]
+
+    def dump_json(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "generated_at": time.time(),
+            "sample_every": self.sample_every,
+            "window": self.window,
+            "stages": self.summary(),
+        }
+        path.write_text(json.dumps(payload, indent=2, allow_nan=True), encoding="utf-8")
+        return path
+
+
+PROFILER = StageProfiler()
+
+
+def profile_stage(name: str):
+    """with profile_stage("buttons.pass"): ...  -- times the block on the global profiler."""
+    return PROFILER.stage(name)
@@ -0,0 +1,89 @@
+# utils/region_cache.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import numpy as np
+from utils.frames import TileState
+
+T = TypeVar("T")
+
+
+class RegionCache:
+    """
+    Memoizes per-ROI detector results across frames.
+    An entry stays valid while none of the change-tracker tiles overlapping its ROI
+    has changed since the frame the entry was computed on. Without tile state every
+    lookup misses, so callers behave exactly as if there were no cache.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[int, Any]] = {}
+        self._tiles: Optional[TileState] = None
+
+    def begin_frame(self, tiles: Optional[TileState]) -> None:
+        if tiles is None or (
+            self._tiles is not None and tiles.tile_generation.shape != self._tiles.tile_generation.shape
+        ):
+            self._entries.clear()
+        self._tiles = tiles
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _last_change(self, rel_roi: Tuple[float, float, float, float]) -> Optional[int]:
+        tiles = self._tiles
+        if tiles is None:
+            return None
+        x1, y1, x2, y2 = rel_roi
+        cols = len(tiles.col_edges) - 1
+        rows = len(tiles.row_edges) - 1
+        c1 = max(0, int(np.searchsorted(tiles.col_edges, x1, side="right")) - 1)
+        c2 = min(cols, max(c1 + 1, int(np.searchsorted(tiles.col_edges, x2, side="left"))))
+        r1 = max(0, int(np.searchsorted(tiles.row_edges, y1, side="right")) - 1)
+        r2 = min(rows, max(r1 + 1, int(np.searchsorted(tiles.row_edges, y2, side="left"))))
+        return int(tiles.tile_generation[r1:r2, c1:c2].max())
+
+    def lookup(self, key: Hashable, rel_roi: Tuple[float, float, float, float]) -> Tuple[bool, Any]:
+        """Returns (hit, value); value is only meaningful on a hit."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            last_change = self._last_change(rel_roi)
+            if last_change is not None and last_change <= entry[0]:
+                self.hits += 1
+                return True, entry[1]
+        self.misses += 1
+        return False, None
+
+    def store(self, key: Hashable, value: Any) -> None:
+        if self._tiles is None:
+            return
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (self._tiles.generation, value)
+
+    def cached(
+        self,
+        key: Hashable,
+        rel_roi: Tuple[float, float, float, float],
+        compute: Callable[[], T],
+    ) -> T:
+        hit, value = self.lookup(key, rel_roi)
+        if hit:
+            return value
+        value = compute()
+        self.store(key, value)
+        return value
+
+
+def region_cached(
+    cache: Optional[RegionCache],
+    key: Hashable,
+    rel_roi: Tuple[float, float, float, float],
+    compute: Callable[[], T],
+) -> T:
+    """cache.cached() that tolerates cache=None (detectors called without tile state)."""
+    if cache is None:
+        return compute()
+    return cache.cached(key, rel_roi, compute)
@@ -0,0 +1,173 @@
+# utils/session_archive.py
+from __future__ import annotations
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+
+# A session archive is a directory of append-only chunk files:
+#   chunk_00000.npy + chunk_00000_t.npy   raw frames (N, H, W, C) uint8 + float64 timestamps (mmap-able)
+#   chunk_00001.npz                       compressed chunk with "frames" and "t" arrays
+# Chunks are numbered in capture order; frame shape may change between chunks.
+CHUNK_PREFIX = "chunk_"
+TIMESTAMP_SUFFIX = "_t"
+
+
+def chunk_stem(index: int) -> str:
+    return f"{CHUNK_PREFIX}{index:05d}"
+
+
+def list_chunks(path: Path) -> List[Path]:
+    path = Path(path)
+    chunks = []
+    for p in path.iterdir():
+        if not p.is_file() or not p.name.startswith(CHUNK_PREFIX):
+            continue
+        if p.suffix == ".npz" or (p.suffix == ".npy" and not p.stem.endswith(TIMESTAMP_SUFFIX)):
+            chunks.append(p)
+    chunks.sort(key=lambda p: p.stem)
+    return chunks
+
+
+def is_session_archive(path: Path) -> bool:
+    path = Path(path)
+    return path.is_dir() and bool(list_chunks(path))
+
+
+def load_chunk(chunk_path: Path, *, mmap: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    chunk_path = Path(chunk_path)
+    if chunk_path.suffix == ".npz":
+        with np.load(chunk_path) as data:
+            return data["frames"], data["t"]
+    frames = np.load(chunk_path, mmap_mode="r" if mmap else None)
+    ts_path = chunk_path.with_name(f"{chunk_path.stem}{TIMESTAMP_SUFFIX}.npy")
+    if ts_path.exists():
+        timestamps = np.load(ts_path)
+    else:
+        timestamps = np.full((frames.shape[0],), np.nan, dtype=np.float64)
+    return frames, timestamps
+
+
+def iter_archive_frames(path: Path, *, mmap: bool = True) -> Iterator[Tuple[float, np.ndarray]]:
+    for chunk_path in list_chunks(Path(path)):
+        frames, timestamps = load_chunk(chunk_path, mmap=mmap)
+        for i in range(frames.shape[0]):
+            yield float(timestamps[i]), frames[i]
+
+
+def next_chunk_index(path: Path) -> int:
+    path = Path(path)
+    if not path.is_dir():
+        return 0
+    last = -1
+    for p in list_chunks(path):
+        try:
+            last = max(last, int(p.stem[len(CHUNK_PREFIX):]))
+        except ValueError:
+            continue
+    return last + 1
+
+
+class SessionRecorder:
+    """
+    Streams captured frames into a session archive on a background writer thread.
+    submit() never blocks: when the bounded queue is full the frame is dropped and counted.
+    """
+
+    def __init__(
+        self,
+        out_dir,
+        *,
+        every_n: int = 1,
+        chunk_frames: int = 120,
+        compressed: bool = False,
+        queue_size: int = 240,
+    ):
+        self.out_dir = Path(out_dir)
+        self.every_n = max(1, int(every_n))
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.compressed = compressed
+        self.frames_seen = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.chunks_written = 0
+        self._last_native = None
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._chunk_index = next_chunk_index(self.out_dir)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._started = False
+
+    def start(self) -> None:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self._started = True
+        self._thread.start()
+
+    def submit(self, bundle) -> bool:
+        native = bundle.native
+        if native is None or native is self._last_native:
+            return False
+        self._last_native = native
+        self.frames_seen += 1
+        if (self.frames_seen - 1) % self.every_n:
+            return False
+        try:
+            ts = bundle.timestamp if bundle.timestamp is not None else time.time()
+            self._queue.put_nowait((ts, np.ascontiguousarray(native)))
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+        return True
+
+    def _run(self) -> None:
+        frames: List[np.ndarray] = []
+        stamps: List[float] = []
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            ts, frame = item
+            if frames and frame.shape != frames[0].shape:
+                self._flush(frames, stamps)
+                frames, stamps = [], []
+            frames.append(frame)
+            stamps.append(ts)
+            if len(frames) >= self.chunk_frames:
+                self._flush(frames, stamps)
+                frames, stamps = [], []
+        if frames:
+            self._flush(frames, stamps)
+
+    def _flush(self, frames: List[np.ndarray], stamps: List[float]) -> None:
+        stem = chunk_stem(self._chunk_index)
+        self._chunk_index += 1
+        data = np.stack(frames)
+        ts = np.asarray(stamps, dtype=np.float64)
+        try:
+            if self.compressed:
+                self._write_atomic(self.out_dir / f"{stem}.npz", lambda f: np.savez_compressed(f, frames=data, t=ts))
+            else:
+                # Timestamps first so a frames chunk never appears without them.
+                self._write_atomic(self.out_dir / f"{stem}{TIMESTAMP_SUFFIX}.npy", lambda f: np.save(f, ts))
+                self._write_atomic(self.out_dir / f"{stem}.npy", lambda f: np.save(f, data))
+        except Exception as exc:
+            print(f"[record] failed to write {stem}: {exc}")
+            return
+        self.frames_written += len(frames)
+        self.chunks_written += 1
+
+    @staticmethod
+    def _write_atomic(path: Path, write) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        if not self._started:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+        self._started = False
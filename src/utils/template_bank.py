@@ -0,0 +1,266 @@
+# utils/template_bank.py
+from __future__ import annotations
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+import cv2
+import numpy as np
+
+T = TypeVar("T")
+
+ASSETS_DIR = Path("src/assets")
+
+
+@dataclass(frozen=True)
+class Template:
+    """One decoded grayscale template."""
+    path: Path
+    image: np.ndarray  # uint8, C-contiguous
+
+    @property
+    def name(self) -> str:
+        return self.path.stem
+
+    @property
+    def label(self) -> str:
+        return self.path.parent.name
+
+
+@dataclass
+class _DirEntry:
+    path: Path
+    files: List[Template]
+    subdirs: List[Path]
+
+
+class TemplateStack:
+    """
+    Same-shape templates stacked into one contiguous (N, h*w) matrix of zero-mean,
+    unit-norm rows, so scoring a patch against all of them is a single mat-vec.
+    Scores match cv2.TM_CCOEFF_NORMED for equal-size inputs, except that a flat
+    (constant) template or patch scores 0, where cv2 can return 1.
+    """
+
+    def __init__(self, images: Sequence[np.ndarray]):
+        self.shape: Tuple[int, int] = images[0].shape[:2]
+        self.images = np.ascontiguousarray(np.stack(images))
+        flat = self.images.reshape(len(images), -1).astype(np.float32)
+        self.means = flat.mean(axis=1)
+        centered = flat - self.means[:, None]
+        self.norms = np.linalg.norm(centered, axis=1)
+        safe = np.where(self.norms > 0, self.norms, 1.0)
+        self.unit = np.ascontiguousarray(centered / safe[:, None])
+        self.unit[self.norms <= 0] = 0.0
+
+    def __len__(self) -> int:
+        return self.images.shape[0]
+
+    def ncc(self, patch_gray: np.ndarray) -> np.ndarray:
+        """Normalized cross-correlation of one patch (already at self.shape) with every template."""
+        p = patch_gray.astype(np.float32).ravel()
+        p -= p.mean()
+        pn = float(np.linalg.norm(p))
+        if pn <= 0:
+            return np.zeros((len(self),), dtype=np.float32)
+        return (self.unit @ p) / pn
+
+
+class TemplateGroup:
+    """
+    An ordered list of labelled templates, grouped into TemplateStacks by shape.
+    ncc_resized() resizes the crop once per distinct template shape and returns
+    scores in the original template order (so first-best tie-breaks are preserved).
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, np.ndarray]]):
+        self.labels: List[str] = [label for label, _ in entries]
+        by_shape: Dict[Tuple[int, int], List[int]] = {}
+        for i, (_, img) in enumerate(entries):
+            by_shape.setdefault(img.shape[:2], []).append(i)
+        self._stacks: List[Tuple[np.ndarray, TemplateStack]] = [
+            (np.asarray(idx, dtype=np.int64), TemplateStack([entries[i][1] for i in idx]))
+            for idx in by_shape.values()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def ncc_resized(self, crop_gray: np.ndarray) -> np.ndarray:
+        scores = np.full((len(self.labels),), -1.0, dtype=np.float32)
+        if crop_gray.size == 0:
+            return scores
+        for idx, stack in self._stacks:
+            th, tw = stack.shape
+            resized = cv2.resize(crop_gray, (tw, th), interpolation=cv2.INTER_AREA)
+            scores[idx] = stack.ncc(resized)
+        return scores
+
+
+def _dir_key(path: Path) -> str:
+    # Case-insensitive like the Windows filesystem the assets were authored on.
+    return str(Path(path).resolve()).lower()
+
+
+def _read_template(path: Path) -> Optional[Template]:
+    img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+    if img is None or img.size == 0:
+        return None
+    return Template(path=path, image=np.ascontiguousarray(img))
+
+
+# (directory, sorted PNG paths, sorted subdirectory paths) for every directory of a tree.
+TreeLayout = List[Tuple[Path, List[Path], List[Path]]]
+
+
+def scan_tree(root: Path) -> TreeLayout:
+    layout: TreeLayout = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        base = Path(dirpath)
+        dirnames.sort()
+        pngs = sorted(base / f for f in filenames if f.lower().endswith(".png"))
+        layout.append((base, pngs, [base / d for d in dirnames]))
+    return layout
+
+
+def decode_templates(
+    paths: Sequence[Path],
+    *,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+) -> Dict[Path, Optional[Template]]:
+    if parallel and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 2))) as pool:
+            return dict(zip(paths, pool.map(_read_template, paths)))
+    return {p: _read_template(p) for p in paths}
+
+
+class TemplateBank:
+    """
+    Every PNG under the assets tree, decoded once and indexed by directory.
+    Detectors ask for a directory's files/subdirectories instead of globbing and
+    imreading themselves, and memoize their per-aspect selections with cached().
+    Directories outside the preloaded tree are indexed on first use.
+    """
+
+    def __init__(self, root: Path = ASSETS_DIR):
+        self.root = Path(root)
+        self._dirs: Dict[str, _DirEntry] = {}
+        self._memo: Dict[Hashable, object] = {}
+        self._lock = threading.RLock()
+
+    def load_all(
+        self,
+        *,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+        bundle_dir: Optional[Path] = None,
+    ) -> int:
+        """
+        Index and decode the whole root tree; returns the number of templates loaded.
+        With bundle_dir, templates are memory-mapped from the packed bundle there when
+        it is still current, and the bundle is (re)built from the PNGs when it is not.
+        """
+        if not self.root.is_dir():
+            return 0
+        layout = scan_tree(self.root)
+        loaded: Optional[Dict[Path, Optional[Template]]] = None
+        if bundle_dir is not None:
+            # Imported lazily: the bundle module builds on this one.
+            from utils.template_bundle import load_bundle, write_bundle
+            loaded = load_bundle(self.root, layout, Path(bundle_dir))
+            if loaded is None:
+                loaded = decode_templates([p for _, pngs, _ in layout for p in pngs], parallel=parallel, workers=workers)
+                try:
+                    write_bundle(self.root, layout, loaded, Path(bundle_dir))
+                except Exception as exc:
+                    print(f"[templates] bundle write failed: {exc}")
+        if loaded is None:
+            loaded = decode_templates([p for _, pngs, _ in layout for p in pngs], parallel=parallel, workers=workers)
+        self._install(layout, loaded)
+        with self._lock:
+            self._memo.clear()
+        return sum(1 for t in loaded.values() if t is not None)
+
+    def _index_tree(self, root: Path) -> int:
+        root = Path(root)
+        if not root.is_dir():
+            return 0
+        layout = scan_tree(root)
+        loaded = decode_templates([p for _, pngs, _ in layout for p in pngs])
+        self._install(layout, loaded)
+        return sum(1 for t in loaded.values() if t is not None)
+
+    def _install(self, layout: TreeLayout, loaded: Dict[Path, Optional[Template]]) -> None:
+        with self._lock:
+            for base, pngs, subdirs in layout:
+                files = [loaded[p] for p in pngs if loaded.get(p) is not None]
+                self._dirs[_dir_key(base)] = _DirEntry(path=base, files=files, subdirs=subdirs)
+
+    def _entry(self, path: Path) -> Optional[_DirEntry]:
+        key = _dir_key(path)
+        entry = self._dirs.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            entry = self._dirs.get(key)
+            if entry is not None:
+                return entry
+            # Index the nearest directory that exists as spelled (case may differ on disk).
+            path = Path(path)
+            target = path if path.is_dir() else path.parent
+            if target.is_dir() and _dir_key(target) not in self._dirs:
+                self._index_tree(target)
+            return self._dirs.get(key)
+
+    def has_dir(self, path: Path) -> bool:
+        return self._entry(path) is not None
+
+    def files(self, path: Path) -> List[Template]:
+        """Templates directly inside `path`, sorted by file name (like sorted(glob("*.png")))."""
+        entry = self._entry(path)
+        return list(entry.files) if entry is not None else []
+
+    def subdirs(self, path: Path) -> List[Path]:
+        entry = self._entry(path)
+        return list(entry.subdirs) if entry is not None else []
+
+    def cached(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Memoize a detector's derived selection (e.g. templates for one aspect)."""
+        try:
+            return self._memo[key]  # type: ignore[return-value]
+        except KeyError:
+            pass
+        value = build()
+        with self._lock:
+            return self._memo.setdefault(key, value)  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+            self._memo.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "dirs": len(self._dirs),
+                "templates": sum(len(e.files) for e in self._dirs.values()),
+                "selections": len(self._memo),
+            }
+
+
+TEMPLATE_BANK = TemplateBank()
+
+
+def preload_templates(
+    *,
+    parallel: bool = True,
+    workers: Optional[int] = None,
+    bundle_dir: Optional[Path] = None,
+) -> None:
+    t0 = time.perf_counter()
+    count = TEMPLATE_BANK.load_all(parallel=parallel, workers=workers, bundle_dir=bundle_dir)
+    print(f"[templates] loaded {count} templates in {(time.perf_counter() - t0) * 1000.0:.0f} ms")
@@ -0,0 +1,141 @@
+# utils/template_bundle.py
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+import numpy as np
+from utils.template_bank import Template, TreeLayout
+
+# Bump whenever the on-disk layout or the stored statistics change.
+BUNDLE_VERSION = 2
+BUNDLE_BLOB = "templates.bin"
+BUNDLE_INDEX = "templates.json"
+_ALIGN = 64
+
+
+def _rel(root: Path, path: Path) -> str:
+    return path.relative_to(root).as_posix()
+
+
+def _file_stamp(path: Path) -> Optional[Dict[str, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {"mtime_ns": int(st.st_mtime_ns), "size": int(st.st_size)}
+
+
+def write_bundle(
+    root: Path,
+    layout: TreeLayout,
+    loaded: Dict[Path, Optional[Template]],
+    bundle_dir: Path,
+) -> Path:
+    """
+    Pack decoded templates into bundle_dir/templates.bin (raw uint8 planes, 64-byte
+    aligned) with a JSON index holding offsets, shapes and the source PNG mtime/size
+    each entry was decoded from. Both files are replaced atomically.
+    """
+    root = Path(root)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    files: Dict[str, dict] = {}
+    blob_tmp = bundle_dir / (BUNDLE_BLOB + ".tmp")
+    offset = 0
+    with open(blob_tmp, "wb") as fh:
+        for _, pngs, _ in layout:
+            for path in pngs:
+                stamp = _file_stamp(path)
+                if stamp is None:
+                    continue
+                tpl = loaded.get(path)
+                entry = {**stamp, "offset": None}
+                if tpl is not None:
+                    pad = (-offset) % _ALIGN
+                    if pad:
+                        fh.write(b"\0" * pad)
+                        offset += pad
+                    data = np.ascontiguousarray(tpl.image, dtype=np.uint8).tobytes()
+                    fh.write(data)
+                    entry.update(
+                        offset=offset,
+                        shape=list(tpl.image.shape),
+                    )
+                    offset += len(data)
+                files[_rel(root, path)] = entry
+    index = {
+        "version": BUNDLE_VERSION,
+        "root": str(root.resolve()),
+        "blob_size": offset,
+        "files": files,
+    }
+    index_tmp = bundle_dir / (BUNDLE_INDEX + ".tmp")
+    index_tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(blob_tmp, bundle_dir / BUNDLE_BLOB)
+    os.replace(index_tmp, bundle_dir / BUNDLE_INDEX)
+    return bundle_dir / BUNDLE_BLOB
+
+
+def _read_index(bundle_dir: Path) -> Optional[dict]:
+    try:
+        index = json.loads((bundle_dir / BUNDLE_INDEX).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != BUNDLE_VERSION:
+        return None
+    return index
+
+
+def stale_reason(root: Path, layout: TreeLayout, bundle_dir: Path, index: Optional[dict] = None) -> Optional[str]:
+    """Why the bundle in bundle_dir can't serve this tree, or None when it is current."""
+    root = Path(root)
+    if index is None:
+        index = _read_index(bundle_dir)
+    if index is None:
+        return "missing or wrong version"
+    if index.get("root") != str(root.resolve()):
+        return "built for another assets root"
+    files = index.get("files") or {}
+    on_disk = [p for _, pngs, _ in layout for p in pngs]
+    if len(on_disk) != len(files):
+        return "template set changed"
+    for path in on_disk:
+        entry = files.get(_rel(root, path))
+        if entry is None:
+            return f"new template {_rel(root, path)}"
+        stamp = _file_stamp(path)
+        if stamp is None or stamp["mtime_ns"] != entry.get("mtime_ns") or stamp["size"] != entry.get("size"):
+            return f"modified template {_rel(root, path)}"
+    try:
+        if (bundle_dir / BUNDLE_BLOB).stat().st_size != index.get("blob_size"):
+            return "blob size mismatch"
+    except OSError:
+        return "blob missing"
+    return None
+
+
+def load_bundle(root: Path, layout: TreeLayout, bundle_dir: Path) -> Optional[Dict[Path, Optional[Template]]]:
+    """
+    Memory-map the bundle and return {png path: Template} like decode_templates(),
+    or None when it is missing or stale (any PNG added, removed or touched since the build).
+    Template images are read-only views into the mapping.
+    """
+    root = Path(root)
+    index = _read_index(bundle_dir)
+    if index is None or stale_reason(root, layout, bundle_dir, index) is not None:
+        return None
+    files = index["files"]
+    blob_size = int(index.get("blob_size") or 0)
+    mm = np.memmap(bundle_dir / BUNDLE_BLOB, dtype=np.uint8, mode="r") if blob_size else None
+    loaded: Dict[Path, Optional[Template]] = {}
+    for _, pngs, _ in layout:
+        for path in pngs:
+            entry = files[_rel(root, path)]
+            if entry.get("offset") is None or mm is None:
+                loaded[path] = None
+                continue
+            h, w = entry["shape"]
+            start = int(entry["offset"])
+            image = np.asarray(mm[start:start + h * w]).reshape(h, w)
+            loaded[path] = Template(path=path, image=image)
+    return loaded
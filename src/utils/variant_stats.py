@@ -0,0 +1,132 @@
+# utils/variant_stats.py
+from __future__ import annotations
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bump when variant names or the file layout change; older files are ignored.
+_STATS_VERSION = 1
+
+Context = Tuple[str, ...]
+
+
+def _context_key(context: Context) -> str:
+    return "|".join(str(part) for part in context)
+
+
+class VariantScheduler:
+    """
+    Learns which OCR preprocessing variant usually succeeds first for a context
+    (field, side, aspect bucket) and orders attempts so that variant runs first.
+
+    Variants are identified by stable names. order() sorts by recorded wins, ties
+    keeping the caller's default order, so an empty history reproduces the fixed
+    order exactly. Counts are halved once a context passes max_reads so the order
+    keeps following the game's current look. Stats persist as JSON at path.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = Path("cache/ocr_variant_stats.json"),
+        *,
+        max_reads: int = 512,
+        autosave_every: int = 64,
+    ):
+        self.path = Path(path) if path else None
+        self.max_reads = max(2, int(max_reads))
+        self.autosave_every = max(1, int(autosave_every))
+        self._contexts: Optional[Dict[str, Dict[str, object]]] = None
+        self._dirty = 0
+        self._lock = threading.Lock()
+
+    def configure(self, *, path: Optional[str] = None) -> None:
+        if path is not None and Path(path) != self.path:
+            with self._lock:
+                self.path = Path(path)
+                self._contexts = None
+                self._dirty = 0
+
+    def _load_locked(self) -> Dict[str, Dict[str, object]]:
+        if self._contexts is not None:
+            return self._contexts
+        self._contexts = {}
+        if self.path is not None and self.path.is_file():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            if isinstance(data, dict) and data.get("version") == _STATS_VERSION:
+                contexts = data.get("contexts")
+                if isinstance(contexts, dict):
+                    self._contexts = contexts
+        return self._contexts
+
+    def _entry_locked(self, context: Context) -> Dict[str, object]:
+        contexts = self._load_locked()
+        return contexts.setdefault(_context_key(context), {"wins": {}, "reads": 0, "passes": 0})
+
+    def order(self, contexts: Sequence[Context], variants: Sequence[str]) -> List[int]:
+        """Indices into variants, most frequent first winner first; wins are summed over contexts."""
+        wins: Dict[str, float] = {}
+        with self._lock:
+            loaded = self._load_locked()
+            for context in contexts:
+                entry = loaded.get(_context_key(context))
+                if not entry:
+                    continue
+                for name, count in entry["wins"].items():
+                    wins[name] = wins.get(name, 0.0) + float(count)
+        return sorted(range(len(variants)), key=lambda i: (-wins.get(variants[i], 0.0), i))
+
+    def record(self, context: Context, winner: Optional[str], passes: int) -> None:
+        """One read finished after passes attempts; winner is the accepted variant (None if none was)."""
+        with self._lock:
+            entry = self._entry_locked(context)
+            entry["reads"] = int(entry["reads"]) + 1
+            entry["passes"] = int(entry["passes"]) + max(0, int(passes))
+            if winner is not None:
+                wins = entry["wins"]
+                wins[winner] = float(wins.get(winner, 0.0)) + 1.0
+            if int(entry["reads"]) >= self.max_reads:
+                entry["wins"] = {name: count / 2.0 for name, count in entry["wins"].items()}
+                entry["reads"] = int(entry["reads"]) // 2
+                entry["passes"] = int(entry["passes"]) // 2
+            self._dirty += 1
+            if self._dirty >= self.autosave_every:
+                self._save_locked()
+
+    def _save_locked(self) -> None:
+        self._dirty = 0
+        if self.path is None or self._contexts is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(
+                json.dumps({"version": _STATS_VERSION, "contexts": self._contexts}, indent=1, sort_keys=True),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            print(f"[ocr] variant stats save failed: {exc}")
+
+    def save(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._save_locked()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per context: reads, average attempts per read and the current top variant."""
+        out: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for key, entry in sorted(self._load_locked().items()):
+                reads = int(entry["reads"])
+                wins = entry["wins"]
+                out[key] = {
+                    "reads": reads,
+                    "avg_passes": (int(entry["passes"]) / reads) if reads else 0.0,
+                    "top": max(wins, key=wins.get) if wins else None,
+                }
+        return out
@@ -0,0 +1,115 @@
+# utils/word_trie.py
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class WordTrie:
+    """
+    Character trie over a word list's keys (no-space normalized forms), plus a
+    sorted suffix list for substring lookups.
+
+    forms are the spaced forms callers break ties on; entries with an empty form
+    are left out. Every node stores two precomputed winners among the entries
+    below it, so no lookup scans candidates:
+      - completion: shortest key, then shortest form, then earliest list index;
+      - form: shortest form, then earliest list index.
+    Queries return list indices, so results match a scan in list order.
+    """
+
+    def __init__(self, keys: Sequence[str], forms: Sequence[str]):
+        self._children: List[Dict[str, int]] = [{}]
+        self._completion: List[int] = [-1]
+        self._form: List[int] = [-1]
+        completion_rank: List[Tuple[int, int]] = [(0, 0)]
+        form_rank: List[int] = [0]
+        first_of_key: Dict[str, int] = {}
+        for i, (key, form) in enumerate(zip(keys, forms)):
+            if not form:
+                continue
+            first_of_key.setdefault(key, i)
+            rank = (len(key), len(form))
+            node = 0
+            for depth in range(len(key) + 1):
+                # List order is ascending, so only a strictly better rank replaces a winner.
+                if self._completion[node] < 0 or rank < completion_rank[node]:
+                    self._completion[node] = i
+                    completion_rank[node] = rank
+                if self._form[node] < 0 or len(form) < form_rank[node]:
+                    self._form[node] = i
+                    form_rank[node] = len(form)
+                if depth == len(key):
+                    break
+                ch = key[depth]
+                child = self._children[node].get(ch)
+                if child is None:
+                    child = len(self._children)
+                    self._children[node][ch] = child
+                    self._children.append({})
+                    self._completion.append(-1)
+                    self._form.append(-1)
+                    completion_rank.append((0, 0))
+                    form_rank.append(0)
+                node = child
+        pairs = sorted(
+            (key[start:], i) for key, i in first_of_key.items() for start in range(len(key))
+        )
+        self._suffixes = [suffix for suffix, _ in pairs]
+        self._suffix_index = [i for _, i in pairs]
+        self._first = min(first_of_key.values()) if first_of_key else -1
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def _walk(self, prefix: str) -> Optional[int]:
+        node = 0
+        for ch in prefix:
+            node = self._children[node].get(ch)
+            if node is None:
+                return None
+        return node
+
+    def complete(self, prefix: str) -> Optional[int]:
+        """Index of the shortest entry whose key starts with prefix (ties as above)."""
+        node = self._walk(prefix)
+        if node is None or self._completion[node] < 0:
+            return None
+        return self._completion[node]
+
+    def prefix_matches(self, query: str, max_dist: int) -> List[Tuple[int, int]]:
+        """
+        (distance, index) for every key prefix of len(query) characters within
+        max_dist edits of query; index is the shortest-form entry below it.
+        Walks the trie with one edit-distance row per node, dropping a branch
+        once its whole row exceeds max_dist.
+        """
+        out: List[Tuple[int, int]] = []
+        length = len(query)
+        stack: List[Tuple[int, List[int]]] = [(0, list(range(length + 1)))]
+        while stack:
+            node, row = stack.pop()
+            depth = row[0]
+            if depth == length:
+                if row[length] <= max_dist and self._form[node] >= 0:
+                    out.append((row[length], self._form[node]))
+                continue
+            for ch, child in self._children[node].items():
+                cur = [depth + 1]
+                for j in range(1, length + 1):
+                    cur.append(min(cur[j - 1] + 1, row[j] + 1, row[j - 1] + (query[j - 1] != ch)))
+                if min(cur) <= max_dist:
+                    stack.append((child, cur))
+        return out
+
+    def first_containing(self, text: str) -> Optional[int]:
+        """Earliest index whose key contains text."""
+        if not text:
+            return self._first if self._first >= 0 else None
+        best = -1
+        pos = bisect_left(self._suffixes, text)
+        while pos < len(self._suffixes) and self._suffixes[pos].startswith(text):
+            i = self._suffix_index[pos]
+            if best < 0 or i < best:
+                best = i
+            pos += 1
+        return best if best >= 0 else None
@@ -1,15 +1,49 @@
 import time
 import threading
 from copy import deepcopy
+from pathlib import Path
 from typing import Optional
 import cv2
-from utils.capture_wiz import Wizard101Capture
+from utils.capture_backend import open_capture
 from utils.capture_thread import FrameSource
+from utils.frames import FrameChangeTracker
+from utils.latency import LatencyTracker
+from utils.profiler import PROFILER
+from utils.region_cache import RegionCache
+from utils.session_archive import SessionRecorder
+from utils.template_bank import preload_templates
 from state.game_state import GameState
 from state.game_state_analysis import analyze_game_state
 from config.initiative_config import INITIATIVE_CFG
 from config.wizmatic_config import (
     DT,
+    TEMPLATE_PRELOAD,
+    TEMPLATE_PRELOAD_WORKERS,
+    TEMPLATE_BUNDLE_DIR,
+    CAPTURE_SOURCE,
+    REPLAY_PATH,
+    REPLAY_REALTIME,
+    REPLAY_LOOP,
+    RECORD_SESSION,
+    RECORD_DIR,
+    RECORD_EVERY_N,
+    RECORD_COMPRESSED,
+    RECORD_CHUNK_FRAMES,
+    RECORD_QUEUE_SIZE,
+    ANALYSIS_SKIP_UNCHANGED,
+    FRAME_CHANGE_GRID,
+    FRAME_CHANGE_THRESHOLD,
+    FRAME_CHANGE_PEAK_THRESHOLD,
+    ANALYSIS_REGION_CACHE,
+    ANALYSIS_UNCHANGED_REFRESH_S,
+    LATENCY_TRACE,
+    LATENCY_WINDOW,
+    LATENCY_PRINT_INTERVAL_S,
+    PROFILE_STAGES,
+    PROFILE_SAMPLE_EVERY,
+    PROFILE_WINDOW,
+    PROFILE_PRINT_INTERVAL_S,
+    PROFILE_DUMP_PATH,
     SHOW_CAPTURE,
     SHOW_INITIATIVE_OVERLAY,
     SHOW_PARTICIPANTS_OVERLAY,
@@ -45,6 +79,7 @@ from config.wizmatic_config import (
     MASTER_OVERLAY_SHOW_BUTTON_LIST,
 )
 from config.participants_config import PARTICIPANTS_CFG
+from ocr_easy.batching import BATCH_STATS as EASYOCR_BATCH_STATS
 from state.initiative import render_initiative_boxes, render_initiative_overlay
 from state.card_count import render_player_hand_overlay, pop_card_count_logs
 from state.participants import (
@@ -53,20 +88,58 @@ from state.participants import (
     pop_health_ocr_logs,
     pop_name_ocr_logs,
     pop_slot_activity_logs,
+    ocr_result_cache_stats,
+    ocr_job_stats,
+    ocr_variant_stats,
+    save_glyph_models,
+    save_ocr_variant_stats,
+    save_wordlist_corrections,
+    shutdown_ocr_jobs,
+    wordlist_correction_stats,
 )
 _PVP_MODE = str(COMBAT_MODE).strip().lower() == "pvp"
 _RETREAT_STATE_KEY = "concede" if _PVP_MODE else "flee"
 _RETREAT_BUTTON_LABEL = "concede" if _PVP_MODE else "flee"
 
 def main():
+    if TEMPLATE_PRELOAD:
+        preload_templates(
+            parallel=TEMPLATE_PRELOAD_WORKERS > 1,
+            workers=TEMPLATE_PRELOAD_WORKERS,
+            bundle_dir=TEMPLATE_BUNDLE_DIR,
+        )
     if OCR_BACKEND == "easyocr":
         try:
             from ocr_easy.adapter import warmup
             warmup(PARTICIPANTS_CFG.ocr)
         except Exception as exc:
             print(f"[ocr] easyocr warmup failed: {exc}")
-    cap = Wizard101Capture(fps=60)
-    frames = FrameSource(cap, hz=60)
+    cap = open_capture(
+        CAPTURE_SOURCE,
+        fps=60,
+        replay_path=REPLAY_PATH,
+        replay_realtime=REPLAY_REALTIME,
+        replay_loop=REPLAY_LOOP,
+    )
+    recorder = None
+    if RECORD_SESSION:
+        recorder = SessionRecorder(
+            Path(RECORD_DIR) / time.strftime("%Y%m%d_%H%M%S"),
+            every_n=RECORD_EVERY_N,
+            chunk_frames=RECORD_CHUNK_FRAMES,
+            compressed=RECORD_COMPRESSED,
+            queue_size=RECORD_QUEUE_SIZE,
+        )
+        recorder.start()
+        print(f"[record] writing session to {recorder.out_dir}")
+    # Non-realtime replay runs unpaced and analyses every recorded frame in order.
+    replay_lockstep = str(CAPTURE_SOURCE).strip().lower() == "replay" and not REPLAY_REALTIME
+    frames = FrameSource(
+        cap,
+        hz=None if replay_lockstep else 60,
+        on_frame=recorder.submit if recorder is not None else None,
+        lockstep=replay_lockstep,
+    )
     frames.start()
 
     state_last = None
@@ -74,14 +147,21 @@ def main():
     analysis_seq = 0
     last_logged_seq = -1
     latest_capture_frame = None
-    last_bundle_obj_id = None
+    last_frame_seq = 0
+    change_tracker = None
+    if ANALYSIS_SKIP_UNCHANGED or ANALYSIS_REGION_CACHE:
+        change_tracker = FrameChangeTracker(FRAME_CHANGE_GRID, FRAME_CHANGE_THRESHOLD, FRAME_CHANGE_PEAK_THRESHOLD)
+    last_submitted_at = 0.0
+    latency = LatencyTracker(LATENCY_WINDOW) if LATENCY_TRACE else None
+    next_latency_print_at = time.perf_counter() + LATENCY_PRINT_INTERVAL_S
+    PROFILER.configure(enabled=PROFILE_STAGES, sample_every=PROFILE_SAMPLE_EVERY, window=PROFILE_WINDOW)
+    next_profile_print_at = time.perf_counter() + PROFILE_PRINT_INTERVAL_S
     pending_task = None
     latest_packet = None
     latest_button_states = None
     latest_button_overlay = None
-    task_lock = threading.Lock()
+    task_cond = threading.Condition()
     result_lock = threading.Lock()
-    task_event = threading.Event()
     stop_event = threading.Event()
     gui_ok = True
     gui_warned = False
@@ -101,14 +181,23 @@ def main():
         except cv2.error as exc:
             _disable_gui(exc)
 
-    def _safe_wait_key() -> bool:
+    def _safe_wait_key() -> int:
         if not gui_ok:
-            return False
+            return -1
         try:
-            return (cv2.waitKey(1) & 0xFF) == ord("q")
+            return cv2.waitKey(1) & 0xFF
         except cv2.error as exc:
             _disable_gui(exc)
-            return False
+            return -1
+
+    def _dump_profile() -> None:
+        for line in PROFILER.format_summary():
+            print(line)
+        try:
+            path = PROFILER.dump_json(PROFILE_DUMP_PATH)
+            print(f"[profile] wrote {path}")
+        except Exception as exc:
+            print(f"[profile] dump failed: {exc}")
 
     def _format_state_label(state: str) -> str:
         labels = {
@@ -220,22 +309,21 @@ def main():
         worker_game_state = GameState()
         worker_state_last = worker_game_state.state
         worker_debug_ocr_session_id = 0
+        region_cache = RegionCache() if ANALYSIS_REGION_CACHE else None
 
         while not stop_event.is_set():
-            task_event.wait(timeout=0.05)
-            if stop_event.is_set():
-                break
-
-            task = None
-            with task_lock:
-                if pending_task is not None:
-                    task = pending_task
-                    pending_task = None
-                task_event.clear()
-            if task is None:
-                continue
-
-            seq, analysis = task
+            with task_cond:
+                task_cond.wait_for(lambda: pending_task is not None or stop_event.is_set())
+                if stop_event.is_set():
+                    break
+                task = pending_task
+                pending_task = None
+                task_cond.notify_all()
+
+            seq, bundle, analysis, planes, tiles, submitted_at = task
+            started_at = time.perf_counter()
+            if region_cache is not None:
+                region_cache.begin_frame(tiles)
             render_initiative = (not SHOW_MASTER_DEBUG_OVERLAY) and SHOW_INITIATIVE_OVERLAY
             render_participants = (not SHOW_MASTER_DEBUG_OVERLAY) and SHOW_PARTICIPANTS_OVERLAY
             render_player_wizard = SHOW_PLAYER_WIZARD_OVERLAY
@@ -267,10 +355,18 @@ def main():
                     debug_print_health_ocr=DEBUG_PRINT_HEALTH_OCR,
                     debug_dump_ocr_id=str(worker_debug_ocr_session_id),
                     debug_dump_ocr_limit=DEBUG_DUMP_OCR_MAX,
+                    planes=planes,
+                    region_cache=region_cache,
+                    timestamp=bundle.timestamp,
                 )
             except Exception as exc:
                 print(f"[analysis] failed: {exc}")
                 continue
+            result.frame_seq = bundle.seq
+            result.captured_at = bundle.captured_at
+            result.submitted_at = submitted_at
+            result.analysis_started_at = started_at
+            result.analysis_done_at = time.perf_counter()
 
             state_current = result.game_state.state
             if worker_state_last != state_current and state_current == "card_select":
@@ -287,23 +383,55 @@ def main():
     analysis_thread.start()
 
     try:
+        next_ui_at = time.perf_counter()
         while True:
-            t0 = time.perf_counter()
-
-            bundle = frames.get_latest()
-            if bundle is not None and id(bundle) != last_bundle_obj_id:
-                last_bundle_obj_id = id(bundle)
+            # Wake as soon as a frame lands; otherwise at the next UI tick.
+            frame_seq, bundle = frames.wait_for_next(
+                last_frame_seq,
+                timeout=max(0.0, next_ui_at - time.perf_counter()),
+            )
+            if bundle is not None:
+                last_frame_seq = frame_seq
                 latest_capture_frame = bundle.normalized(1280, 720, allow_upscale=True)
-                with task_lock:
-                    analysis_seq += 1
-                    pending_task = (analysis_seq, latest_capture_frame)
-                task_event.set()
+                latest_planes = bundle.planes(1280, 720, allow_upscale=True)
+                frame_changed = True
+                latest_tiles = None
+                if change_tracker is not None:
+                    dirty_tiles = change_tracker.update(latest_planes)
+                    latest_tiles = change_tracker.snapshot()
+                    if ANALYSIS_SKIP_UNCHANGED and not replay_lockstep:
+                        # Static frame: keep publishing the previous AnalysisResult instead of re-analysing.
+                        frame_changed = bool(dirty_tiles.any()) or (
+                            (time.perf_counter() - last_submitted_at) >= ANALYSIS_UNCHANGED_REFRESH_S
+                        )
+                if frame_changed:
+                    last_submitted_at = time.perf_counter()
+                    with task_cond:
+                        if replay_lockstep:
+                            # Wait for the worker to take the previous frame instead of replacing it.
+                            task_cond.wait_for(lambda: pending_task is None or stop_event.is_set())
+                        analysis_seq += 1
+                        pending_task = (
+                            analysis_seq,
+                            bundle,
+                            latest_capture_frame,
+                            latest_planes,
+                            latest_tiles,
+                            last_submitted_at,
+                        )
+                        task_cond.notify()
+
+            now = time.perf_counter()
+            if now < next_ui_at:
+                continue
+            next_ui_at = now + DT
 
             packet = None
             with result_lock:
                 packet = latest_packet
 
             packet_analysis = None
+            displayed_result = None
             state_current = game_state.state
             in_card_select = game_state.battle.in_card_select
             if packet is not None:
@@ -319,6 +447,7 @@ def main():
 
                 if result_seq != last_logged_seq:
                     last_logged_seq = result_seq
+                    displayed_result = result
                     if state_last != state_current:
                         state_last = state_current
                         if state_current == "card_select":
@@ -430,20 +559,77 @@ def main():
             if SHOW_CAPTURE and (not SHOW_MASTER_DEBUG_OVERLAY) and latest_capture_frame is not None:
                 _safe_imshow("W101 Capture", latest_capture_frame)
 
-            if _safe_wait_key():
-                break
+            if latency is not None:
+                if displayed_result is not None:
+                    latency.record_frame(
+                        captured_at=displayed_result.captured_at,
+                        submitted_at=displayed_result.submitted_at,
+                        started_at=displayed_result.analysis_started_at,
+                        done_at=displayed_result.analysis_done_at,
+                        displayed_at=time.perf_counter(),
+                    )
+                if LATENCY_PRINT_INTERVAL_S > 0 and now >= next_latency_print_at:
+                    next_latency_print_at = now + LATENCY_PRINT_INTERVAL_S
+                    for line in latency.format_summary():
+                        print(line)
+
+            if PROFILE_STAGES and PROFILE_PRINT_INTERVAL_S > 0 and now >= next_profile_print_at:
+                next_profile_print_at = now + PROFILE_PRINT_INTERVAL_S
+                for line in PROFILER.format_summary():
+                    print(line)
+                cache = ocr_result_cache_stats()
+                print(
+                    "[ocr] result cache "
+                    + " ".join(f"{kind}={s['hit_rate'] * 100.0:.0f}%" for kind, s in cache.items())
+                    + f" entries={cache['all']['entries']}"
+                )
+                if PARTICIPANTS_CFG.ocr.wordlist_cache:
+                    wl = wordlist_correction_stats()
+                    print(
+                        f"[ocr] wordlist corrections hit_rate={wl['hit_rate'] * 100.0:.0f}% "
+                        f"entries={wl['entries']} evictions={wl['evictions']}"
+                    )
+                if PARTICIPANTS_CFG.ocr.adaptive_variants:
+                    for context, v in ocr_variant_stats().items():
+                        print(f"[ocr] variants {context}: reads={v['reads']} avg_passes={v['avg_passes']:.2f} top={v['top']}")
+                if PARTICIPANTS_CFG.ocr.backend == "easyocr":
+                    b = EASYOCR_BATCH_STATS.stats()
+                    print(
+                        f"[ocr] easyocr batches calls={b['calls']} images={b['images']} "
+                        f"occupancy={b['batch_occupancy']:.1f} pixel_fill={b['pixel_fill'] * 100.0:.0f}%"
+                    )
+                if PARTICIPANTS_CFG.ocr.async_jobs:
+                    jobs = ocr_job_stats()
+                    print(
+                        f"[ocr] async jobs pending={jobs['pending']} ready={jobs['ready']} "
+                        f"completed={jobs['completed']}/{jobs['submitted']} failed={jobs['failed']}"
+                    )
 
-            elapsed = time.perf_counter() - t0
-            sleep_for = DT - elapsed
-            if sleep_for > 0:
-                time.sleep(sleep_for)
+            key = _safe_wait_key()
+            if key == ord("q"):
+                break
+            if key == ord("p") and PROFILE_STAGES:
+                _dump_profile()
 
     finally:
         stop_event.set()
-        task_event.set()
+        with task_cond:
+            task_cond.notify_all()
         analysis_thread.join(timeout=1.0)
+        if PROFILE_STAGES:
+            _dump_profile()
+        shutdown_ocr_jobs()
+        save_glyph_models()
+        save_ocr_variant_stats()
+        save_wordlist_corrections()
         frames.stop()
         cap.close()
+        if recorder is not None:
+            recorder.close()
+            print(
+                f"[record] wrote {recorder.frames_written} frames in {recorder.chunks_written} chunks "
+                f"({recorder.frames_dropped} dropped) to {recorder.out_dir}"
+            )
 
         # Break references so destructors run now, not at interpreter teardown
         frames = None